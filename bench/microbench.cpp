@@ -0,0 +1,323 @@
+/**
+ * @file microbench.cpp
+ * @author Alex Buckley
+ * @ingroup Utilities
+ * @brief Micro-benchmarks for Problem kernels and SolutionBuilder primitives.
+ * * Measures the throughput of the building blocks used by every optimizer in
+ * isolation, so performance regressions can be caught before they reach
+ * benchmark sweeps. Built with `make microbench`.
+ * * @section microbench_usage Usage
+ * @code
+ * ./microbench [--dims 10,30,100,1000] [--min-time SECONDS] [--filter TEXT]
+ *              [--output FILE] [--baseline FILE] [--tolerance FRACTION]
+ * @endcode
+ * * Results are written as JSON (to stdout unless `--output` is given). With
+ * `--baseline`, every measurement is compared against the matching entry of
+ * a previous JSON report; measurements slower than the baseline by more than
+ * `--tolerance` (default 0.10) are reported and the program exits with 1.
+ */
+
+
+#include <chrono>
+#include <cstring>
+#include <fstream>
+#include <functional>
+#include <iomanip>
+#include <iostream>
+#include <map>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include <External/json.hpp>
+
+#include "Population.h"
+#include "ProblemFactory.h"
+#include "RandomGenerator.h"
+#include "SolutionBuilder.h"
+
+
+using json = nlohmann::json;
+
+namespace {
+
+constexpr int NUM_PROBLEMS = 10;    ///< Problem IDs 1..10 (see ProblemFactory)
+constexpr int BATCH_SIZE = 256;     ///< Candidates per evaluateBatch call
+constexpr int NUM_NEIGHBORS = 64;   ///< Neighbors per getNeighbors call
+constexpr int POPULATION_SIZE = 100; ///< Population size for getSubset
+constexpr int SUBSET_SIZE = 3;      ///< Indices per getSubset call (rand/1 mutation)
+constexpr int RNG_BLOCK = 1024;     ///< Words per RandomGenerator::fill call
+constexpr int SEED = 108664;
+
+/// Sink preventing the compiler from discarding benchmarked work
+volatile double sink = 0.0;
+
+
+/**
+ * @struct Options
+ * @brief Command-line settings.
+ */
+struct Options {
+    std::vector<int> dims = {10, 30, 100, 1000};
+    double minTime = 0.2;
+    std::string filter;
+    std::string output;
+    std::string baseline;
+    double tolerance = 0.10;
+};
+
+
+/**
+ * @struct Measurement
+ * @brief Throughput of a single micro-benchmark.
+ */
+struct Measurement {
+    std::string name;       ///< Unique name: <subject>/<operation>/dim<N>
+    std::string unit;       ///< Unit of rate
+    double rate;            ///< Items processed per second
+    long long items;        ///< Items processed during the measurement
+    double seconds;         ///< Measured time
+};
+
+
+/**
+ * @brief Repeats @p body until at least @p minTime seconds have elapsed.
+ * @param body Runs one repetition and returns the number of items it processed.
+ * @return Items processed and elapsed seconds.
+ */
+std::pair<long long, double> measure(const std::function<long long()>& body, double minTime) {
+    using clock = std::chrono::steady_clock;
+
+    body(); // Warm up caches and lazily initialized state
+
+    long long items = 0;
+    long long reps = 1;
+    double seconds = 0.0;
+
+    // Double the repetitions per timing window to amortize clock overhead
+    while(seconds < minTime) {
+        auto start = clock::now();
+
+        for(long long r = 0; r < reps; r++)
+            items += body();
+
+        seconds += std::chrono::duration<double>(clock::now() - start).count();
+        reps *= 2;
+    }
+
+    return {items, seconds};
+}
+
+
+std::vector<int> parseList(const std::string& text) {
+    std::vector<int> values;
+    std::size_t start = 0;
+
+    while(start <= text.size()) {
+        std::size_t end = text.find(',', start);
+        if(end == std::string::npos)
+            end = text.size();
+
+        values.push_back(std::stoi(text.substr(start, end - start)));
+        start = end + 1;
+    }
+
+    return values;
+}
+
+
+/**
+ * @brief Runs every micro-benchmark whose name contains the filter.
+ */
+std::vector<Measurement> runAll(const Options& options) {
+    std::vector<Measurement> results;
+
+    auto run = [&](const std::string& name, const std::string& unit, const std::function<long long()>& body) {
+        if(!options.filter.empty() && name.find(options.filter) == std::string::npos)
+            return;
+
+        auto [items, seconds] = measure(body, options.minTime);
+        results.push_back({name, unit, items / seconds, items, seconds});
+        std::cerr << std::left << std::setw(44) << name << std::right << std::setw(14)
+                  << std::setprecision(4) << items / seconds << " " << unit << "\n";
+    };
+
+    // Problem kernels over random candidates within each problem's bounds
+    for(int id = 1; id <= NUM_PROBLEMS; id++) {
+        std::unique_ptr<Problem> problem = ProblemFactory::create(id);
+
+        for(int dims : options.dims) {
+            SolutionBuilder builder(dims, problem->getLowerBound(), problem->getUpperBound(), SEED);
+            Population candidates(BATCH_SIZE, dims);
+            builder.getRand(candidates);
+            std::vector<double> fitness(BATCH_SIZE);
+
+            run(problem->getName() + "/evaluateBatch/dim" + std::to_string(dims), "evals/s", [&]() {
+                problem->evaluateBatch(candidates.data(), BATCH_SIZE, dims, fitness.data());
+                sink = sink + fitness[0];
+                return (long long)BATCH_SIZE;
+            });
+        }
+    }
+
+    // SolutionBuilder primitives
+    for(int dims : options.dims) {
+        SolutionBuilder builder(dims, -100, 100, SEED);
+        std::vector<double> solution(dims);
+        Population neighbors(NUM_NEIGHBORS, dims);
+        builder.getRand(solution.data());
+
+        run("SolutionBuilder/getRand/dim" + std::to_string(dims), "samples/s", [&]() {
+            builder.getRand(solution.data());
+            sink = sink + solution[0];
+            return 1LL;
+        });
+
+        run("SolutionBuilder/getNeighbors/dim" + std::to_string(dims), "samples/s", [&]() {
+            builder.getNeighbors(solution.data(), NUM_NEIGHBORS, 0.1, neighbors);
+            sink = sink + neighbors.data()[0];
+            return (long long)NUM_NEIGHBORS;
+        });
+    }
+
+    // Random number generators, filling blocks of words
+    for(const char* name : {"mt19937", "xoshiro256++", "pcg32"}) {
+        std::unique_ptr<RandomGenerator> generator = RandomGenerator::create(name, SEED);
+        std::vector<std::uint32_t> words(RNG_BLOCK);
+
+        run(std::string("RandomGenerator/") + name + "/fill", "words/s", [&]() {
+            generator->fill(words.data(), RNG_BLOCK);
+            sink = sink + words[0];
+            return (long long)RNG_BLOCK;
+        });
+    }
+
+    {
+        SolutionBuilder builder(1, -100, 100, SEED);
+        int subset[SUBSET_SIZE];
+        int source = 0;
+
+        run("SolutionBuilder/getSubset/pop" + std::to_string(POPULATION_SIZE), "subsets/s", [&]() {
+            builder.getSubset(POPULATION_SIZE, SUBSET_SIZE, source, subset);
+            source = (source + 1) % POPULATION_SIZE;
+            sink = sink + subset[0];
+            return 1LL;
+        });
+    }
+
+    return results;
+}
+
+
+/**
+ * @brief Compares measurements against a previous report.
+ * @return Number of regressions beyond the tolerance.
+ */
+int compareBaseline(json& report, const std::string& baselinePath, double tolerance) {
+    std::ifstream file(baselinePath);
+
+    if(!file) {
+        std::cerr << "Cannot open baseline file: " << baselinePath << "\n";
+        return -1;
+    }
+
+    json baseline;
+    file >> baseline;
+
+    std::map<std::string, double> baselineRates;
+    for(const auto& entry : baseline["benchmarks"])
+        baselineRates[entry["name"]] = entry["rate"];
+
+    int regressions = 0;
+    std::cerr << "\nComparison with " << baselinePath << " (tolerance " << tolerance * 100 << "%):\n";
+
+    for(auto& entry : report["benchmarks"]) {
+        auto it = baselineRates.find(entry["name"]);
+        if(it == baselineRates.end())
+            continue;
+
+        double change = entry["rate"].get<double>() / it->second - 1.0;
+        bool regression = change < -tolerance;
+
+        entry["baseline_rate"] = it->second;
+        entry["change"] = change;
+        entry["regression"] = regression;
+
+        if(regression)
+            regressions++;
+
+        std::cerr << std::left << std::setw(44) << entry["name"].get<std::string>() << std::right
+                  << std::setw(8) << std::fixed << std::setprecision(1) << change * 100 << "%"
+                  << (regression ? "  REGRESSION" : "") << "\n" << std::defaultfloat;
+    }
+
+    report["regressions"] = regressions;
+    return regressions;
+}
+
+} // anonymous namespace
+
+
+int main(int argc, char* argv[]) {
+    Options options;
+
+    // Parse flags
+    for(int i = 1; i < argc; i++) {
+        if(strcmp(argv[i], "--dims") == 0 && i + 1 < argc) {
+            options.dims = parseList(argv[++i]);
+        } else if(strcmp(argv[i], "--min-time") == 0 && i + 1 < argc) {
+            options.minTime = std::stod(argv[++i]);
+        } else if(strcmp(argv[i], "--filter") == 0 && i + 1 < argc) {
+            options.filter = argv[++i];
+        } else if(strcmp(argv[i], "--output") == 0 && i + 1 < argc) {
+            options.output = argv[++i];
+        } else if(strcmp(argv[i], "--baseline") == 0 && i + 1 < argc) {
+            options.baseline = argv[++i];
+        } else if(strcmp(argv[i], "--tolerance") == 0 && i + 1 < argc) {
+            options.tolerance = std::stod(argv[++i]);
+        } else {
+            std::cerr << "Error, unrecognized argument: " << argv[i] << "\n";
+            return 1;
+        }
+    }
+
+    std::vector<Measurement> results = runAll(options);
+
+    // Build machine-readable report
+    json report;
+    report["context"] = {
+        {"compiler", __VERSION__},
+        {"min_time", options.minTime},
+        {"batch_size", BATCH_SIZE},
+        {"num_neighbors", NUM_NEIGHBORS},
+    };
+    report["benchmarks"] = json::array();
+
+    for(const Measurement& m : results) {
+        report["benchmarks"].push_back({
+            {"name", m.name},
+            {"unit", m.unit},
+            {"rate", m.rate},
+            {"items", m.items},
+            {"seconds", m.seconds},
+        });
+    }
+
+    int regressions = 0;
+    if(!options.baseline.empty()) {
+        regressions = compareBaseline(report, options.baseline, options.tolerance);
+
+        if(regressions < 0) // Baseline could not be read
+            return 1;
+    }
+
+    // Write report
+    if(options.output.empty()) {
+        std::cout << report.dump(2) << "\n";
+    } else {
+        std::ofstream file(options.output);
+        file << report.dump(2) << "\n";
+    }
+
+    return regressions > 0 ? 1 : 0;
+}
@@ -25,10 +25,29 @@ std::string experimentName; ///< Identifier for the specific experiment run
     double lower;               ///< Global lower bound override
     double upper;               ///< Global upper bound override
     int seed;                   ///< Random number generator seed for reproducibility
+    std::string generator;      ///< Random number generator family, e.g. "mt19937"
     std::string optimizer;      ///< Name/Type of the optimizer algorithm to use
     int maxIterations;          ///< Termination criteria: maximum evaluation cycles
     double neighborDelta;       ///< Step size for neighborhood exploration (Local Search only)
     int numNeighbors;           ///< Number of neighbors to sample per iteration (Local Search only)
+    int threads;                ///< Threads running restarts, 0 = sequential (Repeated Local Search only)
+    int populationSize;         ///< Number of individuals (Differential Evolution only)
+    double scale;               ///< Differential weight F (Differential Evolution only)
+    double crossoverRate;       ///< Crossover rate CR (Differential Evolution only)
+    std::string mutation;       ///< Mutation strategy, e.g. "rand/1" (Differential Evolution only)
+    std::string crossover;      ///< Crossover strategy, "bin" or "exp" (Differential Evolution only)
+    int islands;                ///< Sub-populations on separate threads, 1 = single population (Differential Evolution only)
+    int migrationInterval;      ///< Generations between migrations (Differential Evolution only)
+    int migrants;               ///< Individuals each island sends per neighbor (Differential Evolution only)
+    std::string topology;       ///< Migration topology, "ring" or "complete" (Differential Evolution only)
+    long long maxEvaluations;   ///< Stopping criterion: evaluation budget (0 = unlimited)
+    double targetFitness;       ///< Stopping criterion: fitness at which to stop (-inf = disabled)
+    int stagnationWindow;       ///< Stopping criterion: iterations without sufficient improvement (0 = disabled)
+    double stagnationTolerance; ///< Stopping criterion: minimum improvement over the stagnation window
+    double timeLimit;           ///< Stopping criterion: wall-clock limit in seconds (0 = unlimited)
+    std::string trace;          ///< Trace policy: "full", "none", "best", "every", "log" or "stream"
+    int traceInterval;          ///< Iterations between checkpoints ("every") or checkpoints per doubling ("log")
+    std::string traceFile;      ///< File receiving a streamed trace (set by the runner, not read from JSON)
 } ExperimentConfig;
 
 
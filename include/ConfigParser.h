@@ -0,0 +1,28 @@
+/**
+ * @file ConfigParser.h
+ * @author Alex Buckley
+ * @ingroup Core
+ * @brief Conversion of JSON experiment definitions into ExperimentConfig.
+ */
+
+
+#ifndef CONFIG_PARSER_H
+#define CONFIG_PARSER_H
+
+#include <External/json.hpp>
+
+#include "Config.h"
+
+
+/**
+ * @brief Builds an ExperimentConfig from one entry of a benchmark.json "experiments" array.
+ *
+ * Missing fields fall back to the same defaults the benchmark program has
+ * always used.
+ *
+ * @param item JSON object describing a single experiment.
+ * @return The parsed configuration.
+ */
+ExperimentConfig parseExperimentConfig(const nlohmann::json& item);
+
+#endif
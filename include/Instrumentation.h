@@ -0,0 +1,131 @@
+/**
+ * @file Instrumentation.h
+ * @author Alex Buckley
+ * @ingroup Utilities
+ * @brief Compile-time optional per-experiment performance counters.
+ */
+
+
+#ifndef INSTRUMENTATION_H
+#define INSTRUMENTATION_H
+
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+
+
+/**
+ * @namespace instrumentation
+ * @brief Counters and phase timers enabled by building with `make INSTRUMENT=1`.
+ *
+ * Counters are kept per thread, and each experiment runs on a single thread,
+ * so the counters of the calling thread describe the experiment it is
+ * running. Experiments using helper threads merge() their counters back.
+ *
+ * When the program is built without instrumentation, `enabled` is false and
+ * every hook compiles to nothing.
+ */
+namespace instrumentation {
+
+constexpr bool enabled =
+#ifdef INSTRUMENT
+    true;
+#else
+    false;
+#endif
+
+
+/**
+ * @struct Metrics
+ * @brief Counters collected for a single experiment.
+ */
+struct Metrics {
+    std::uint64_t evaluations = 0;      ///< Objective function evaluations
+    double evaluationSeconds = 0.0;     ///< Time spent in Problem::evaluate / evaluateBatch
+    double generationSeconds = 0.0;     ///< Time spent generating candidate solutions
+    std::uint64_t allocations = 0;      ///< Heap allocations (operator new calls)
+    std::uint64_t allocatedBytes = 0;   ///< Bytes requested from the heap
+};
+
+
+/// @return Counters of the experiment running on the calling thread.
+Metrics& current();
+
+/// @brief Clears the calling thread's counters before a new experiment.
+inline void reset() {
+    if constexpr (enabled)
+        current() = Metrics{};
+}
+
+/**
+ * @brief Adds counters collected on another thread to the calling thread's.
+ *
+ * Used when an experiment spreads its work over helper threads; times are
+ * summed over threads.
+ *
+ * @param other Counters of a helper thread.
+ */
+inline void merge(const Metrics& other) {
+    if constexpr (enabled) {
+        Metrics& metrics = current();
+        metrics.evaluations += other.evaluations;
+        metrics.evaluationSeconds += other.evaluationSeconds;
+        metrics.generationSeconds += other.generationSeconds;
+        metrics.allocations += other.allocations;
+        metrics.allocatedBytes += other.allocatedBytes;
+    }
+}
+
+/**
+ * @brief Records objective function evaluations.
+ * @param count Number of candidates evaluated.
+ */
+inline void countEvaluations(std::size_t count) {
+    if constexpr (enabled)
+        current().evaluations += count;
+}
+
+
+/// Phase of an optimizer that a ScopedTimer attributes time to
+enum class Phase {
+    Evaluation, ///< Objective function evaluation
+    Generation  ///< Candidate generation (sampling, neighbors, mutation, crossover)
+};
+
+
+/**
+ * @class ScopedTimer
+ * @brief Adds the lifetime of the timer to a phase of the current experiment.
+ */
+class ScopedTimer {
+private:
+    using clock = std::chrono::steady_clock;
+
+    Phase phase;                ///< Phase receiving the elapsed time
+    clock::time_point start;    ///< Construction time
+
+public:
+    /// @param phase Phase receiving the elapsed time.
+    explicit ScopedTimer(Phase phase) : phase(phase) {
+        if constexpr (enabled)
+            start = clock::now();
+    }
+
+    ~ScopedTimer() {
+        if constexpr (enabled) {
+            double elapsed = std::chrono::duration<double>(clock::now() - start).count();
+
+            if(phase == Phase::Evaluation)
+                current().evaluationSeconds += elapsed;
+            else
+                current().generationSeconds += elapsed;
+        }
+    }
+
+    ScopedTimer(const ScopedTimer&) = delete;
+    ScopedTimer& operator=(const ScopedTimer&) = delete;
+};
+
+} // namespace instrumentation
+
+#endif
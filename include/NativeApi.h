@@ -0,0 +1,98 @@
+/**
+ * @file NativeApi.h
+ * @author Alex Buckley
+ * @ingroup Core
+ * @brief Stable C interface to the benchmark engine for in-process callers.
+ * * The engine is also built as a shared library (`make shared`), letting
+ * other languages evaluate problems and run experiments without launching
+ * the benchmark program. All functions use C linkage and plain C types.
+ * Errors never propagate as exceptions: functions report failure through
+ * their return value and nob_last_error() describes the most recent error
+ * on the calling thread.
+ */
+
+
+#ifndef NATIVE_API_H
+#define NATIVE_API_H
+
+#include <stddef.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/// Version of this interface, incremented on incompatible changes
+#define NOB_ABI_VERSION 2
+
+/// Exported from the shared library, which hides every other symbol
+#define NOB_API __attribute__((visibility("default")))
+
+/// Opaque result of a single experiment, released with nob_result_free()
+typedef struct nob_result nob_result;
+
+/** @return NOB_ABI_VERSION of the loaded library. */
+NOB_API int nob_abi_version(void);
+
+/** @return Description of the last error on the calling thread ("" if none). */
+NOB_API const char* nob_last_error(void);
+
+/**
+ * @brief Retrieves the default search space of a benchmark problem.
+ * @param problemType Problem ID (see ProblemFactory).
+ * @param lower Receives the lower bound.
+ * @param upper Receives the upper bound.
+ * @return 0 on success, -1 on error.
+ */
+NOB_API int nob_problem_bounds(int problemType, double* lower, double* upper);
+
+/**
+ * @brief Evaluates a row-major block of candidates (see Problem::evaluateBatch).
+ *
+ * Thread-safe; problems are stateless and shared between calls.
+ *
+ * @param problemType Problem ID (see ProblemFactory).
+ * @param x Pointer to `count * dimensions` coordinates.
+ * @param count Number of candidates.
+ * @param dimensions Coordinates per candidate.
+ * @param fitness Output array receiving @p count fitness values.
+ * @return 0 on success, -1 on error.
+ */
+NOB_API int nob_evaluate(int problemType, const double* x, size_t count, size_t dimensions, double* fitness);
+
+/**
+ * @brief Runs one experiment described by a benchmark.json experiment object.
+ *
+ * Results are identical to running the same experiment with the benchmark
+ * program.
+ *
+ * @param experimentJson NUL-terminated JSON object (one "experiments" entry).
+ * @return Result handle, or NULL on error.
+ */
+NOB_API nob_result* nob_run_experiment(const char* experimentJson);
+
+/** @return Number of best-fitness values (one per iteration). */
+NOB_API size_t nob_result_length(const nob_result* result);
+
+/** @return Pointer to the best fitness per iteration, valid until nob_result_free(). */
+NOB_API const double* nob_result_fitnesses(const nob_result* result);
+
+/** @return Number of coordinates of the best solution (0 if the optimizer does not record it). */
+NOB_API size_t nob_result_solution_length(const nob_result* result);
+
+/** @return Pointer to the best solution found, valid until nob_result_free(). */
+NOB_API const double* nob_result_solution(const nob_result* result);
+
+/** @return Execution time of the optimizer in seconds. */
+NOB_API double nob_result_runtime(const nob_result* result);
+
+/** @return Why the optimizer stopped ("iterations", "evaluations", "target", "stagnation" or "time"). */
+NOB_API const char* nob_result_stop_reason(const nob_result* result);
+
+/** @brief Releases a result handle (NULL is ignored). */
+NOB_API void nob_result_free(nob_result* result);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -23,8 +23,21 @@
  *
  * This algorithm serves as a baseline for comparison against more
  * informed local search techniques.
+ *
+ * Each sample is one iteration. Stopping criteria are checked after every
+ * block of BLOCK_SIZE samples, and blocks are shortened to fit the
+ * evaluation budget exactly. Samples are generated into a reused block
+ * buffer, so memory does not grow with the number of iterations beyond
+ * what the trace policy keeps.
  */
 class Blind : public Optimizer {
+private:
+    /// Number of random samples generated and evaluated per batch
+    static constexpr int BLOCK_SIZE = 256;
+
+    /// Samples of the current block
+    Population samples;
+
 public:
     /**
      * @brief Constructs a Blind optimizer.
@@ -37,9 +50,7 @@ public:
     Blind(SolutionBuilder& solutionBuilder, Problem& problem, int maxIterations)
         : Optimizer(solutionBuilder, problem, maxIterations)
     {
-        bestFitnesses.resize(maxIterations);
-        bestSolution.resize(solutionBuilder.getDimensions());
-        solutions.resize(maxIterations);
+        samples.resize(BLOCK_SIZE, solutionBuilder.getDimensions());
     }
 
     /**
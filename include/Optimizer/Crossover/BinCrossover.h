@@ -8,15 +8,16 @@
 class BinCrossover : public Crossover {
 public:
     void crossover(
-        std::vector<double>& target,
-        const std::vector<double>& mutant,
+        double* target,
+        const double* mutant,
+        std::size_t dimensions,
         double CR,
         SolutionBuilder& builder
     ) override {
-        int jrand = builder.randNum(0, target.size());
+        int jrand = builder.randNum(0, dimensions);
 
-        for(int i = 0; i < target.size(); i++) {
-            if (i == jrand || builder.randNum() < CR)
+        for(std::size_t i = 0; i < dimensions; i++) {
+            if (i == static_cast<std::size_t>(jrand) || builder.randNum() < CR)
                 target[i] = mutant[i];
         }
     }
@@ -1,7 +1,7 @@
 #ifndef CROSSOVER_H
 #define CROSSOVER_H
 
-#include <vector>
+#include <cstddef>
 
 #include "SolutionBuilder.h"
 
@@ -9,9 +9,19 @@ class Crossover {
 public:
     virtual ~Crossover() = default;
 
+    /**
+     * @brief Recombines a target vector with a mutant vector in place.
+     *
+     * @param target Target vector, overwritten with the trial vector.
+     * @param mutant Mutant (donor) vector.
+     * @param dimensions Number of coordinates in both vectors.
+     * @param CR Crossover rate.
+     * @param builder Source of randomness.
+     */
     virtual void crossover(
-        std::vector<double>& target,
-        const std::vector<double>& mutant,
+        double* target,
+        const double* mutant,
+        std::size_t dimensions,
         double CR,
         SolutionBuilder& builder
     ) = 0;
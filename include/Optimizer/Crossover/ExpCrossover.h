@@ -8,19 +8,20 @@
 class ExpCrossover : public Crossover {
 public:
     void crossover(
-        std::vector<double>& target,
-        const std::vector<double>& mutant,
+        double* target,
+        const double* mutant,
+        std::size_t dimensions,
         double CR,
         SolutionBuilder& builder
     ) override {
-        int start = builder.randNum(0, target.size());
-        int L = 0;
+        int start = builder.randNum(0, dimensions);
+        std::size_t L = 0;
 
         do {
-            int idx = (start + L) % target.size();
+            int idx = (start + L) % dimensions;
             target[idx] = mutant[idx];
             L++;
-        } while (builder.randNum() < CR && L < target.size());
+        } while (builder.randNum() < CR && L < dimensions);
     }
 };
 
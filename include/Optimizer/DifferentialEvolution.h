@@ -9,42 +9,134 @@
 #ifndef DIFFERENTIAL_EVOLUTION_H
 #define DIFFERENTIAL_EVOLUTION_H
 
+#include <algorithm>
 #include <memory>
+#include <stdexcept>
+#include <string>
+#include <vector>
 
 #include "Optimizer/Optimizer.h"
 #include "Optimizer/Crossover/Crossover.h"
 #include "Optimizer/Mutation/Mutation.h"
 
+
+/**
+ * @enum MigrationTopology
+ * @brief Which islands send individuals to which at a migration.
+ */
+enum class MigrationTopology {
+    Ring,       ///< Island i sends to island i + 1 (the last to the first)
+    Complete    ///< Every island sends to every other island
+};
+
+
+/**
+ * @struct IslandModel
+ * @brief Settings of island-model Differential Evolution.
+ *
+ * With more than one island, the population is split into that many
+ * sub-populations evolving independently, each on its own thread. Every
+ * @ref interval generations, each island sends copies of its @ref migrants
+ * best individuals to its neighbors in the @ref topology, where they
+ * replace the worst residents they improve on.
+ */
+struct IslandModel {
+    /// Number of sub-populations (1 = a single population)
+    int islands = 1;
+
+    /// Generations between migrations
+    int interval = 10;
+
+    /// Best individuals each island sends per neighbor
+    int migrants = 1;
+
+    /// Neighbors receiving an island's migrants
+    MigrationTopology topology = MigrationTopology::Ring;
+};
+
+
 /**
  * @class DifferentialEvolution
  * @brief Implements a Differential Evolution optimization algorithm.
  *
- * The LocalSearch optimizer explores the neighborhood of the current
- * solution by generating candidate neighbors within a fixed delta.
- * The search continues until a local minimum is reached or the
- * maximum number of iterations is exceeded.
+ * Differential Evolution evolves a population of candidate solutions.
+ * Each generation, every individual (the target vector) is combined with
+ * a mutant vector built from other members of the population by the
+ * mutation strategy, and the crossover strategy mixes the two into a
+ * trial vector. A trial vector replaces its target only if it has a
+ * strictly better fitness.
  *
- * This class supports both single-run local search and repeated
- * local search depending on the iteration limit provided.
+ * The fitness of every individual is kept alongside the population, so
+ * each generation evaluates exactly popSize trial vectors.
+ *
+ * In island mode (see IslandModel) the population is split into islands
+ * whose sizes differ by at most one, and island @c i draws from its own
+ * sub-stream of the solution builder (SolutionBuilder::substream(i)).
+ * Islands meet at a barrier after every generation, where the best fitness
+ * over all islands is recorded, the stopping criteria are checked and
+ * migration takes place. Results therefore depend only on the seed and the
+ * island model, not on thread scheduling (but differ from a single
+ * population).
  */
 class DifferentialEvolution : public Optimizer {
 private:
-    /// Initial population size
+    /**
+     * @struct Island
+     * @brief A (sub-)population with its fitness and generation buffers.
+     */
+    struct Island {
+        Population population;              ///< Individuals
+        std::vector<double> fitness;        ///< Fitness of each individual
+        Population trials;                  ///< Trial vectors of the current generation
+        std::vector<double> trialFitness;   ///< Fitness of each trial vector
+        std::vector<double> mutant;         ///< Mutant vector being built
+    };
+
+    /// Number of individuals in the population
     const int popSize;
+    /// Differential weight (F) applied by the mutation strategy
     const double scale;
+    /// Crossover rate (CR)
     const double crossover;
+    /// Builds trial vectors from target and mutant vectors
     std::unique_ptr<Crossover> crossStrat;
+    /// Builds mutant vectors from members of the population
     std::unique_ptr<Mutation> mutStrat;
+    /// Sub-populations and migration settings
+    const IslandModel islandModel;
+
+    /**
+     * @brief Allocates an island, initializes it randomly and evaluates it.
+     *
+     * Evaluations are not counted; the caller adds them.
+     *
+     * @param island Island to initialize.
+     * @param size Number of individuals.
+     * @param builder Source of randomness.
+     */
+    void initialize(Island& island, int size, SolutionBuilder& builder);
 
     /**
-     * @brief Performs a single local search run until convergence.
+     * @brief Evolves an island by one generation.
      *
-     * Iteratively explores neighboring solutions and updates the
-     * current solution if an improvement is found.
+     * Evaluations are not counted; the caller adds island.population.size().
+     *
+     * @param island Island to evolve.
+     * @param builder Source of randomness.
      */
-    //void localSearch();
+    void evolve(Island& island, SolutionBuilder& builder);
+
+    /// @return Index of the best individual of an island.
+    static std::size_t best(const Island& island);
 
-    std::vector<std::vector<double>> initPopulation();
+    /// @brief Sends migrants between islands according to the topology.
+    void migrate(std::vector<Island>& islands);
+
+    /// @brief Evolves a single population on the solution builder's stream.
+    void optimizeSingle();
+
+    /// @brief Evolves islandModel.islands sub-populations on as many threads.
+    void optimizeIslands();
 
 public:
     /**
@@ -52,9 +144,14 @@ public:
      *
      * @param solutionBuilder Reference to the solution generator.
      * @param problem Reference to the optimization problem.
-     * @param maxIterations Maximum number of local search iterations.
-     * @param popSize Initial population size
-     * @param numNeighbors Number of neighbors sampled per iteration.
+     * @param maxIterations Number of generations.
+     * @param popSize Number of individuals in the population.
+     * @param scale Differential weight (F).
+     * @param crossover Crossover rate (CR).
+     * @param crossStrat Crossover strategy.
+     * @param mutStrat Mutation strategy.
+     * @param islandModel Sub-populations and migration (a single population by default).
+     * @throws std::invalid_argument if an island has no more members than the mutation's donors.
      */
     DifferentialEvolution(
         SolutionBuilder& solutionBuilder,
@@ -64,18 +161,29 @@ public:
         double scale,
         double crossover,
         std::unique_ptr<Crossover> crossStrat,
-        std::unique_ptr<Mutation> mutStrat
+        std::unique_ptr<Mutation> mutStrat,
+        const IslandModel& islandModel = {}
     )
         : Optimizer(solutionBuilder, problem, maxIterations),
           popSize(popSize),
           scale(scale),
           crossover(crossover),
           crossStrat(std::move(crossStrat)),
-          mutStrat(std::move(mutStrat))
-    { }
+          mutStrat(std::move(mutStrat)),
+          islandModel(islandModel)
+    {
+        // Every island must hold its target vector and that many distinct donors
+        const int donors = this->mutStrat->donors();
+
+        if(popSize / std::max(islandModel.islands, 1) <= donors)
+            throw std::invalid_argument(
+                "Population size must be greater than " + std::to_string(donors)
+                + " per island for the mutation strategy"
+            );
+    }
 
     /**
-     * @brief Executes the Differential Evolution  optimization process.
+     * @brief Executes the Differential Evolution optimization process.
      *
      * @return The functions execution time.
      */
@@ -22,22 +22,69 @@
  *
  * This class supports both single-run local search and repeated
  * local search depending on the iteration limit provided.
+ *
+ * Each neighborhood step is one iteration, and stopping criteria are
+ * checked after every step, so they also bound a single long descent.
+ *
+ * With @ref threads set, restarts run concurrently on that many threads.
+ * Restart @c i then draws from its own sub-stream of the solution builder
+ * (SolutionBuilder::substream(i)) instead of continuing one shared stream,
+ * and the per-restart traces are merged in restart order, applying the
+ * stopping criteria as a sequential run would. Results therefore do not
+ * depend on the number of threads (but differ from the shared-stream
+ * default). Only the fitness of parallel restarts is traced, not their
+ * solutions.
  */
 class LocalSearch : public Optimizer {
 private:
+    /**
+     * @struct Workspace
+     * @brief Buffers of one descent, reused across restarts on the same thread.
+     */
+    struct Workspace {
+        std::vector<double> solution;   ///< Current solution
+        Population neighbors;           ///< Neighborhood (numNeighbors rows of dimensions values)
+        std::vector<double> fitness;    ///< Fitness of each neighbor
+    };
+
     /// Maximum perturbation applied when generating neighboring solutions
     const double delta;
 
     /// Number of neighboring solutions evaluated per iteration
     const int numNeighbors;
 
+    /// Threads running restarts (0 = sequential restarts sharing one random stream)
+    const int threads;
+
+    /// Buffers of sequential restarts
+    Workspace work;
+
+    /// @brief Sizes a workspace for the problem's dimensionality.
+    void prepare(Workspace& workspace);
+
     /**
      * @brief Performs a single local search run until convergence.
      *
      * Iteratively explores neighboring solutions and updates the
      * current solution if an improvement is found.
+     *
+     * @param builder Source of the starting point and neighbors.
+     * @param workspace Buffers of the descent.
+     * @param allow Called with a number of evaluations before performing
+     *        them; returning false ends the run.
+     * @param record Called with the current fitness and solution after
+     *        every step; returning false ends the run.
+     *
+     * @return false if @p allow or @p record ended the run early.
      */
-    void localSearch();
+    template<typename Allow, typename Record>
+    bool descend(SolutionBuilder& builder, Workspace& workspace, Allow&& allow, Record&& record);
+
+    /// @brief Runs restarts one after another, sharing the solution builder's stream.
+    void optimizeSequential();
+
+    /// @brief Runs restarts on @ref threads threads, each with its own sub-stream.
+    void optimizeParallel();
 
 public:
     /**
@@ -48,11 +95,13 @@ public:
      * @param maxIterations Maximum number of local search iterations.
      * @param delta Neighborhood radius for neighbor generation.
      * @param numNeighbors Number of neighbors sampled per iteration.
+     * @param threads Threads running restarts (0 = sequential, shared random stream).
      */
-    LocalSearch(SolutionBuilder& solutionBuilder, Problem& problem, int maxIterations, double delta, int numNeighbors)
+    LocalSearch(SolutionBuilder& solutionBuilder, Problem& problem, int maxIterations, double delta, int numNeighbors, int threads = 0)
         : Optimizer(solutionBuilder, problem, maxIterations),
           delta(delta),
-          numNeighbors(numNeighbors)
+          numNeighbors(numNeighbors),
+          threads(threads)
     {}
 
     /**
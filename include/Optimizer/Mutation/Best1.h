@@ -3,15 +3,31 @@
 
 #include "Optimizer/Mutation/Mutation.h"
 
+/// DE/best/1: v = x_best + F * (x_r0 - x_r1)
 class Best1 : public Mutation {
 public:
-    std::vector<double> mutate(
-        const std::vector<std::vector<double>>& population,
+    int donors() const override { return 2; }
+
+    void mutate(
+        const Population& population,
         int targetIndex,
         double F,
-        const std::vector<double>& bestVector,
-        SolutionBuilder& builder
-    ) override;
+        const double* bestVector,
+        SolutionBuilder& builder,
+        double* mutant
+    ) override {
+        int subset[2];
+        builder.getSubset(population.size(), 2, targetIndex, subset);
+
+        const double* r0 = population.row(subset[0]);
+        const double* r1 = population.row(subset[1]);
+
+        // Create mutated vector
+        for(size_t i = 0; i < population.getDimensions(); i++) {
+            mutant[i] = bestVector[i] + F * (r0[i] - r1[i]);
+            mutant[i] = builder.checkBounds(mutant[i]);
+        }
+    }
 };
 
 #endif
@@ -3,15 +3,33 @@
 
 #include "Optimizer/Mutation/Mutation.h"
 
+/// DE/best/2: v = x_best + F * (x_r0 - x_r1) + F * (x_r2 - x_r3)
 class Best2 : public Mutation {
 public:
-    std::vector<double> mutate(
-        const std::vector<std::vector<double>>& population,
+    int donors() const override { return 4; }
+
+    void mutate(
+        const Population& population,
         int targetIndex,
         double F,
-        const std::vector<double>& bestVector,
-        SolutionBuilder& builder
-    ) override;
+        const double* bestVector,
+        SolutionBuilder& builder,
+        double* mutant
+    ) override {
+        int subset[4];
+        builder.getSubset(population.size(), 4, targetIndex, subset);
+
+        const double* r0 = population.row(subset[0]);
+        const double* r1 = population.row(subset[1]);
+        const double* r2 = population.row(subset[2]);
+        const double* r3 = population.row(subset[3]);
+
+        // Create mutated vector
+        for(size_t i = 0; i < population.getDimensions(); i++) {
+            mutant[i] = bestVector[i] + F * (r0[i] - r1[i]) + F * (r2[i] - r3[i]);
+            mutant[i] = builder.checkBounds(mutant[i]);
+        }
+    }
 };
 
 #endif
@@ -4,19 +4,37 @@
 #include <vector>
 
 #include "SolutionBuilder.h"
+#include "Population.h"
 
 
 class Mutation {
 public:
     virtual ~Mutation() = default;
 
-    virtual std::vector<double> mutate(
-        const std::vector<std::vector<double>>& population,
+    /// @return Number of distinct members, other than the target, read per mutant vector.
+    virtual int donors() const = 0;
+
+    /**
+     * @brief Builds a mutant (donor) vector for one target of the population.
+     *
+     * Donor rows are read in place from @p population; the result is
+     * written to @p mutant, so no solution is copied or allocated.
+     *
+     * @param population Current population.
+     * @param targetIndex Index of the target vector (never used as a donor).
+     * @param F Differential weight (scale factor).
+     * @param bestVector Best solution of the current population.
+     * @param builder Source of randomness and bounds handling.
+     * @param mutant Output array of population.getDimensions() coordinates.
+     */
+    virtual void mutate(
+        const Population& population,
         int targetIndex,
         double F,
-        const std::vector<double>& bestVector,
-        SolutionBuilder& builder
+        const double* bestVector,
+        SolutionBuilder& builder,
+        double* mutant
     ) = 0;
 };
 
-#endif
\ No newline at end of file
+#endif
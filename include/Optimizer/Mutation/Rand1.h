@@ -3,26 +3,31 @@
 
 #include "Optimizer/Mutation/Mutation.h"
 
+/// DE/rand/1: v = x_r0 + F * (x_r1 - x_r2)
 class Rand1 : public Mutation {
 public:
-    std::vector<double> mutate(
-        const std::vector<std::vector<double>>& population,
+    int donors() const override { return 3; }
+
+    void mutate(
+        const Population& population,
         int targetIndex,
         double F,
-        const std::vector<double>& bestVector,
-        SolutionBuilder& builder
+        const double* /* bestVector */,
+        SolutionBuilder& builder,
+        double* mutant
     ) override {
-            std::vector<int> subset = builder.getSubset(population.size(), 3, targetIndex);
-        
-            std::vector<double> mutated(population[j].size());
+        int subset[3];
+        builder.getSubset(population.size(), 3, targetIndex, subset);
+
+        const double* r0 = population.row(subset[0]);
+        const double* r1 = population.row(subset[1]);
+        const double* r2 = population.row(subset[2]);
 
-            // Create mutated vector
-            for(int i = 0; i < mutated.size(); i++) {
-                mutated[i] = population[subset[1]][i] - population[subset[2]][i];
-                mutated[i] *= F;
-                mutated[i] += population[subset[0]][i];
-                mutated[i] = builder.checkBounds(mutated[i]);
-            }
+        // Create mutated vector
+        for(size_t i = 0; i < population.getDimensions(); i++) {
+            mutant[i] = r0[i] + F * (r1[i] - r2[i]);
+            mutant[i] = builder.checkBounds(mutant[i]);
+        }
     }
 };
 
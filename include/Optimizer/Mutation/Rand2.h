@@ -3,15 +3,34 @@
 
 #include "Optimizer/Mutation/Mutation.h"
 
+/// DE/rand/2: v = x_r0 + F * (x_r1 - x_r2) + F * (x_r3 - x_r4)
 class Rand2 : public Mutation {
 public:
-    std::vector<double> mutate(
-        const std::vector<std::vector<double>>& population,
+    int donors() const override { return 5; }
+
+    void mutate(
+        const Population& population,
         int targetIndex,
         double F,
-        const std::vector<double>& bestVector,
-        SolutionBuilder& builder
-    ) override;
+        const double* /* bestVector */,
+        SolutionBuilder& builder,
+        double* mutant
+    ) override {
+        int subset[5];
+        builder.getSubset(population.size(), 5, targetIndex, subset);
+
+        const double* r0 = population.row(subset[0]);
+        const double* r1 = population.row(subset[1]);
+        const double* r2 = population.row(subset[2]);
+        const double* r3 = population.row(subset[3]);
+        const double* r4 = population.row(subset[4]);
+
+        // Create mutated vector
+        for(size_t i = 0; i < population.getDimensions(); i++) {
+            mutant[i] = r0[i] + F * (r1[i] - r2[i]) + F * (r3[i] - r4[i]);
+            mutant[i] = builder.checkBounds(mutant[i]);
+        }
+    }
 };
 
 #endif
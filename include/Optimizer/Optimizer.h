@@ -10,10 +10,16 @@
 #ifndef OPTIMIZER_H
 #define OPTIMIZER_H
 
+#include <chrono>
+#include <cstddef>
+#include <functional>
 #include <vector>
 
 #include "Problem/Problem.h"
 #include "SolutionBuilder.h"
+#include "Population.h"
+#include "Optimizer/StoppingCriteria.h"
+#include "Optimizer/Trace.h"
 
 
 /**
@@ -24,9 +30,25 @@
  * for optimization algorithms operating on benchmark problems.
  * Derived classes must implement the optimize() method.
  * Results for each run are stored in fields and accessed through getter methods
+ *
+ * Derived classes record() every iteration into the trace, whose
+ * TracePolicy decides which iterations of the convergence curve (and of
+ * the best solutions) are kept, between beginRun() and endRun().
+ *
+ * Runs may end before maxIterations according to the configured
+ * StoppingCriteria. Derived classes evaluate candidates through
+ * evaluateBatch() so evaluations are counted, check budgetAllows() before
+ * evaluating and shouldStop() after each recorded iteration, and record why the
+ * run ended in stopReason.
+ *
+ * A progress callback, if set, is called from shouldStop() at most once per
+ * progress interval with the state of the running experiment.
  */
 class Optimizer {
 public:
+    /// Receives the evaluations, iterations and best fitness of a running experiment
+    using ProgressCallback = std::function<void(long long evaluations, std::size_t iterations, double best)>;
+
     /**
      * @brief Constructs an Optimizer.
      *
@@ -50,25 +72,59 @@ public:
      */
     virtual double optimize() = 0; 
 
+    /**
+     * @brief Sets the early-termination rules for subsequent runs.
+     *
+     * @param criteria Stopping criteria (all disabled by default).
+     */
+    void setStoppingCriteria(const StoppingCriteria& criteria) { stopping = criteria; }
+
+    /**
+     * @brief Sets which iterations subsequent runs keep in their trace.
+     *
+     * @param policy Trace retention policy (every iteration by default).
+     */
+    void setTracePolicy(const TracePolicy& policy) { trace.setPolicy(policy); }
+
+    /**
+     * @brief Reports the state of subsequent runs periodically.
+     *
+     * @param callback Called with the evaluations, iterations and best fitness so far.
+     * @param interval Minimum seconds between calls.
+     */
+    void setProgress(ProgressCallback callback, double interval) {
+        progress = std::move(callback);
+        progressInterval = interval;
+    }
+
     // Getters
     /** @name Accessors */
     ///@{
 
     /// @return The final best fitness value
-    double getBestFitness() { return bestFitnesses.back(); }
+    double getBestFitness() { return trace.best(); }
 
     /// @return Reference to the best solution vector
-    std::vector<double>& getBestSolution() { return bestSolution; }
+    std::vector<double>& getBestSolution() { return trace.getBestSolution(); }
 
-    /// @return Best fitness value so far per iteration
-    std::vector<double>& getBestFitnesses() { return bestFitnesses; }
+    /// @return Best fitness value so far at each iteration kept by the trace policy
+    std::vector<double>& getBestFitnesses() { return trace.getValues(); }
 
-    /// @return All solutions evaluated during optimization
-    std::vector<std::vector<double>>& getSolutions() { return solutions; }
+    /// @return Best solution so far at each iteration kept by the trace policy (if enabled)
+    Population& getSolutions() { return trace.getSolutions(); }
 
     /// @return Maximum number of iterations
     int getMaxIterations() { return maxIterations; }
 
+    /// @return Why the last run ended
+    StopReason getStopReason() { return stopReason; }
+
+    /// @return Objective function evaluations of the last run
+    long long getEvaluations() { return evaluations; }
+
+    /// @return Iterations recorded in the last run
+    std::size_t getIterations() { return trace.size(); }
+
     /// @return Reference to the optimization problem
     Problem& getProblem() { return problem; }
 
@@ -88,14 +144,77 @@ protected:
     /// Maximum number of iterations
     int maxIterations;
 
-    /// Best solution found
-    std::vector<double> bestSolution;
+    /// Best fitness and solution so far per iteration
+    Trace trace;
+
+    /// Early-termination rules
+    StoppingCriteria stopping;
+
+    /// Why the current run ended
+    StopReason stopReason = StopReason::Iterations;
+
+    /// Objective function evaluations in the current run
+    long long evaluations = 0;
+
+    /// Start of the current run, for the time limit
+    std::chrono::steady_clock::time_point runStart;
+
+    /// Receiver of periodic progress reports (empty if disabled)
+    ProgressCallback progress;
+
+    /// Minimum seconds between progress reports
+    double progressInterval = 1.0;
+
+    /**
+     * @brief Resets the trace, evaluation count, stop reason and clock at the start of a run.
+     *
+     * @param expected Expected number of iterations, preallocated for full traces.
+     */
+    void beginRun(std::size_t expected = 0);
+
+    /// @brief Completes the trace at the end of a run.
+    void endRun() { trace.finish(); }
+
+    /**
+     * @brief Evaluates a contiguous block of candidates and counts the evaluations.
+     *
+     * @param candidates Row-major array of count candidates.
+     * @param count Number of candidates.
+     * @param fitness Output array receiving count fitness values.
+     */
+    void evaluateBatch(const double* candidates, std::size_t count, double* fitness);
+
+    /**
+     * @brief Evaluates a single candidate and counts the evaluation.
+     *
+     * @param solution Candidate solution.
+     *
+     * @return Fitness of the candidate.
+     */
+    double evaluate(const std::vector<double>& solution);
+
+    /**
+     * @brief Checks whether @p count more evaluations fit in the evaluation budget.
+     *
+     * @return false (with stopReason set) if the budget would be exceeded.
+     */
+    bool budgetAllows(long long count);
+
+    /**
+     * @brief Checks the stopping criteria after the iterations recorded so far.
+     *
+     * @return true (with stopReason set) if the run should end.
+     */
+    bool shouldStop();
 
-    /// Best fitness value so far per iteration
-    std::vector<double> bestFitnesses;
+private:
+    std::size_t nextProgressCheck = 1;  ///< Iteration at which the clock is next read
+    std::size_t progressStride = 1;     ///< Iterations between clock reads
+    std::chrono::steady_clock::time_point lastProgress;      ///< Time of the last report
+    std::chrono::steady_clock::time_point lastProgressCheck; ///< Time of the last clock read
 
-    /// All generated solutions
-    std::vector<std::vector<double>> solutions;
+    /// @brief Calls the progress callback if the progress interval has passed.
+    void reportProgress(std::size_t iterations);
 };
 
 #endif
\ No newline at end of file
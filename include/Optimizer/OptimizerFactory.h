@@ -12,8 +12,17 @@
 #include "Optimizer/Optimizer.h"
 #include "Optimizer/Blind.h"
 #include "Optimizer/LocalSearch.h"
+#include "Optimizer/DifferentialEvolution.h"
+#include "Optimizer/Mutation/Rand1.h"
+#include "Optimizer/Mutation/Best1.h"
+#include "Optimizer/Mutation/Rand2.h"
+#include "Optimizer/Mutation/Best2.h"
+#include "Optimizer/Mutation/RandBest1.h"
+#include "Optimizer/Crossover/BinCrossover.h"
+#include "Optimizer/Crossover/ExpCrossover.h"
 
 #include <memory>
+#include <optional>
 #include <string>
 
 
@@ -38,16 +47,126 @@ public:
      *         or nullptr if the optimizer type is unsupported.
      */
     static std::unique_ptr<Optimizer> initOptimizer(Problem& problem, ExperimentConfig& config, SolutionBuilder& builder) {
+        std::unique_ptr<Optimizer> optimizer;
+
         if(config.optimizer == "blind")
-            return std::make_unique<Blind>(builder, problem, config.maxIterations);
+            optimizer = std::make_unique<Blind>(builder, problem, config.maxIterations);
         else if(config.optimizer == "local")
-            return std::make_unique<LocalSearch>(builder, problem, 1, config.neighborDelta, config.numNeighbors);
+            optimizer = std::make_unique<LocalSearch>(builder, problem, 1, config.neighborDelta, config.numNeighbors);
         else if(config.optimizer == "repeated local")
-            return std::make_unique<LocalSearch>(builder, problem, config.maxIterations, config.neighborDelta, config.numNeighbors);
-        
+            optimizer = std::make_unique<LocalSearch>(builder, problem, config.maxIterations, config.neighborDelta, config.numNeighbors, config.threads);
+        else if(config.optimizer == "differential evolution") {
+            std::unique_ptr<Mutation> mutation = initMutation(config.mutation);
+            std::unique_ptr<Crossover> crossover = initCrossover(config.crossover);
+            std::optional<MigrationTopology> topology = initTopology(config.topology);
+
+            if(!mutation || !crossover || !topology)
+                return nullptr;
+
+            optimizer = std::make_unique<DifferentialEvolution>(
+                builder, problem, config.maxIterations, config.populationSize,
+                config.scale, config.crossoverRate, std::move(crossover), std::move(mutation),
+                IslandModel{config.islands, config.migrationInterval, config.migrants, *topology}
+            );
+        }
+
+        if(optimizer) {
+            std::optional<TraceMode> traceMode = initTraceMode(config.trace);
+
+            if(!traceMode)
+                return nullptr;
+
+            optimizer->setTracePolicy({*traceMode, config.traceInterval, false, config.traceFile});
+            optimizer->setStoppingCriteria({
+                config.maxEvaluations,
+                config.targetFitness,
+                config.stagnationWindow,
+                config.stagnationTolerance,
+                config.timeLimit,
+            });
+        }
+
+        return optimizer;
+    }
+
+    /**
+     * @brief Initializes a Differential Evolution mutation strategy.
+     *
+     * @param name Strategy name: "rand/1", "best/1", "rand/2", "best/2" or "rand-to-best/1".
+     *
+     * @return A unique pointer to the strategy, or nullptr if the name is unknown.
+     */
+    static std::unique_ptr<Mutation> initMutation(const std::string& name) {
+        if(name == "rand/1")
+            return std::make_unique<Rand1>();
+        else if(name == "best/1")
+            return std::make_unique<Best1>();
+        else if(name == "rand/2")
+            return std::make_unique<Rand2>();
+        else if(name == "best/2")
+            return std::make_unique<Best2>();
+        else if(name == "rand-to-best/1")
+            return std::make_unique<RandBest1>();
+
+        return nullptr;
+    }
+
+    /**
+     * @brief Initializes a Differential Evolution crossover strategy.
+     *
+     * @param name Strategy name: "bin" (binomial) or "exp" (exponential).
+     *
+     * @return A unique pointer to the strategy, or nullptr if the name is unknown.
+     */
+    static std::unique_ptr<Crossover> initCrossover(const std::string& name) {
+        if(name == "bin")
+            return std::make_unique<BinCrossover>();
+        else if(name == "exp")
+            return std::make_unique<ExpCrossover>();
+
         return nullptr;
     }
 
+    /**
+     * @brief Resolves the name of an island-model migration topology.
+     *
+     * @param name Topology name: "ring" or "complete".
+     *
+     * @return The topology, or std::nullopt if the name is unknown.
+     */
+    static std::optional<MigrationTopology> initTopology(const std::string& name) {
+        if(name == "ring")
+            return MigrationTopology::Ring;
+        else if(name == "complete")
+            return MigrationTopology::Complete;
+
+        return std::nullopt;
+    }
+
+    /**
+     * @brief Resolves the name of a trace retention policy.
+     *
+     * @param name Policy name: "full", "none", "best", "every", "log" or "stream".
+     *
+     * @return The trace mode, or std::nullopt if the name is unknown.
+     */
+    static std::optional<TraceMode> initTraceMode(const std::string& name) {
+        if(name == "full")
+            return TraceMode::Full;
+        else if(name == "none")
+            return TraceMode::None;
+        else if(name == "best")
+            return TraceMode::Best;
+        else if(name == "every")
+            return TraceMode::Every;
+        else if(name == "log")
+            return TraceMode::Log;
+        else if(name == "stream")
+            return TraceMode::Stream;
+
+        return std::nullopt;
+    }
+
 };
 
 #endif
\ No newline at end of file
@@ -0,0 +1,68 @@
+/**
+ * @file StoppingCriteria.h
+ * @author Alex Buckley
+ * @ingroup Optimizers
+ * @brief Optional early-termination rules shared by all optimizers.
+ */
+
+
+#ifndef STOPPING_CRITERIA_H
+#define STOPPING_CRITERIA_H
+
+#include <limits>
+
+
+/**
+ * @struct StoppingCriteria
+ * @brief Limits that end an optimization run before its iteration limit.
+ *
+ * Every criterion is disabled by its default value. An iteration is one
+ * entry of the optimizer's convergence curve (a sample for Blind, a
+ * neighborhood step for LocalSearch, a generation for DifferentialEvolution).
+ */
+struct StoppingCriteria {
+    /// Maximum objective function evaluations (0 = unlimited)
+    long long maxEvaluations = 0;
+
+    /// Stop once the best fitness is at or below this value
+    double targetFitness = -std::numeric_limits<double>::infinity();
+
+    /// Iterations over which the best fitness must improve (0 = disabled)
+    int stagnationWindow = 0;
+
+    /// Improvement over the stagnation window at or below which the run stops
+    double stagnationTolerance = 0.0;
+
+    /// Wall-clock limit in seconds (0 = unlimited)
+    double timeLimit = 0.0;
+};
+
+
+/**
+ * @enum StopReason
+ * @brief Why an optimization run ended.
+ */
+enum class StopReason {
+    Iterations,     ///< Configured number of iterations completed
+    Evaluations,    ///< Evaluation budget exhausted
+    Target,         ///< Target fitness reached
+    Stagnation,     ///< No improvement beyond the tolerance within the window
+    Time            ///< Wall-clock limit exceeded
+};
+
+
+/**
+ * @brief Returns the name of a stop reason as written to the results.
+ * @param reason The stop reason.
+ */
+inline const char* stopReasonName(StopReason reason) {
+    switch(reason) {
+        case StopReason::Evaluations: return "evaluations";
+        case StopReason::Target: return "target";
+        case StopReason::Stagnation: return "stagnation";
+        case StopReason::Time: return "time";
+        default: return "iterations";
+    }
+}
+
+#endif
@@ -0,0 +1,160 @@
+/**
+ * @file Trace.h
+ * @author Alex Buckley
+ * @ingroup Optimizers
+ * @brief Best-so-far record of a run, retained according to a policy.
+ */
+
+
+#ifndef TRACE_H
+#define TRACE_H
+
+#include <cstddef>
+#include <fstream>
+#include <limits>
+#include <string>
+#include <vector>
+
+#include "Population.h"
+
+
+/**
+ * @enum TraceMode
+ * @brief Which iterations of a run are kept in the convergence curve.
+ */
+enum class TraceMode {
+    Full,   ///< Every iteration, in memory (default)
+    None,   ///< No iterations
+    Best,   ///< Only the last iteration (the final best)
+    Every,  ///< Every interval-th iteration, plus the last
+    Log,    ///< Log-spaced checkpoints (interval per doubling), plus the last
+    Stream  ///< Every iteration, appended to a file instead of held in memory
+};
+
+
+/**
+ * @struct TracePolicy
+ * @brief Retention settings of a Trace.
+ */
+struct TracePolicy {
+    /// Iterations kept in the curve
+    TraceMode mode = TraceMode::Full;
+
+    /// Iterations between checkpoints (Every), or checkpoints per doubling (Log)
+    int interval = 1;
+
+    /// Also keep the best solution at every kept iteration
+    bool solutions = false;
+
+    /// File receiving streamed values (Stream; empty keeps them in memory)
+    std::string file;
+};
+
+
+/**
+ * @class Trace
+ * @brief Records the best fitness (and solution) so far after every iteration.
+ *
+ * Optimizers call record() once per iteration with the fitness of that
+ * iteration. The trace keeps the running minimum, the incumbent solution and
+ * a short window of recent values for the stagnation criterion, while the
+ * policy decides which iterations are retained in the curve. Memory is
+ * therefore bounded by the policy rather than by the number of iterations.
+ *
+ * Log checkpoints are the iterations 1, 2, ... given by
+ * `next = max(next + 1, ceil(next * 2^(1 / interval)))`. The decimating
+ * modes always keep the last iteration, so the final best fitness ends
+ * every non-empty curve.
+ *
+ * Streamed values are written as native float64, in blocks of STREAM_BLOCK
+ * values, to the policy's file, which the caller owns once finish() returns.
+ */
+class Trace {
+private:
+    /// Values buffered before a streamed block is written
+    static constexpr std::size_t STREAM_BLOCK = 4096;
+
+    TracePolicy policy;                     ///< Retention settings
+    std::size_t count = 0;                  ///< Iterations recorded
+    std::size_t nextCheckpoint = 1;         ///< Next iteration to retain
+    std::size_t lastKept = 0;               ///< Last iteration retained (0 = none)
+    double bestFitness = std::numeric_limits<double>::infinity(); ///< Best fitness so far
+
+    std::vector<double> values;             ///< Retained best fitnesses (stream buffer when streaming)
+    Population solutions;                   ///< Retained best solutions (policy.solutions only)
+    std::vector<double> bestSolution;       ///< Incumbent solution
+    std::vector<double> recent;             ///< Ring buffer of the latest best fitnesses
+    std::ofstream stream;                   ///< Open stream file (Stream only)
+    bool streaming = false;                 ///< Whether values go to the stream file
+
+    /// @brief Retains the current best fitness and solution.
+    void keep();
+
+    /// @brief Writes buffered values to the stream file.
+    void flush();
+
+public:
+    /** @brief Sets the retention policy of subsequent runs. */
+    void setPolicy(const TracePolicy& tracePolicy) { policy = tracePolicy; }
+
+    /** @return The retention policy. */
+    const TracePolicy& getPolicy() const { return policy; }
+
+    /**
+     * @brief Clears the trace at the start of a run.
+     *
+     * @param dimensions Coordinates per solution.
+     * @param history Latest values available through ago() (at least 1).
+     * @param expected Expected number of iterations, reserved in Full mode.
+     */
+    void begin(std::size_t dimensions, std::size_t history, std::size_t expected = 0);
+
+    /**
+     * @brief Records one iteration.
+     *
+     * @param fitness Best fitness found in this iteration.
+     * @param solution Solution with that fitness, or nullptr if not tracked.
+     */
+    void record(double fitness, const double* solution = nullptr) {
+        if(count == 0 || fitness < bestFitness) {
+            bestFitness = fitness;
+
+            if(solution)
+                bestSolution.assign(solution, solution + solutions.getDimensions());
+        }
+
+        recent[count % recent.size()] = bestFitness;
+        count++;
+
+        if(count == nextCheckpoint)
+            keep();
+    }
+
+    /** @brief Keeps the last iteration if the policy requires it and closes the stream file. */
+    void finish();
+
+    /** @name Accessors */
+    ///@{
+
+    /** @return Number of iterations recorded. */
+    std::size_t size() const { return count; }
+
+    /** @return Best fitness so far (infinity before the first iteration). */
+    double best() const { return bestFitness; }
+
+    /** @return Best fitness so far @p age iterations before the last one (age < history). */
+    double ago(std::size_t age) const { return recent[(count - 1 - age) % recent.size()]; }
+
+    /** @return Retained best fitnesses (empty once streamed). */
+    std::vector<double>& getValues() { return values; }
+
+    /** @return Retained best solutions, one row per retained fitness. */
+    Population& getSolutions() { return solutions; }
+
+    /** @return Best solution found (empty if solutions were not recorded). */
+    std::vector<double>& getBestSolution() { return bestSolution; }
+
+    ///@}
+};
+
+#endif
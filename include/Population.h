@@ -0,0 +1,119 @@
+/**
+ * @file Population.h
+ * @ingroup Utilities
+ * @brief Contiguous storage for a set of candidate solutions.
+ * @author Alex Buckley
+ */
+
+
+#ifndef POPULATION_H
+#define POPULATION_H
+
+#include <vector>
+#include <algorithm>
+#include <cstddef>
+#include <utility>
+
+
+/**
+ * @class Population
+ * @brief Flat, reusable buffer holding a block of solution vectors.
+ *
+ * All coordinates live in one contiguous `double` array in row-major order:
+ * solution @c i starts at `data() + i * stride()`. Rows are packed, so the
+ * stride equals the dimensionality and a whole block can be passed directly
+ * to Problem::evaluateBatch().
+ *
+ * Resizing to a shape that fits within the current capacity never allocates,
+ * and two populations can exchange their storage with swap(), letting
+ * optimizers reuse buffers across iterations instead of copying them.
+ */
+class Population {
+private:
+    std::size_t numRows = 0;        ///< Number of solutions stored
+    std::size_t dimensions = 0;     ///< Coordinates per solution (row stride)
+    std::vector<double> values;     ///< Row-major coordinate storage
+
+public:
+    Population() = default;
+
+    /**
+     * @brief Constructs a population of @p rows solutions.
+     * @param rows Number of solutions.
+     * @param dimensions Number of coordinates per solution.
+     */
+    Population(std::size_t rows, std::size_t dimensions)
+        : numRows(rows),
+          dimensions(dimensions),
+          values(rows * dimensions)
+    {}
+
+    /**
+     * @brief Changes the shape of the population.
+     *
+     * Existing storage is reused when large enough; contents are unspecified
+     * after a reshape.
+     *
+     * @param rows Number of solutions.
+     * @param dims Number of coordinates per solution.
+     */
+    void resize(std::size_t rows, std::size_t dims) {
+        numRows = rows;
+        dimensions = dims;
+
+        if(values.size() < rows * dims)
+            values.resize(rows * dims);
+    }
+
+    /**
+     * @brief Appends a copy of a solution as the last row.
+     *
+     * Storage grows geometrically, so appending is amortized constant time.
+     *
+     * @param solution Pointer to getDimensions() coordinates.
+     */
+    void append(const double* solution) {
+        const std::size_t end = numRows * dimensions;
+
+        if(values.size() < end + dimensions)
+            values.resize(std::max(2 * values.size(), end + dimensions));
+
+        std::copy(solution, solution + dimensions, values.begin() + end);
+        numRows++;
+    }
+
+    /// @brief Exchanges storage with another population without copying.
+    void swap(Population& other) noexcept {
+        std::swap(numRows, other.numRows);
+        std::swap(dimensions, other.dimensions);
+        values.swap(other.values);
+    }
+
+    /** @name Accessors */
+    ///@{
+
+    /** @return Pointer to the first coordinate of solution @p i. */
+    double* row(std::size_t i) { return values.data() + i * dimensions; }
+
+    /** @return Pointer to the first coordinate of solution @p i. */
+    const double* row(std::size_t i) const { return values.data() + i * dimensions; }
+
+    /** @return Pointer to the start of the contiguous block. */
+    double* data() { return values.data(); }
+
+    /** @return Pointer to the start of the contiguous block. */
+    const double* data() const { return values.data(); }
+
+    /** @return Number of solutions stored. */
+    std::size_t size() const { return numRows; }
+
+    /** @return Number of coordinates per solution. */
+    std::size_t getDimensions() const { return dimensions; }
+
+    /** @return Distance in doubles between consecutive solutions. */
+    std::size_t stride() const { return dimensions; }
+
+    ///@}
+};
+
+#endif
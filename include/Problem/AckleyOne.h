@@ -18,19 +18,19 @@
  * @class AckleyOne
  * @brief Implements the Ackley 1 benchmark function.
  */
-class AckleyOne : public Problem {
+class AckleyOne : public ProblemKernel<AckleyOne> {
 private:
     static constexpr double LOWER = -32.0;
     static constexpr double UPPER = 32.0;
     static constexpr std::string_view NAME = "AckleyOne";
 
 public:
-    AckleyOne() : Problem(LOWER, UPPER, NAME) {}
+    AckleyOne() : ProblemKernel(LOWER, UPPER, NAME) {}
 
-    double evaluate(const std::vector<double>& x) const override {
+    static double kernel(const double* x, std::size_t n) {
         double sum = 0.0;
 
-        for(size_t i = 0; i < x.size() - 1; i++) {
+        for(std::size_t i = 0; i < n - 1; i++) {
             double term1 = std::exp(-0.2) * std::sqrt(x[i] * x[i] + x[i+1] * x[i+1]);
             double term2 = 3 * (std::cos(2 * x[i]) + std::sin(2 * x[i+1]));
             sum += term1 + term2;
@@ -19,19 +19,19 @@
  * @class AckleyTwo
  * @brief Implements the Ackley 2 benchmark function.
  */
-class AckleyTwo : public Problem {
+class AckleyTwo : public ProblemKernel<AckleyTwo> {
 private:
     static constexpr double LOWER = -32.0;
     static constexpr double UPPER = 32.0;
     static constexpr std::string_view NAME = "AckleyTwo";
 
 public:
-    AckleyTwo() : Problem(LOWER, UPPER, NAME) {}
+    AckleyTwo() : ProblemKernel(LOWER, UPPER, NAME) {}
 
-    double evaluate(const std::vector<double>& x) const override {
+    static double kernel(const double* x, std::size_t n) {
         double sum = 0.0;
 
-        for(size_t i = 0; i < x.size() - 1; i++) {
+        for(std::size_t i = 0; i < n - 1; i++) {
             double sqrtTerm = std::sqrt((x[i] * x[i] + x[i+1] * x[i+1]) / 2);
             double term3 = -20 / (std::exp(0.2 * sqrtTerm));
             double term4 = -1 * std::exp(0.5 * std::cos(2 * std::numbers::pi * x[i]) + std::cos(2 * std::numbers::pi * x[i+1]));
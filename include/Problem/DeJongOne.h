@@ -16,7 +16,7 @@
  * @class DeJong
  * @brief Implements the DeJong 1 benchmark function.
  */
-class DeJongOne : public Problem {
+class DeJongOne : public ProblemKernel<DeJongOne> {
 private:
     static constexpr double LOWER = -100.0;
     static constexpr double UPPER = 100.0;
@@ -24,14 +24,14 @@ private:
 
 public:
     // Constructor method
-    DeJongOne() : Problem(LOWER, UPPER, NAME) {}
+    DeJongOne() : ProblemKernel(LOWER, UPPER, NAME) {}
     
     // Evaluate function
-    double evaluate(const std::vector<double>& x) const override {
+    static double kernel(const double* x, std::size_t n) {
         double sum = 0.0;
 
-        for(double xi : x)
-            sum += xi * xi;
+        for(std::size_t i = 0; i < n; i++)
+            sum += x[i] * x[i];
         
         return sum;
     }
@@ -18,23 +18,23 @@
  * @class EggHolder
  * @brief Implements the Egg Holder benchmark function.
  */
-class EggHolder : public Problem {
+class EggHolder : public ProblemKernel<EggHolder> {
 private:
     static constexpr double LOWER = -500.0;
     static constexpr double UPPER = 500.0;
     static constexpr std::string_view NAME = "EggHolder";
 
-    inline double sinSqrtAbs(double n) const {
+    static inline double sinSqrtAbs(double n) {
         return std::sin(std::sqrt(std::abs(n)));
     }
 
 public:
-    EggHolder() : Problem(LOWER, UPPER, NAME) {}
+    EggHolder() : ProblemKernel(LOWER, UPPER, NAME) {}
 
-    double evaluate(const std::vector<double>& x) const override {
+    static double kernel(const double* x, std::size_t n) {
         double sum = 0.0;
 
-        for(size_t i = 0; i < x.size() - 1; i++) {
+        for(std::size_t i = 0; i < n - 1; i++) {
             double term1 = -x[i] * sinSqrtAbs(x[i] - x[i+1] - 47);
             double term2 = -(x[i+1] + 47) * sinSqrtAbs(x[i+1] + 47 + x[i] / 2);
 
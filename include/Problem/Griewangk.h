@@ -17,20 +17,20 @@
  * @class Griewangk
  * @brief Implements the Griewangk benchmark function.
  */
-class Griewangk : public Problem {
+class Griewangk : public ProblemKernel<Griewangk> {
 private:
     static constexpr double LOWER = -500.0;
     static constexpr double UPPER = 500.0;
     static constexpr std::string_view NAME = "Griewangk";
 
 public:
-    Griewangk() : Problem(LOWER, UPPER, NAME) {}
+    Griewangk() : ProblemKernel(LOWER, UPPER, NAME) {}
 
-    double evaluate(const std::vector<double>& x) const override {
+    static double kernel(const double* x, std::size_t n) {
         double sum = 0.0;
         double prod = 1.0;
 
-        for(size_t i = 0; i < x.size(); i++) {
+        for(std::size_t i = 0; i < n; i++) {
             sum += x[i] * x[i];
             prod *= std::cos(x[i] / std::sqrt(i + 1));
         }
@@ -10,6 +10,11 @@
 #define PROBLEM_H
 
 #include <vector>
+#include <string>
+#include <string_view>
+#include <cstddef>
+
+#include "Instrumentation.h"
 
 /**
  * @class Problem
@@ -48,6 +53,25 @@ public:
      */
     virtual double evaluate(const std::vector<double>& x) const = 0;
 
+    /**
+     * @brief Evaluates the fitness of a block of candidate solutions.
+     *
+     * Candidates are stored contiguously in row-major order, so candidate
+     * @c i occupies `x[i * dimensions, (i + 1) * dimensions)`. A single call
+     * scores the whole block, replacing one virtual call per candidate.
+     *
+     * @param x Pointer to `count * dimensions` coordinates.
+     * @param count Number of candidates in the block.
+     * @param dimensions Number of coordinates per candidate.
+     * @param fitness Output array receiving @p count fitness values.
+     */
+    virtual void evaluateBatch(
+        const double* x,
+        std::size_t count,
+        std::size_t dimensions,
+        double* fitness
+    ) const = 0;
+
     /** @name Accessors */
     ///@{
 
@@ -63,4 +87,48 @@ public:
     ///@}
 };
 
+
+/**
+ * @class ProblemKernel
+ * @brief CRTP base implementing the Problem interface from a static kernel.
+ *
+ * Derived benchmark functions provide
+ * `static double kernel(const double* x, std::size_t n)`, which scores a
+ * single candidate of @c n coordinates. Both evaluation entry points inline
+ * that kernel; the batch loop is marked as a SIMD loop over candidates, so
+ * the compiler may vectorize across rows while each row is still summed in
+ * its original order (results are identical to evaluate()).
+ *
+ * Both entry points also feed the evaluation counter and timer of
+ * instrumented builds (see Instrumentation.h).
+ *
+ * @tparam Derived The concrete benchmark function.
+ */
+template<typename Derived>
+class ProblemKernel : public Problem {
+public:
+    using Problem::Problem;
+
+    double evaluate(const std::vector<double>& x) const override {
+        instrumentation::ScopedTimer timer(instrumentation::Phase::Evaluation);
+        instrumentation::countEvaluations(1);
+
+        return Derived::kernel(x.data(), x.size());
+    }
+
+    void evaluateBatch(
+        const double* x,
+        std::size_t count,
+        std::size_t dimensions,
+        double* fitness
+    ) const override {
+        instrumentation::ScopedTimer timer(instrumentation::Phase::Evaluation);
+        instrumentation::countEvaluations(count);
+
+        #pragma omp simd
+        for(std::size_t i = 0; i < count; i++)
+            fitness[i] = Derived::kernel(x + i * dimensions, dimensions);
+    }
+};
+
 #endif // PROBLEM_H
@@ -19,22 +19,22 @@
  * @class Rastrigin
  * @brief Implements the Rastrigin benchmark function.
  */
-class Rastrigin : public Problem {
+class Rastrigin : public ProblemKernel<Rastrigin> {
 private:
     static constexpr double LOWER = -30.0;
     static constexpr double UPPER = 30.0;
     static constexpr std::string_view NAME = "Rastrigin";
 
 public:
-    Rastrigin() : Problem(LOWER, UPPER, NAME) {}
+    Rastrigin() : ProblemKernel(LOWER, UPPER, NAME) {}
 
-    double evaluate(const std::vector<double>& x) const override {
+    static double kernel(const double* x, std::size_t n) {
         double sum = 0.0;
         
-        for(double xi : x) // Calculate summation
-            sum += xi * xi - 10 * std::cos(2 * std::numbers::pi * xi);
+        for(std::size_t i = 0; i < n; i++) // Calculate summation
+            sum += x[i] * x[i] - 10 * std::cos(2 * std::numbers::pi * x[i]);
 
-        return 10 * x.size() + sum;
+        return 10 * n + sum;
     }
 };
 
@@ -17,19 +17,19 @@
  * @class Rosenbrock
  * @brief Implements the Rosenbrock benchmark function.
  */
-class Rosenbrock : public Problem {
+class Rosenbrock : public ProblemKernel<Rosenbrock> {
 private:
     static constexpr double LOWER = -100.0;
     static constexpr double UPPER = 100.0;
     static constexpr std::string_view NAME = "Rosenbrock";
 
 public:
-    Rosenbrock() : Problem(LOWER, UPPER, NAME) {}
+    Rosenbrock() : ProblemKernel(LOWER, UPPER, NAME) {}
 
-    double evaluate(const std::vector<double>& x) const override {
+    static double kernel(const double* x, std::size_t n) {
         double sum = 0.0;
         
-        for(size_t i = 0; i < x.size() - 1; i++) {
+        for(std::size_t i = 0; i < n - 1; i++) {
             // Calculate inner terms
             const double term1 = x[i] * x[i] - x[i+1];
             const double term2 = 1 - x[i];
@@ -11,28 +11,29 @@
 
 #include "Problem/Problem.h"
 #include <vector>
+#include <cmath>
 
 
 /**
  * @class Schwefel
  * @brief Implements the Schwefel benchmark function.
  */
-class Schwefel : public Problem {
+class Schwefel : public ProblemKernel<Schwefel> {
 private:
     static constexpr double LOWER = -512.0;
     static constexpr double UPPER = 512.0;
     static constexpr std::string_view NAME = "Schwefel";
 
 public:
-    Schwefel() : Problem(LOWER, UPPER, NAME) {}
+    Schwefel() : ProblemKernel(LOWER, UPPER, NAME) {}
 
-    double evaluate(const std::vector<double>& x) const override {
+    static double kernel(const double* x, std::size_t n) {
         double sum = 0.0;
         
-        for(double xi : x)
-            sum += xi * std::sin(std::sqrt(std::abs(xi)));
+        for(std::size_t i = 0; i < n; i++)
+            sum += x[i] * std::sin(std::sqrt(std::abs(x[i])));
         
-        return 418.9829 * x.size() - sum;
+        return 418.9829 * n - sum;
     }
 };
 
@@ -18,19 +18,19 @@
  * @class SineEnvelope
  * @brief Implements the Sine Envelope benchmark function.
  */
-class SineEnvelope : public Problem {
+class SineEnvelope : public ProblemKernel<SineEnvelope> {
 private:
     static constexpr double LOWER = -30.0;
     static constexpr double UPPER = 30.0;
     static constexpr std::string_view NAME = "SineEnvelope";
 
 public:
-    SineEnvelope() : Problem(LOWER, UPPER, NAME) {}
+    SineEnvelope() : ProblemKernel(LOWER, UPPER, NAME) {}
 
-    double evaluate(const std::vector<double>& x) const override {
+    static double kernel(const double* x, std::size_t n) {
         double sum = 0.0;
 
-        for(size_t i = 0; i < x.size() - 1; i++) {
+        for(std::size_t i = 0; i < n - 1; i++) {
             double sqrSum = x[i] * x[i] + x[i+1] * x[i+1];
             double numerator = std::sin(sqrSum - 0.5) * std::sin(sqrSum - 0.5);
             double denom = (1 + 0.001 * sqrSum) * (1 + 0.001 * sqrSum);
@@ -18,19 +18,19 @@
  * @class StretchedV
  * @brief Implements the StretchedV benchmark function.
  */
-class StretchedV : public Problem {
+class StretchedV : public ProblemKernel<StretchedV> {
 private:
     static constexpr double LOWER = -30.0;
     static constexpr double UPPER = 30.0;
     static constexpr std::string_view NAME = "StretchedV";
 
 public:
-    StretchedV() : Problem(LOWER, UPPER, NAME) {}
+    StretchedV() : ProblemKernel(LOWER, UPPER, NAME) {}
 
-    double evaluate(const std::vector<double>& x) const override {
+    static double kernel(const double* x, std::size_t n) {
         double sum = 0.0;
 
-        for(size_t i = 0; i < x.size() - 1; i++) {
+        for(std::size_t i = 0; i < n - 1; i++) {
             double sqrSum = x[i] * x[i] + x[i+1] * x[i+1];
             double factor1 = std::sqrt(std::sqrt(sqrSum));
             double factor2 = std::sin(50 * std::pow(sqrSum, 0.1));
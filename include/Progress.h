@@ -0,0 +1,83 @@
+/**
+ * @file Progress.h
+ * @author Alex Buckley
+ * @ingroup Core
+ * @brief Machine-readable progress events of a benchmark run.
+ */
+
+
+#ifndef PROGRESS_H
+#define PROGRESS_H
+
+#include <chrono>
+#include <cstddef>
+#include <fstream>
+#include <mutex>
+#include <string>
+
+#include "Optimizer/StoppingCriteria.h"
+
+
+/**
+ * @class ProgressStream
+ * @brief Writes newline-delimited JSON progress events to a file, pipe or FIFO.
+ *
+ * Every event is one JSON object on its own line, flushed immediately, with
+ * an "event" type and the "time" in seconds since the stream was opened:
+ *
+ * - `begin`: experiments, jobs
+ * - `start`: index, experiment
+ * - `progress`: index, experiment, evaluations, iterations, best
+ * - `end`: index, experiment, evaluations, iterations, best, runtime, stop_reason
+ * - `finish`: experiments
+ *
+ * `index` is the position of the experiment in the configuration, and
+ * `progress` events are sent periodically while an experiment runs. A best
+ * fitness that is not yet known is written as null. Events may be emitted
+ * from several worker threads; each line is written whole.
+ */
+class ProgressStream {
+private:
+    std::ofstream out;      ///< Destination of the events
+    std::mutex mutex;       ///< Serializes events of worker threads
+    std::chrono::steady_clock::time_point opened; ///< Reference of the event times
+
+    /// @brief Writes one event line (JSON object text without the time).
+    void emit(const std::string& event, const std::string& fields);
+
+public:
+    /**
+     * @brief Opens the destination of the events.
+     * @param path File, named pipe or /dev/fd/N path (truncated if a regular file).
+     * @return true if the destination could be opened.
+     */
+    bool open(const std::string& path);
+
+    /** @return Whether events are being written. */
+    bool isOpen() const { return out.is_open(); }
+
+    /** @brief Announces a run of @p experiments experiments on @p jobs threads. */
+    void begin(int experiments, int jobs);
+
+    /** @brief Announces that experiment @p index started. */
+    void start(int index, const std::string& name);
+
+    /** @brief Reports the state of a running experiment. */
+    void update(int index, const std::string& name, long long evaluations, std::size_t iterations, double best);
+
+    /** @brief Reports a finished experiment. */
+    void end(
+        int index,
+        const std::string& name,
+        long long evaluations,
+        std::size_t iterations,
+        double best,
+        double runtime,
+        StopReason stopReason
+    );
+
+    /** @brief Announces the end of the run. */
+    void finish(int experiments);
+};
+
+#endif
@@ -0,0 +1,121 @@
+/**
+ * @file RandomGenerator.h
+ * @ingroup Utilities
+ * @brief Pseudo-random number generators producing blocks of 32-bit words.
+ * @author Alex Buckley
+ */
+
+
+#ifndef RANDOM_GENERATOR_H
+#define RANDOM_GENERATOR_H
+
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <string>
+
+
+/**
+ * @class RandomGenerator
+ * @brief Interface for a seeded source of uniformly distributed 32-bit words.
+ *
+ * Generators fill whole blocks per call, so the cost of the virtual call is
+ * shared by many values. Every generator is fully determined by its seed.
+ */
+class RandomGenerator {
+public:
+    /** @brief Name of the default generator, whose sequence is that of MersenneTwister::genrand_int32(). */
+    static constexpr const char* DEFAULT = "mt19937";
+
+    virtual ~RandomGenerator() = default;
+
+    /**
+     * @brief Writes the next @p count words of the sequence.
+     * @param words Output array of @p count words.
+     * @param count Number of words to generate.
+     */
+    virtual void fill(std::uint32_t* words, std::size_t count) = 0;
+
+    /**
+     * @brief Creates a generator by name.
+     *
+     * Supported names are "mt19937" (Mersenne Twister), "xoshiro256++" and "pcg32".
+     *
+     * @param name Generator family.
+     * @param seed Seed initializing the generator state.
+     * @throws std::invalid_argument if the name does not match a known generator.
+     */
+    static std::unique_ptr<RandomGenerator> create(const std::string& name, std::uint64_t seed);
+
+    /**
+     * @brief Derives the seed of an independent sub-stream from a base seed.
+     *
+     * Returns output @p stream + 1 of SplitMix64 started at @p seed, so every
+     * (seed, stream) pair maps to a well-mixed, reproducible seed.
+     *
+     * @param seed Base seed.
+     * @param stream Index of the sub-stream.
+     */
+    static std::uint64_t deriveSeed(std::uint64_t seed, std::uint64_t stream);
+};
+
+
+/**
+ * @class MersenneGenerator
+ * @brief MT19937, producing the same sequence as MersenneTwister::genrand_int32().
+ *
+ * Unlike MersenneTwister, which tempers one word per call, the state is
+ * regenerated and tempered a block of @ref N words at a time.
+ */
+class MersenneGenerator : public RandomGenerator {
+private:
+    static constexpr int N = 624;   ///< Words of state
+    static constexpr int M = 397;   ///< Offset of the recurrence
+
+    std::uint32_t state[N];
+    int index = N;                  ///< Next untempered word of the state
+
+    /** @brief Regenerates all @ref N words of the state. */
+    void twist();
+
+public:
+    /** @brief Seeds the state as MersenneTwister::init_genrand() does. */
+    explicit MersenneGenerator(std::uint64_t seed);
+
+    void fill(std::uint32_t* words, std::size_t count) override;
+};
+
+
+/**
+ * @class Xoshiro256Generator
+ * @brief xoshiro256++ (Blackman and Vigna), two words per 64-bit output.
+ *
+ * The state is initialized from the seed with SplitMix64.
+ */
+class Xoshiro256Generator : public RandomGenerator {
+private:
+    std::uint64_t state[4];
+
+public:
+    explicit Xoshiro256Generator(std::uint64_t seed);
+
+    void fill(std::uint32_t* words, std::size_t count) override;
+};
+
+
+/**
+ * @class Pcg32Generator
+ * @brief PCG32 (XSH-RR variant of O'Neill's permuted congruential generator).
+ */
+class Pcg32Generator : public RandomGenerator {
+private:
+    std::uint64_t state;
+    std::uint64_t increment;
+
+public:
+    explicit Pcg32Generator(std::uint64_t seed);
+
+    void fill(std::uint32_t* words, std::size_t count) override;
+};
+
+#endif
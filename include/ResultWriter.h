@@ -0,0 +1,160 @@
+/**
+ * @file ResultWriter.h
+ * @author Alex Buckley
+ * @ingroup Core
+ * @brief Streams experiment results to disk as each experiment finishes.
+ */
+
+
+#ifndef RESULT_WRITER_H
+#define RESULT_WRITER_H
+
+#include <condition_variable>
+#include <cstddef>
+#include <fstream>
+#include <map>
+#include <mutex>
+#include <string>
+#include <string_view>
+#include <vector>
+
+#include "Instrumentation.h"
+#include "Optimizer/StoppingCriteria.h"
+
+
+/**
+ * @enum ResultFormat
+ * @brief Storage format for per-iteration convergence data.
+ */
+enum class ResultFormat {
+    CSV,    ///< Text rows in best_fitnesses.csv (default)
+    Binary  ///< Raw float64 block in best_fitnesses.bin with a best_fitnesses.idx offsets index
+};
+
+
+/**
+ * @class ResultWriter
+ * @brief Append-only, incrementally flushed writer for benchmark results.
+ *
+ * Every record is appended and flushed as soon as it can be written, so
+ * only in-flight experiments are held in memory and a crashed run leaves
+ * all finished experiments readable on disk.
+ *
+ * The convergence data (CSV row, or binary values followed by their index
+ * line) is flushed first and the experiment's times.csv row last. The
+ * times.csv row is therefore the completion marker of a record: readers
+ * treat an experiment as finished only once its time row is present.
+ * Instrumented builds also write a metrics.csv row (before the time row).
+ *
+ * Convergence data streamed to a trace file while the optimizer ran (see
+ * TraceMode::Stream) is copied into the results block by block when its
+ * record is written, after which the trace file is removed.
+ *
+ * Records are written in experiment order. Experiments finishing ahead of
+ * an earlier, still running one are held back until it completes, so the
+ * files are identical regardless of how many worker threads produced them.
+ * Workers call acquire() before starting an experiment, which bounds how
+ * far ahead of the oldest unwritten experiment they may run, and with it
+ * the number of held-back records.
+ */
+class ResultWriter {
+private:
+    /// Finished experiment waiting for its turn to be written
+    struct Record {
+        std::string name;                   ///< Experiment name
+        std::vector<double> bestFitnesses;  ///< Convergence data
+        std::string traceFile;              ///< Streamed convergence data (replaces bestFitnesses if set)
+        double runtime;                     ///< Execution time in seconds
+        StopReason stopReason;              ///< Why the optimizer stopped
+        instrumentation::Metrics metrics;   ///< Counters of instrumented builds
+    };
+
+    ResultFormat format;            ///< Storage format for convergence data
+    std::ofstream fitnessOut;       ///< best_fitnesses.csv or best_fitnesses.bin
+    std::ofstream indexOut;         ///< best_fitnesses.idx (binary format only)
+    std::ofstream timesOut;         ///< times.csv (record completion markers)
+    std::ofstream metricsOut;       ///< metrics.csv (instrumented builds only)
+    std::size_t valueOffset = 0;    ///< Values written to the binary block so far
+    std::size_t nextIndex = 0;      ///< Index of the next record to write
+    std::map<std::size_t, Record> pending; ///< Records finished out of order
+    std::mutex mutex;               ///< Serializes writes from worker threads
+    std::condition_variable advanced; ///< Notified when nextIndex advances
+
+    /// Values read from a trace file at a time
+    static constexpr std::size_t TRACE_BLOCK = 4096;
+
+    /**
+     * @brief Appends a single record to all result files and flushes them.
+     * @param record The record to write.
+     */
+    void append(const Record& record);
+
+public:
+    /** @name Output File Naming Defaults */
+    ///@{
+    static constexpr std::string_view bestFitnessesFile = "best_fitnesses.csv";       ///< CSV for convergence data
+    static constexpr std::string_view bestFitnessesBinaryFile = "best_fitnesses.bin"; ///< Binary convergence data
+    static constexpr std::string_view bestFitnessesIndexFile = "best_fitnesses.idx";  ///< Offsets index for binary data
+    static constexpr std::string_view timesFile = "times.csv";                        ///< CSV for execution runtimes and stop reasons
+    static constexpr std::string_view metricsFile = "metrics.csv";                    ///< CSV for instrumentation counters
+    ///@}
+
+    /** @name Binary Convergence Format
+     * best_fitnesses.bin starts with a fixed-size header (magic string padded
+     * with zeros) followed by every convergence curve as native float64 values,
+     * back to back. best_fitnesses.idx is a CSV mapping each experiment to the
+     * offset (in values) and length of its curve.
+     */
+    ///@{
+    static constexpr std::string_view binaryMagic = "NOBF64v1"; ///< File signature and format version
+    static constexpr std::size_t binaryHeaderSize = 16;         ///< Header bytes preceding the value block
+    ///@}
+
+    /**
+     * @brief Creates (truncates) the result files and writes their headers.
+     * @param outputDir Directory receiving the result files.
+     * @param format Storage format for convergence data.
+     */
+    ResultWriter(const std::string& outputDir, ResultFormat format);
+
+    /** @return true if all result files were opened successfully. */
+    bool isOpen() const;
+
+    /**
+     * @brief Waits until the experiment at @p index may be started.
+     *
+     * Thread-safe. Blocks while @p index is @p window or more experiments
+     * ahead of the next record to be written, so at most @p window records
+     * are ever held back. The experiment at the next index never waits.
+     *
+     * @param index Position of the experiment in the benchmark.
+     * @param window Maximum distance from the next record to be written.
+     */
+    void acquire(std::size_t index, std::size_t window);
+
+    /**
+     * @brief Submits the results of a finished experiment.
+     *
+     * Thread-safe. The record is written immediately if every earlier
+     * experiment has been written, otherwise it is held until they have.
+     *
+     * @param index Position of the experiment in the benchmark.
+     * @param name Experiment name.
+     * @param bestFitnesses Convergence data (moved into the writer).
+     * @param runtime Execution time in seconds.
+     * @param stopReason Why the optimizer stopped.
+     * @param metrics Instrumentation counters (ignored unless instrumentation is enabled).
+     * @param traceFile File of float64 convergence data to write instead of @p bestFitnesses (empty = none).
+     */
+    void write(
+        std::size_t index,
+        const std::string& name,
+        std::vector<double>&& bestFitnesses,
+        double runtime,
+        StopReason stopReason,
+        const instrumentation::Metrics& metrics,
+        const std::string& traceFile = ""
+    );
+};
+
+#endif
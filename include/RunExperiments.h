@@ -12,8 +12,13 @@
 
 #include <vector>
 #include <string>
+#include <string_view>
+#include <mutex>
 
 #include "Config.h"
+#include "Progress.h"
+#include "ResultWriter.h"
+#include "Sweep.h"
 #include "Optimizer/Optimizer.h"
 
 
@@ -21,30 +26,51 @@
  * @class RunExperiments
  * @brief High-level controller that orchestrates the benchmarking process.
  * * This class is responsible for:
- * 1. Parsing the JSON configuration file into ExperimentConfig structures.
+ * 1. Parsing the JSON configuration file into a Sweep, which expands each
+ *    ExperimentConfig only when that experiment is run.
  * 2. Iterating through experiments and instantiating the required Problems and Optimizers.
  * 3. Collecting performance metrics (fitness and runtime).
  * 4. Exporting results to CSV files for analysis.
+ *
+ * Results are streamed to disk through a ResultWriter as experiments finish
+ * (see ResultWriter for the file layout and completion semantics).
  */
 class RunExperiments {
 private:
-std::vector<ExperimentConfig> configs; ///< List of loaded experiment parameters
+    Sweep sweep;            ///< Experiments of the loaded configuration
     std::string outputFile; ///< Destination directory for result files
+    ResultFormat format;    ///< Storage format for convergence data
+    std::mutex outputMutex; ///< Serializes console output from worker threads
+    ProgressStream progress; ///< Progress events (disabled unless opened)
+
+    /// Minimum seconds between progress events of a running experiment
+    static constexpr double PROGRESS_INTERVAL = 1.0;
+
+    /// Experiments a worker may run ahead of the oldest unwritten one, per worker
+    static constexpr std::size_t REORDER_WINDOW_PER_JOB = 4;
 
     /**
-     * @brief Parses a JSON file to populate the internal configs vector.
+     * @brief Parses a JSON file to populate the internal sweep.
      * @param inputFile Path to the .json configuration file.
      * @return true if loading and parsing succeeded, false otherwise.
      */
     bool loadConfig(const std::string& inputFile);
 
     /**
-     * @brief Extracts experiment names from a list of configurations.
-     * @param configs The list of configurations to process.
-     * @return A vector of strings containing only the names.
+     * @brief Runs a single experiment from setup to completion.
+     *
+     * Each call owns its Problem, SolutionBuilder and Optimizer, so calls for
+     * different configurations may safely execute concurrently.
+     *
+     * @param index Position of the experiment in the sweep, for progress events.
+     * @param config Parameters of the experiment to run.
+     * @param bestFitnesses Receives the convergence data kept by the trace policy
+     *        (empty if it was streamed to config.traceFile).
+     * @param stopReason Receives why the optimizer stopped.
+     * @return Execution time of the optimizer in seconds.
      */
-    std::vector<std::string> getNames(std::vector<ExperimentConfig> configs);
-    
+    double runExperiment(int index, ExperimentConfig& config, std::vector<double>& bestFitnesses, StopReason& stopReason);
+
     /**
      * @brief Internal helper to write experiment data to disk.
      * @param bestSolution Final best solution found.
@@ -60,30 +86,48 @@ std::vector<ExperimentConfig> configs; ///< List of loaded experiment parameters
     
     /** @name Output File Naming Defaults */
     ///@{
-    static constexpr std::string_view bestFitnessesFile = "best_fitnesses.csv"; ///< CSV for convergence data
     static constexpr std::string_view solutionsFile = "solutions.csv";         ///< CSV for full solution set
-    static constexpr std::string_view timesFile = "times.csv";                 ///< CSV for execution runtimes
     ///@}
 
 public:
+
     /**
      * @brief Constructs the runner and immediately triggers configuration loading.
      * @param inputFile Path to the JSON configuration.
      * @param outputFile Path to the directory where results will be saved.
+     * @param format Storage format for convergence data.
      */
-    RunExperiments(const std::string inputFile, const std::string& outputFile)
-        : outputFile(outputFile)
+    RunExperiments(
+        const std::string inputFile,
+        const std::string& outputFile,
+        ResultFormat format = ResultFormat::CSV
+    )
+        : outputFile(outputFile),
+          format(format)
     {
         loadConfig(inputFile);
     }
 
+    /**
+     * @brief Streams progress events of subsequent runs (see ProgressStream).
+     * @param path File, named pipe or /dev/fd/N path receiving the events.
+     * @return true if the destination could be opened.
+     */
+    bool openProgress(const std::string& path) { return progress.open(path); }
+
     /**
      * @brief The main execution loop for all loaded experiments.
      * * Iterates through all configurations, initializes the Problem and Optimizer 
      * factories, runs the optimization, and triggers the CSV export.
-     * * @return int The total number of experiments successfully processed.
+     * Experiments are distributed over a pool of @p jobs worker threads. Each
+     * result is written as soon as every earlier experiment has been written,
+     * so output order and values match serial execution. Workers run at most
+     * `jobs * REORDER_WINDOW_PER_JOB` experiments ahead of the oldest one not
+     * yet written, so few finished results wait in memory behind a slow one.
+     * * @param jobs Number of worker threads (1 = serial, 0 = one per hardware thread).
+     * @return int The total number of experiments successfully processed.
      */
-    int runExperiments();
+    int runExperiments(int jobs = 1);
 
 };
 
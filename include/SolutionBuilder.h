@@ -9,10 +9,16 @@
 #ifndef SOLUTION_BUILDER_H
 #define SOLUTION_BUILDER_H
 
+#include <array>
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <string>
 #include <vector>
 
 #include "Problem/Problem.h"
-#include "External/mt.h"
+#include "Population.h"
+#include "RandomGenerator.h"
 
 
 /**
@@ -21,35 +27,78 @@
  *
  * This class encapsulates the logic for generating initial random positions 
  * within the search space and perturbing existing solutions to find neighbors.
- * It utilizes the Mersenne Twister algorithm for high-quality random number generation.
+ *
+ * Random words are drawn from the generator a block at a time into an
+ * internal buffer, and whole solutions or neighborhoods are converted from
+ * the buffer in tight loops. Every value is taken from the generator's
+ * sequence in the same order as when drawing one value per call, so block
+ * generation does not change which numbers an optimizer receives.
  */
 class SolutionBuilder { 
 private:
+    static constexpr std::size_t BUFFER_WORDS = 1024; ///< Words drawn from the generator per refill
+
     const int dimensions;   ///< Dimensionality of the problem space
     const int lower;        ///< Lower boundary for coordinate values
     const int upper;        ///< Upper boundary for coordinate values
-    MersenneTwister mt;     ///< Random number generator instance
+    const std::uint64_t seed;           ///< Seed of the generator
+    const std::string generatorName;    ///< Random number generator family
+    std::unique_ptr<RandomGenerator> generator;     ///< Random number generator instance
+    std::array<std::uint32_t, BUFFER_WORDS> buffer; ///< Generated words not yet consumed
+    std::size_t position = BUFFER_WORDS;            ///< Index of the next unused word in the buffer
+    std::vector<int> indices;                       ///< Candidate indices of getSubset()
+
+    /** @brief Refills the buffer with the next block of the generator's sequence. */
+    void refill() {
+        generator->fill(buffer.data(), BUFFER_WORDS);
+        position = 0;
+    }
+
+    /** @brief Returns the next random word. */
+    std::uint32_t nextWord() {
+        if(position == BUFFER_WORDS)
+            refill();
+
+        return buffer[position++];
+    }
 
     /**
-     * @brief Ensures a coordinate stays within the defined [lower, upper] bounds.
-     * @param value The value to check.
-     * @return The clamped value.
+     * @brief Writes @p count uniformly distributed numbers in [0, 1].
+     * @param values Output array of @p count numbers.
+     * @param count Number of values to generate.
      */
-    double checkBounds(double value);
+    void uniforms(double* values, std::size_t count);
+
 public:
     /**
      * @brief Constructs a SolutionBuilder with specific space constraints.
      * @param dimensions Number of variables in the solution vector.
      * @param lower Minimum value for any given dimension.
      * @param upper Maximum value for any given dimension.
-     * @param seed Value used to initialize the Mersenne Twister generator.
+     * @param seed Value used to initialize the random number generator.
+     * @param generatorName Random number generator family (see RandomGenerator::create()).
+     * @throws std::invalid_argument if the generator name is unknown.
      */
-    SolutionBuilder(int dimensions, int lower, int upper, int seed)
+    SolutionBuilder(int dimensions, int lower, int upper, std::uint64_t seed, const std::string& generatorName = RandomGenerator::DEFAULT)
         : dimensions(dimensions),
           lower(lower),
-          upper(upper)
-    {
-        mt.init_genrand(seed);
+          upper(upper),
+          seed(seed),
+          generatorName(generatorName),
+          generator(RandomGenerator::create(generatorName, seed))
+    {}
+
+    /**
+     * @brief Creates a builder over the same space with an independent random stream.
+     *
+     * The stream's seed is derived from this builder's seed and @p stream
+     * (see RandomGenerator::deriveSeed()), so it does not depend on how much
+     * of this builder's stream has been consumed.
+     *
+     * @param stream Index of the sub-stream.
+     */
+    SolutionBuilder substream(std::uint64_t stream) const {
+        return SolutionBuilder(dimensions, lower, upper, RandomGenerator::deriveSeed(seed, stream), generatorName);
     }
 
     /**
@@ -59,37 +108,92 @@ public:
     std::vector<double> getRand();
 
     /**
-     * @brief Generates a set of neighboring solutions around a central point.
+     * @brief Writes a single random solution within bounds into @p solution.
+     * @param solution Output array of @ref dimensions coordinates.
+     */
+    void getRand(double* solution);
+
+    /**
+     * @brief Writes a set of neighboring solutions into a contiguous block.
      *
-     * Used primarily by Local Search algorithms to explore the immediate vicinity 
-     * of the current best candidate.
+     * Neighbors are stored in row-major order (neighbor @c i starts at
+     * `neighbors + i * dimensions`), ready for Problem::evaluateBatch().
      *
      * @param center The original solution vector to perturb.
      * @param numNeighbors Number of neighbor vectors to generate.
      * @param maxDelta The maximum step size allowed for perturbation in any dimension.
-     * @return A collection of neighboring solution vectors.
+     * @param neighbors Output array of `numNeighbors * dimensions` coordinates.
+     */
+    void getNeighbors(
+        const double* center,
+        int numNeighbors,
+        double maxDelta,
+        double* neighbors
+    );
+
+    /**
+     * @brief Fills a neighborhood buffer with solutions around a central point.
+     *
+     * Used primarily by Local Search algorithms to explore the immediate vicinity 
+     * of the current best candidate. The buffer is reshaped to
+     * `numNeighbors x dimensions`, reusing its storage when possible.
+     *
+     * @param center The original solution to perturb (@ref dimensions coordinates).
+     * @param numNeighbors Number of neighbor vectors to generate.
+     * @param maxDelta The maximum step size allowed for perturbation in any dimension.
+     * @param neighbors Buffer receiving the neighboring solutions.
      */
-    std::vector<std::vector<double>> getNeighbors(
-        const std::vector<double>& center,
+    void getNeighbors(
+        const double* center,
         int numNeighbors,
-        double maxDelta
+        double maxDelta,
+        Population& neighbors
     );
 
+    /**
+     * @brief Fills every row of @p population with a random solution.
+     * @param population Buffer whose rows are overwritten.
+     */
+    void getRand(Population& population);
+
     /** @brief Returns the dimensionality of the solution space. */
     double getDimensions() { return dimensions; }
 
     /**
-     * @brief Generates a subset of unique solutions form given population.
+     * @brief Selects distinct random population indices, excluding @p source.
+     *
+     * Indices are written to @p subset rather than copying solutions, so
+     * callers read the selected rows in place. Requires
+     * `subsetSize < populationSize`.
      *
-     * @param population Initial population from which subset is selected.
-     * @param subsetSize Number of solutions to include in returned subset.
-     * @return A collection of unique solutions from initial population.
+     * @param populationSize Number of solutions in the population.
+     * @param subsetSize Number of indices to select.
+     * @param source Index which must not be selected (e.g. the target vector).
+     * @param subset Output array of @p subsetSize indices.
      */
-    std::vector<std::vector<double>> getSubset(
-        const std::vector<std::vector<double>>& population,
+    void getSubset(
+        int populationSize,
         int subsetSize,
-        int source
+        int source,
+        int* subset
     );
+
+    /** @return A uniformly distributed random number in [0, 1). */
+    double randNum() { return nextWord() * (1.0 / 4294967296.0); }
+
+    /**
+     * @brief Generates a random integer in [low, high).
+     * @param low Inclusive lower bound.
+     * @param high Exclusive upper bound.
+     */
+    int randNum(int low, int high) { return low + nextWord() % (high - low); }
+
+    /**
+     * @brief Ensures a coordinate stays within the defined [lower, upper] bounds.
+     * @param value The value to check.
+     * @return The clamped value.
+     */
+    double checkBounds(double value);
 };
 
 #endif
@@ -0,0 +1,83 @@
+/**
+ * @file Sweep.h
+ * @author Alex Buckley
+ * @ingroup Core
+ * @brief Lazily expanded list of the experiments of a benchmark.
+ */
+
+
+#ifndef SWEEP_H
+#define SWEEP_H
+
+#include <cstddef>
+#include <string>
+#include <vector>
+
+#include <External/json.hpp>
+
+#include "Config.h"
+
+
+/**
+ * @class Sweep
+ * @brief The experiments of a benchmark.json, expanded one at a time on demand.
+ *
+ * A benchmark.json either lists every experiment in an "experiments" array,
+ * or describes them compactly with a "sweep" object:
+ *
+ * @code{.json}
+ * "sweep": {
+ *     "templates": [{"template_name": "Schwefel", "upper_bound": 512.0, "lower_bound": -512.0, "problem_type": 1}],
+ *     "dimensions": [10, 20],
+ *     "optimizers": [{"name": "blind", "type": "blind", "iterations": 200}],
+ *     "seeds": {"begin": 100, "step": 1, "count": 30},
+ *     "generator": "mt19937"
+ * }
+ * @endcode
+ *
+ * A sweep holds the Cartesian product template x dimension x optimizer x seed
+ * in that order (seeds varying fastest), and experiment @c i is computed from
+ * its index without expanding the others. An optional `"select": {"start", "step"}`
+ * object restricts either form to every @c step-th experiment from @c start,
+ * which is how a benchmark is split into shards.
+ */
+class Sweep {
+private:
+    nlohmann::json experiments;         ///< Explicit experiment list (empty for a sweep)
+    nlohmann::json templates;           ///< Experiment templates (sweep only)
+    nlohmann::json optimizers;          ///< Optimizer definitions (sweep only)
+    std::vector<int> dimensions;        ///< Dimension axis (sweep only)
+    long long seedBegin = 0;            ///< First seed (sweep only)
+    long long seedStep = 0;             ///< Seed increment between runs (sweep only)
+    std::size_t seedCount = 0;          ///< Seeds per combination (sweep only)
+    std::string generator;              ///< Random number generator of every experiment (sweep only)
+    bool isSweep = false;               ///< Whether experiments are described by a sweep
+
+    std::size_t start = 0;              ///< First selected experiment
+    std::size_t step = 1;               ///< Distance between selected experiments
+    std::size_t total = 0;              ///< Number of experiments before selection
+
+    /** @brief Builds the benchmark.json entry of experiment @p index of the full sweep. */
+    nlohmann::json expand(std::size_t index) const;
+
+public:
+    /**
+     * @brief Reads the experiments of a parsed benchmark.json.
+     * @param config The benchmark.json document.
+     * @throws std::invalid_argument if it holds neither an "experiments" array nor a "sweep" object.
+     */
+    explicit Sweep(const nlohmann::json& config);
+
+    Sweep() = default;
+
+    /** @return Number of (selected) experiments. */
+    std::size_t size() const;
+
+    /**
+     * @brief Returns the configuration of a (selected) experiment.
+     * @param index Position of the experiment, in [0, size()).
+     */
+    ExperimentConfig at(std::size_t index) const;
+};
+
+#endif
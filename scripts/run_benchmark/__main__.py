@@ -7,7 +7,14 @@ import sys
 
 from .load_data import load_benchmark_data
 from .models import Benchmark, Experiment
-from .run_experiments import run_benchmark
+from .run_experiments import run_benchmark, resume_benchmark, run_sharded_benchmark
+from .adaptive import run_adaptive_benchmark
+from .racing import run_tuning
+from .coordinator import run_coordinator, parse_address, DEFAULT_PORT, LEASE_TIMEOUT
+from .worker import run_worker
+from .progress import ProgressMonitor
+from .cache import ResultCache, DEFAULT_CACHE_DIR, DEFAULT_CACHE_SIZE_MB
+from .result_files import FITNESS_FILE, FITNESS_BINARY_FILE, TIMES_FILE, METRICS_FILE
 from .build_results import build_result
 
 
@@ -43,6 +50,131 @@ def parse_args() -> argparse.Namespace:
         help="Output directory (relative to CWD)"
     )
 
+    # Number of experiments executed concurrently by the benchmark program
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run N experiments in parallel (0 = one per CPU core)"
+    )
+
+    # Storage format for per-iteration convergence data
+    parser.add_argument(
+        "--format",
+        choices=["csv", "binary"],
+        default="csv",
+        help="Write convergence data as best_fitnesses.csv or as binary best_fitnesses.bin (full precision)"
+    )
+
+    # Split experiments across several independent benchmark processes
+    parser.add_argument(
+        "--shards",
+        type=int,
+        metavar="N",
+        help="Split experiments into N shards run as separate processes and merge the results"
+    )
+
+    parser.add_argument(
+        "--shard-ids",
+        type=lambda s: [int(i) for i in s.split(",")],
+        metavar="I,J,...",
+        help="Only run the listed shards (e.g. to split shards across machines)"
+    )
+
+    parser.add_argument(
+        "--shard-workers",
+        type=int,
+        metavar="N",
+        help="Number of shards run concurrently (defaults to one per CPU core)"
+    )
+
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Times a failed shard (or distributed experiment) is retried before giving up"
+    )
+
+    # Skip experiments that already have results from a previous (interrupted) run
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Only run experiments without results in the output directory and merge with existing results"
+    )
+
+    # Reuse results of identical experiments from earlier benchmarks
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_CACHE_DIR,
+        metavar="DIR",
+        help=f"Reuse cached experiment results and cache new ones (default DIR: {DEFAULT_CACHE_DIR})"
+    )
+
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE_MB,
+        metavar="MB",
+        help="Disk budget of the result cache; least recently used results are evicted beyond it"
+    )
+
+    # Copy the benchmark program's progress events for external monitoring
+    parser.add_argument(
+        "--progress-log",
+        type=Path,
+        metavar="FILE",
+        help="Write the JSON progress events of the benchmark program to FILE (not with --shards or --serve)"
+    )
+
+    # Distribute experiments to workers on other machines through a work queue
+    parser.add_argument(
+        "--serve",
+        type=parse_address,
+        nargs="?",
+        const=("", DEFAULT_PORT),
+        metavar="[HOST:]PORT",
+        help=f"Serve experiments to --worker processes instead of running them (default port: {DEFAULT_PORT})"
+    )
+
+    parser.add_argument(
+        "--worker",
+        metavar="URL",
+        help="Run experiments leased from the coordinator at URL (e.g. http://host:8765), --jobs at a time"
+    )
+
+    parser.add_argument(
+        "--lease-timeout",
+        type=float,
+        default=LEASE_TIMEOUT,
+        metavar="SECONDS",
+        help="Seconds without a heartbeat before a worker's experiments are reassigned"
+    )
+
+    # Figure rendering
+    parser.add_argument(
+        "--plot-workers",
+        type=int,
+        metavar="N",
+        help="Number of processes rendering figures (defaults to one per CPU core)"
+    )
+
+    parser.add_argument(
+        "--draft",
+        action="store_true",
+        help="Render figures at low resolution for faster iteration"
+    )
+
+    # Write every experiment to benchmark.json instead of the compact sweep specification
+    parser.add_argument(
+        "--expand",
+        action="store_true",
+        help="Write benchmark.json as the full list of experiments rather than a compact sweep"
+    )
+
     # Do not produce plots/documents, only raw data and full experiment configuration file
     parser.add_argument(
         "--run-only",
@@ -50,7 +182,15 @@ def parse_args() -> argparse.Namespace:
         help="Run experiments up to raw data generation (do not build plots)"
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+
+    if args.resume and args.shards:
+        parser.error("--resume cannot be combined with --shards (sharded runs already skip completed shards)")
+
+    if args.serve and (args.shards or args.resume or args.cache):
+        parser.error("--serve cannot be combined with --shards, --resume or --cache (the work queue already resumes)")
+
+    return args
 
 
 
@@ -68,16 +208,26 @@ def load_config(config_file: Path) -> Benchmark:
     except Exception as e:
         sys.exit(f"Unexpected error loading benchmark config: {e}")
 
-    print(f'\n\nSuccessfully loaded {len(benchmark.experiments)} experiments from {config_file}  \n')
+    print(f'\n\nSuccessfully loaded {benchmark.num_experiments} experiments from {config_file}  \n')
     return benchmark
 
 
+def fitness_file(benchmark_dir: Path) -> Path:
+    # Prefer binary convergence data when present
+    binary_path = benchmark_dir / FITNESS_BINARY_FILE
+    return binary_path if binary_path.exists() else benchmark_dir / FITNESS_FILE
+
+
 def load_result_data(benchmark_dir: Path) -> pd.DataFrame:
+    # Metrics are only written by instrumented builds
+    metrics_path = benchmark_dir / METRICS_FILE
+
     try: # Attempt to parse and load benchmark results
         data: pd.DataFrame = load_benchmark_data(
-            benchmark_dir / "best_fitnesses.csv",
-            benchmark_dir / "times.csv",
-            benchmark_dir / "benchmark.json"
+            fitness_file(benchmark_dir),
+            benchmark_dir / TIMES_FILE,
+            benchmark_dir / "benchmark.json",
+            metrics_path if metrics_path.exists() else None,
         )
 
     except (FileNotFoundError, pd.errors.ParserError, ValueError) as e:
@@ -88,7 +238,7 @@ def load_result_data(benchmark_dir: Path) -> pd.DataFrame:
 
     return data
 
-def analyze_run(path_arg: Path) -> None:
+def analyze_run(path_arg: Path, workers: int | None = None, draft: bool = False) -> None:
     # Attempt to load results directory
     print(f"\nLoading benchmark result data from {path_arg}")
     path_arg = path_arg.resolve(strict=False)
@@ -98,7 +248,7 @@ def analyze_run(path_arg: Path) -> None:
         sys.exit(f"Error: Analyze path is not a directory or does not exist: {path_arg}")
 
     # Ensure experiment result files exists
-    required_files = ["benchmark.json", "best_fitnesses.csv", "times.csv"]
+    required_files = ["benchmark.json", fitness_file(path_arg).name, TIMES_FILE]
     missing_files = [f for f in required_files if not (path_arg / f).exists()]
 
     # Display missing files
@@ -109,7 +259,7 @@ def analyze_run(path_arg: Path) -> None:
     data = load_result_data(path_arg)
 
     # Build and save experiment results
-    build_result(data, path_arg)
+    build_result(data, path_arg, workers=workers, draft=draft)
     print(f"Analysis complete for {path_arg}")
 
 
@@ -118,7 +268,11 @@ def main():
     args: argparse.Namespace = parse_args()
 
     if(args.analyze):
-        analyze_run(args.analyze)
+        analyze_run(args.analyze, workers=args.plot_workers, draft=args.draft)
+        sys.exit(0)
+
+    if args.worker:
+        run_worker(args.worker, slots=args.jobs)
         sys.exit(0)
 
     # Load file paths from command line args
@@ -134,18 +288,71 @@ def main():
 
     # Write validated config to json
     benchmark_path = benchmark_dir / "benchmark.json"
-    benchmark_path.write_text(benchmark.to_json(), encoding="utf-8")
+    benchmark_path.write_text(benchmark.to_json(expand=args.expand), encoding="utf-8")
 
     # Display path to validated experiment config
     print(f'\nFinal experiment configuration for {benchmark.benchmark_name} written to {benchmark_path}')
 
+    # Open result cache if enabled
+    cache = ResultCache(args.cache, args.cache_size << 20) if args.cache else None
+
+    # Adaptive and tuning runs decide what to run next as results come in
+    if (benchmark.adaptive or benchmark.tuning) and (args.serve or args.shards or args.resume):
+        sys.exit("Error: adaptive seeds and tuning cannot be combined with --serve, --shards or --resume")
+
     # Execute benchmark program
-    run_benchmark(benchmark_path, benchmark_dir)
+    if benchmark.tuning:
+        run_tuning(
+            benchmark_path, benchmark_dir, benchmark.tuning,
+            jobs=args.jobs, result_format=args.format, cache=cache, progress=ProgressMonitor(args.progress_log),
+        )
+    elif benchmark.adaptive:
+        run_adaptive_benchmark(
+            benchmark_path, benchmark_dir, benchmark.adaptive,
+            jobs=args.jobs, result_format=args.format, cache=cache, progress=ProgressMonitor(args.progress_log),
+        )
+    elif args.serve:
+        complete = run_coordinator(
+            benchmark_path,
+            benchmark_dir,
+            args.serve,
+            retries=args.retries,
+            lease_timeout=args.lease_timeout,
+            result_format=args.format,
+        )
+
+        if not complete:
+            sys.exit("Distributed benchmark incomplete; re-run the same command to retry failed experiments.")
+    elif args.shards:
+        complete = run_sharded_benchmark(
+            benchmark_path,
+            benchmark_dir,
+            args.shards,
+            workers=args.shard_workers,
+            shard_ids=args.shard_ids,
+            retries=args.retries,
+            jobs=args.jobs,
+            result_format=args.format,
+            cache=cache,
+        )
+
+        if not complete:
+            sys.exit("Sharded benchmark incomplete; re-run the same command to resume pending shards.")
+    elif args.resume:
+        resume_benchmark(
+            benchmark_path, benchmark_dir,
+            jobs=args.jobs, result_format=args.format, cache=cache, progress=ProgressMonitor(args.progress_log),
+        )
+    else:
+        run_benchmark(
+            benchmark_path, benchmark_dir,
+            jobs=args.jobs, result_format=args.format, cache=cache, progress=ProgressMonitor(args.progress_log),
+        )
     
 
     print( # Display paths to benchmark results
         f"\nRaw fitness and execution time values written to "
-        f"{benchmark_dir / 'best_fitness.csv'} and {benchmark_dir / 'times.csv'}"
+        f"{fitness_file(benchmark_dir)} and {benchmark_dir / TIMES_FILE}"
     )
 
     if args.run_only:
@@ -156,7 +363,7 @@ def main():
     data: pd.DataFrame = load_result_data(benchmark_dir)
 
     # Create and save plots
-    build_result(data, benchmark_dir)
+    build_result(data, benchmark_dir, workers=args.plot_workers, draft=args.draft)
 
     
 
@@ -0,0 +1,182 @@
+"""
+Adaptive seed allocation (see models/adaptive.py).
+
+Instead of running every seed of every template × dimension × optimizer
+cell, seeds are run in rounds, and a cell stops receiving seeds once the
+confidence interval of its best_mean (or the ranking of the optimizers it
+is compared with) has converged. Every cell uses the first seeds of the
+benchmark in order, so its results are those a fixed benchmark with as many
+runs would produce.
+
+Each round is an ordinary benchmark run in output_dir/rounds; the rounds
+are merged into output_dir in the order of benchmark.json once the last one
+has finished.
+"""
+
+import numpy as np
+
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional
+import json
+import shutil
+
+from .cache import ResultCache
+from .curves import aggregate_curves
+from .load_data import load_fitness_curves
+from .models import AdaptiveSeeds
+from .progress import ProgressMonitor
+from .result_files import FITNESS_BINARY_FILE, FITNESS_FILE, TIMES_FILE, completed_experiments
+from .run_experiments import compact_results, run_benchmark
+from .stats import confidence_half_width
+from .sweep import iter_experiments, with_experiments
+
+
+ROUNDS_DIR = "rounds"
+
+
+class Cell:
+    """Runs of one template × dimension × optimizer combination."""
+
+    def __init__(self, group: tuple[str, int]):
+        self.group = group                  # (template, dimensions) the optimizer is ranked in
+        self.experiments: list[dict] = []   # Every seed, in run order
+        self.bests: list[float] = []        # Best fitness of each finished run
+        self.scheduled = 0                  # Seeds run so far
+        self.active = True
+
+    def mean(self) -> float:
+        return float(np.mean(self.bests)) if self.bests else np.nan
+
+    def half_width(self, confidence: float) -> float:
+        return confidence_half_width(np.asarray(self.bests), confidence)
+
+    def converged(self, settings: AdaptiveSeeds) -> bool:
+        return self.half_width(settings.confidence) <= max(settings.abs_tolerance, settings.tolerance * abs(self.mean()))
+
+
+def build_cells(config: dict) -> dict[str, Cell]:
+    """Group the experiments of a benchmark.json into cells, keyed by experiment name without seed."""
+    cells: dict[str, Cell] = {}
+
+    for experiment in iter_experiments(config):
+        name = experiment["experiment_name"].rsplit("_seed", 1)[0]
+        template = name.rsplit(f"_{experiment['optimizer']['name']}_dim", 1)[0]
+
+        cell = cells.setdefault(name, Cell((template, experiment["dimensions"])))
+        cell.experiments.append(experiment)
+
+    return cells
+
+
+def read_bests(directory: Path) -> dict[str, list[float]]:
+    """Best fitness of every finished run in a results directory, per cell."""
+    binary_path = directory / FITNESS_BINARY_FILE
+    fitness_path = binary_path if binary_path.exists() else directory / FITNESS_FILE
+
+    experiments, curves = load_fitness_curves(fitness_path, set(completed_experiments(directory / TIMES_FILE)))
+    stats = aggregate_curves(curves, np.zeros(len(curves), dtype=np.int64), 1)
+
+    bests = defaultdict(list)
+    for name, best in zip(experiments, stats.best):
+        bests[name].append(float(best))
+
+    return bests
+
+
+def ranking_resolved(cells: list[Cell], settings: AdaptiveSeeds) -> bool:
+    """Whether every pair of neighbours in the ranking of `cells` by best_mean is resolved."""
+    if len(cells) == 1: # Nothing to rank against
+        return cells[0].converged(settings)
+
+    ranked = sorted(cells, key=Cell.mean)
+
+    for better, worse in zip(ranked, ranked[1:]):
+        separated = better.mean() + better.half_width(settings.confidence) < worse.mean() - worse.half_width(settings.confidence)
+
+        if not separated and not (better.converged(settings) and worse.converged(settings)):
+            return False
+
+    return True
+
+
+def update_active(cells: dict[str, Cell], settings: AdaptiveSeeds) -> None:
+    """Stop cells whose statistics converged or whose seeds are used up."""
+    if settings.criterion == "ranking":
+        groups = defaultdict(list)
+        for cell in cells.values():
+            groups[cell.group].append(cell)
+
+        for group in groups.values():
+            if ranking_resolved(group, settings):
+                for cell in group:
+                    cell.active = False
+    else:
+        for cell in cells.values():
+            if cell.converged(settings):
+                cell.active = False
+
+    for cell in cells.values():
+        if cell.scheduled >= len(cell.experiments):
+            cell.active = False
+
+
+def run_adaptive_benchmark(
+    config_path: Path,
+    output_dir: Path,
+    settings: AdaptiveSeeds,
+    jobs: int = 1,
+    result_format: str = "csv",
+    cache: Optional[ResultCache] = None,
+    progress: Optional[ProgressMonitor] = None,
+) -> None:
+    """
+    Run a benchmark in rounds of seeds until every cell has converged or used
+    all of its seeds, then write the results of every run to output_dir.
+    """
+    config = json.loads(config_path.read_text(encoding="utf-8"))
+    cells = build_cells(config)
+    total = sum(len(cell.experiments) for cell in cells.values())
+
+    rounds_dir = output_dir / ROUNDS_DIR
+    shutil.rmtree(rounds_dir, ignore_errors=True)
+    round_dirs = []
+
+    try:
+        while any(cell.active for cell in cells.values()):
+            # The first round gives every cell min_runs seeds
+            size = settings.round_runs if round_dirs else settings.min_runs
+            scheduled = []
+
+            for cell in cells.values():
+                if cell.active:
+                    scheduled.extend(cell.experiments[cell.scheduled:cell.scheduled + size])
+                    cell.scheduled = min(cell.scheduled + size, len(cell.experiments))
+
+            directory = rounds_dir / f"round_{len(round_dirs):03d}"
+            directory.mkdir(parents=True)
+            round_config = directory / "benchmark.json"
+            round_config.write_text(json.dumps(with_experiments(config, scheduled), indent=2), encoding="utf-8")
+
+            round_dirs.append(directory)
+            run_benchmark(round_config, directory, jobs=jobs, result_format=result_format, cache=cache, progress=progress)
+
+            for name, bests in read_bests(directory).items():
+                cells[name].bests.extend(bests)
+
+            update_active(cells, settings)
+
+            print(
+                f"\nAdaptive seeds: round {len(round_dirs)} ran {len(scheduled)} experiments, "
+                f"{sum(not cell.active for cell in cells.values())} of {len(cells)} cells converged or complete"
+            )
+    finally:
+        # Keep the results of every finished round, in the order of the full benchmark
+        round_dirs = [d for d in round_dirs if (d / TIMES_FILE).exists()]
+        finished = set().union(*(completed_experiments(d / TIMES_FILE) for d in round_dirs))
+        names = [exp["experiment_name"] for cell in cells.values() for exp in cell.experiments]
+
+        compact_results(round_dirs, output_dir, [name for name in names if name in finished])
+        shutil.rmtree(rounds_dir, ignore_errors=True)
+
+    print(f"Adaptive seeds: ran {len(finished)} of {total} experiments ({len(finished) / max(total, 1):.0%})")
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+from io import StringIO
+from pathlib import Path
+from typing import Sequence, Union
+
+from .result_files import read_complete_lines
+
+
+# Must match ResultWriter::binaryMagic / binaryHeaderSize
+BINARY_MAGIC = b"NOBF64v1"
+HEADER_SIZE = 16
+
+
+def index_path_for(bin_path: Union[str, Path]) -> Path:
+    """Return the offsets index (.idx) belonging to a binary fitness file."""
+    return Path(bin_path).with_suffix(".idx")
+
+
+def read_fitness_binary(bin_path: Union[str, Path]) -> tuple[pd.DataFrame, np.ndarray]:
+    """
+    Memory-map a best_fitnesses.bin file and load its offsets index.
+
+    Returns
+    -------
+    index : pd.DataFrame
+        Columns: experiment, offset, length (offsets are in float64 values)
+    values : np.ndarray
+        Read-only float64 view over the whole value block. Curves are slices
+        `values[offset:offset + length]` and are not copied into memory.
+
+    Files of an unfinished run are read up to the last fully written curve.
+    """
+    bin_path = Path(bin_path)
+
+    with open(bin_path, "rb") as f:
+        header = f.read(HEADER_SIZE)
+
+    if header[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+        raise ValueError(f"{bin_path} is not a binary fitness file")
+
+    index = pd.read_csv(
+        StringIO("".join(read_complete_lines(index_path_for(bin_path)))),
+        dtype={"offset": np.int64, "length": np.int64},
+    )
+
+    # Only map whole values; a crash may leave a partially written one
+    num_values = (bin_path.stat().st_size - HEADER_SIZE) // np.dtype(np.float64).itemsize
+
+    # np.memmap cannot map an empty region
+    if num_values == 0:
+        values = np.empty(0, dtype=np.float64)
+    else:
+        values = np.memmap(bin_path, dtype=np.float64, mode="r", offset=HEADER_SIZE, shape=(num_values,))
+
+    # Values are written before their index line, but guard against a torn file
+    index = index[index["offset"] + index["length"] <= num_values]
+
+    return index, values
+
+
+def write_fitness_binary(
+    bin_path: Union[str, Path],
+    names: Sequence[str],
+    curves: Sequence[np.ndarray],
+) -> None:
+    """Write convergence curves in the binary format produced by the benchmark program."""
+    bin_path = Path(bin_path)
+    offset = 0
+
+    with open(bin_path, "wb") as values, open(index_path_for(bin_path), "w") as index:
+        values.write(BINARY_MAGIC.ljust(HEADER_SIZE, b"\0"))
+        index.write("experiment,offset,length\n")
+
+        for name, curve in zip(names, curves):
+            curve = np.asarray(curve, dtype=np.float64)
+            values.write(curve.tobytes())
+            index.write(f"{name},{offset},{len(curve)}\n")
+            offset += len(curve)
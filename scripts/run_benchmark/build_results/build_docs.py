@@ -13,7 +13,7 @@ def build_summary_table(
     Write a single LaTeX table summarizing best-fitness statistics per experiment.
 
     Rows: one per experiment
-    Columns: mean, median, std, min-max (best fitness over seeds)
+    Columns: seeds, mean, median, std, min-max (best fitness over seeds)
 
     Returns
     -------
@@ -40,9 +40,9 @@ def build_summary_table(
         r"\begin{table}[htbp]",
         r"\centering",
         r"\small",
-        r"\begin{tabular}{lllrcccc}",
+        r"\begin{tabular}{lllrrcccc}",
         r"\toprule",
-        r"Problem & Dim & Optimizer & Mean & Median & Std & Min--Max \\",
+        r"Problem & Dim & Optimizer & Seeds & Mean & Median & Std & Min--Max \\",
         r"\midrule",
     ])
 
@@ -53,10 +53,11 @@ def build_summary_table(
 
     for _, row in df_sorted.iterrows():
         lines.append(
-            " {} & {} & {} & {} & {} & {} & [{} , {}] \\\\".format(
+            " {} & {} & {} & {} & {} & {} & {} & [{} , {}] \\\\".format(
                 esc(row["problem_name"]),
                 int(row["dimensions"]),
                 esc(row["optimizer_type"]),
+                int(row["n_seeds"]),
                 fmt(row["best_mean"]),
                 fmt(row["best_median"]),
                 fmt(row["best_std"]),
@@ -68,7 +69,7 @@ def build_summary_table(
     lines.extend([
         r"\bottomrule",
         r"\end{tabular}",
-        r"\caption{Summary statistics of best fitness values over 30 independent runs per experiment.}",
+        r"\caption{Summary statistics of best fitness values over the independent runs (seeds) of each experiment.}",
         rf"\label{{{label}}}",
         r"\end{table}",
         "",
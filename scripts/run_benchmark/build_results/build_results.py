@@ -6,46 +6,60 @@ from pathlib import Path
 from ..models import Benchmark, Experiment
 
 from . import plot_builder, build_docs
+from .figure_cache import FigureJob, render_figures
 
 
 from pathlib import Path
+from typing import Optional
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
-def plot_execution_times(df: pd.DataFrame, plot_dir: Path, tex_dir: Path) -> None:
+
+DRAFT_DPI = 72  # Resolution of all figures in draft mode
+
+
+def render_execution_times(data: pd.DataFrame, dim: int, save_path: Path, dpi: Optional[int] = None) -> None:
+    # Create plot
+    plt.figure(figsize=(12, 6))
+    sns.barplot(
+        data=data,
+        x='problem_name',
+        y='execution_time',
+        hue='optimizer_type',
+        palette='Set2'
+    )
+    
+    # Label plot
+    plt.title(f'Execution Time for {dim} Dimensions')
+    plt.xlabel('Problem Name')
+    plt.ylabel('Execution Time (s)')
+    plt.legend(title='Optimizer')
+    plt.xticks(rotation=45)
+    plt.tight_layout()
+
+    # Save plot
+    plt.savefig(save_path, dpi=dpi)
+    plt.close()
+
+
+def execution_time_figures(
+    df: pd.DataFrame,
+    plot_dir: Path,
+    tex_dir: Path,
+    dpi: Optional[int] = None,
+) -> list[FigureJob]:
     plot_dir.mkdir(parents=True, exist_ok=True)
+    jobs = []
     
     # Make the plots for each dimension
     for dim in sorted(df['dimensions'].unique()):
         # Get dimension vlue
         df_dim = df[df['dimensions'] == dim]
-        
-        # Create plot
-        plt.figure(figsize=(12, 6))
-        sns.barplot(
-            data=df_dim,
-            x='problem_name',
-            y='execution_time',
-            hue='optimizer_type',
-            palette='Set2'
-        )
-        
-        # Label plot
-        plt.title(f'Execution Time for {dim} Dimensions')
-        plt.xlabel('Problem Name')
-        plt.ylabel('Execution Time (s)')
-        plt.legend(title='Optimizer')
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        
+
         # define path name
         filename = f'execution_time_{dim}d'
-        save_path = plot_dir / filename
-
-        # Save plot
-        plt.savefig(f'{save_path}.png')
-        plt.close()
+        save_path = plot_dir / f'{filename}.png'
 
         caption = (
             f"Execution time for {dim}-dimensions: "
@@ -53,16 +67,21 @@ def plot_execution_times(df: pd.DataFrame, plot_dir: Path, tex_dir: Path) -> Non
             "Repeated Local Search across different functions."
         )
 
-        # Create label
-        label = f"fig:{filename}"
-
-        # Create LaTeX figure
-        build_docs.write_latex_figure(
+        jobs.append(FigureJob(
+            render=render_execution_times,
+            kwargs={
+                "data": df_dim[['problem_name', 'execution_time', 'optimizer_type']].reset_index(drop=True),
+                "dim": dim,
+                "save_path": save_path,
+                "dpi": dpi,
+            },
+            image_path=save_path,
             tex_path=tex_dir / f'{filename}.tex',
-            image_path=save_path.relative_to(tex_dir.parent),
             caption=caption,
-            label=label,
-        )
+            label=f"fig:{filename}",
+        ))
+
+    return jobs
 
 
 
@@ -129,11 +148,14 @@ def resample_to_x(y, x):
     return np.interp(new_x, old_x, y)
 
 
-def plot_fitness_curves(
+def fitness_curve_figures(
     df: pd.DataFrame,
     plot_dir: Path,
     tex_dir: Path,
-) -> None:
+    dpi: int = 300,
+) -> list[FigureJob]:
+    jobs = []
+
     # Group experiments by problem type and dimension
     grouped = df.groupby(["problem_name", "dimensions"])
 
@@ -153,46 +175,50 @@ def plot_fitness_curves(
         image_path = plot_dir / f"{filename}.png"
 
 
-        # Build plot
-        plot_builder.build_line_plot(
-            x,
-            [
-                blind["fitness_curve_mean"],
-                resample_to_x(repeated["fitness_curve_mean"], x)
-            ],
-            [
-                "Blind Search",
-                "Repeated Local Search",
-            ],
-            plot_dir,
-            filename,
-            f'{blind["problem_name"]} {blind["dimensions"]}-Dimensioned Convergence Speed',
-            "Iterations",
-            "Best Fitness Found",
-        )
-
         caption = (
             f"{problem_name} "
             "convergence speed comparison between Blind Search and "
             f"Repeated Local Search with {dimensions}-Dimensions."
         )
 
-        # Create label
-        label = f"fig:{filename}"
-
-        # Create LaTeX figure
-        build_docs.write_latex_figure(
+        # Build plot
+        jobs.append(FigureJob(
+            render=plot_builder.build_line_plot,
+            kwargs={
+                "x": x,
+                "ys": [
+                    np.asarray(blind["fitness_curve_mean"]),
+                    resample_to_x(repeated["fitness_curve_mean"], x)
+                ],
+                "labels": [
+                    "Blind Search",
+                    "Repeated Local Search",
+                ],
+                "save_dir": plot_dir,
+                "filename": f"{filename}.png",
+                "title": f'{blind["problem_name"]} {blind["dimensions"]}-Dimensioned Convergence Speed',
+                "xlabel": "Iterations",
+                "ylabel": "Best Fitness Found",
+                "dpi": dpi,
+            },
+            image_path=image_path,
             tex_path=tex_dir / f"{filename}.tex",
-            image_path=image_path.relative_to(tex_dir.parent),
             caption=caption,
-            label=label,
-        )
+            label=f"fig:{filename}",
+        ))
+
+    return jobs
 
 
 
 
 
-def build_result(df: pd.DataFrame, result_dir: Path):
+def build_result(
+    df: pd.DataFrame,
+    result_dir: Path,
+    workers: Optional[int] = None,
+    draft: bool = False,
+):
     # Define and create output directories
     tex_dir = result_dir / 'docs'
     fig_dir = tex_dir / 'figures'
@@ -201,9 +227,15 @@ def build_result(df: pd.DataFrame, result_dir: Path):
     tab_dir = tex_dir / 'tables'
     tab_dir.mkdir(parents=True, exist_ok=True)
 
-    # Generate figures
-    plot_fitness_curves(df, plots_dir, fig_dir)
-    plot_execution_times(df, plots_dir, fig_dir)
+    # Collect figures; draft mode renders everything at low resolution
+    jobs = (
+        fitness_curve_figures(df, plots_dir, fig_dir, dpi=DRAFT_DPI if draft else 300)
+        + execution_time_figures(df, plots_dir, fig_dir, dpi=DRAFT_DPI if draft else None)
+    )
+
+    # Render figures whose data or styling changed, in parallel
+    rendered, skipped = render_figures(jobs, fig_dir, workers)
+    print(f'\nRendered {rendered} figure(s), {skipped} unchanged')
     build_docs.build_summary_table(
         df,
         tab_dir,
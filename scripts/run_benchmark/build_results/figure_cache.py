@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+import hashlib
+import inspect
+import json
+import os
+import sys
+
+from . import build_docs
+
+
+FINGERPRINT_FILE = "figure_fingerprints.json"
+
+
+@dataclass
+class FigureJob:
+    """
+    A figure to render and the LaTeX figure that includes it.
+
+    `render` must be a module-level function so it can run in a worker
+    process; it is called as `render(**kwargs)` and writes `image_path`.
+    """
+    render: Callable[..., None]
+    kwargs: dict[str, Any]
+    image_path: Path
+    tex_path: Path
+    caption: str
+    label: str
+    fingerprint: str = field(init=False, default="")
+
+
+def _update_digest(digest: "hashlib._Hash", value: Any) -> None:
+    """Feed a value into a digest by content (arrays and frames by their data)."""
+    if isinstance(value, np.ndarray):
+        digest.update(f"ndarray{value.dtype}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, pd.DataFrame):
+        digest.update(repr(list(value.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=False).values.tobytes())
+    elif isinstance(value, dict):
+        for key in sorted(value):
+            digest.update(repr(key).encode())
+            _update_digest(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"seq{len(value)}".encode())
+        for item in value:
+            _update_digest(digest, item)
+    else:
+        digest.update(repr(value).encode())
+
+
+def fingerprint(job: FigureJob) -> str:
+    """
+    Hash everything that determines a figure: its input data and options,
+    the source of the module drawing it (styling), and its LaTeX wrapper.
+    """
+    digest = hashlib.sha256()
+    module = sys.modules[job.render.__module__]
+
+    digest.update(job.render.__qualname__.encode())
+    digest.update(inspect.getsource(module).encode())
+    _update_digest(digest, job.kwargs)
+    _update_digest(digest, (str(job.image_path), str(job.tex_path), job.caption, job.label))
+
+    return digest.hexdigest()
+
+
+def _render(job: FigureJob) -> None:
+    job.render(**job.kwargs)
+
+
+def render_figures(
+    jobs: list[FigureJob],
+    cache_dir: Path,
+    workers: Optional[int] = None,
+) -> tuple[int, int]:
+    """
+    Render figures whose fingerprint changed since the last run, on a process
+    pool, and write their LaTeX figure files.
+
+    Fingerprints of rendered figures are stored in cache_dir; figures whose
+    PNG and .tex files still exist with an unchanged fingerprint are skipped.
+
+    Returns
+    -------
+    tuple[int, int]
+        Number of figures rendered and skipped.
+    """
+    cache_path = cache_dir / FINGERPRINT_FILE
+
+    try:
+        cache: dict[str, str] = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache = {}
+
+    # Select figures that are missing or out of date
+    stale = []
+    for job in jobs:
+        job.fingerprint = fingerprint(job)
+
+        unchanged = (
+            cache.get(str(job.image_path)) == job.fingerprint
+            and job.image_path.exists()
+            and job.tex_path.exists()
+        )
+
+        if not unchanged:
+            stale.append(job)
+
+    def finish(job: FigureJob) -> None:
+        build_docs.write_latex_figure(
+            tex_path=job.tex_path,
+            image_path=job.image_path.relative_to(job.tex_path.parent.parent),
+            caption=job.caption,
+            label=job.label,
+        )
+        cache[str(job.image_path)] = job.fingerprint
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(stale))
+
+    try:
+        if workers <= 1: # Serial rendering avoids process start-up for few figures
+            for job in stale:
+                _render(job)
+                finish(job)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(_render, job): job for job in stale}
+
+                for future in as_completed(futures):
+                    future.result()
+                    finish(futures[future])
+    finally:
+        # Record finished figures even if another one failed
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
+
+    return len(stale), len(jobs) - len(stale)
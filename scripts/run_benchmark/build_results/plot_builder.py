@@ -20,6 +20,7 @@ def build_histogram(
     color: str = 'lightgreen',
     bins: int = 10,
     figsize: tuple[int, int] = (6, 5),
+    dpi: int = 300,
 ) -> None:
     save_dir.mkdir(parents=True, exist_ok=True)
     save_path = save_dir / filename
@@ -80,7 +81,7 @@ def build_histogram(
     ax.set_title(title, fontsize=16, weight='bold')
     sns.despine(trim=True)
 
-    fig.savefig(save_path, dpi=300, bbox_inches='tight')
+    fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
     plt.close(fig)
 
 
@@ -96,6 +97,7 @@ def build_stat_bar(
     ylabel: Optional[str] = 'Value',
     figsize: tuple[int, int] = (12, 6),
     log_scale: bool = False,
+    dpi: int = 300,
 ) -> None:
     save_dir.mkdir(parents=True, exist_ok=True)
     save_path = save_dir / filename
@@ -137,7 +139,7 @@ def build_stat_bar(
 
     sns.despine(trim=True)
 
-    fig.savefig(save_path, dpi=300, bbox_inches='tight')
+    fig.savefig(save_path, dpi=dpi, bbox_inches='tight')
     plt.close(fig)
 
 def build_violin_plot(
@@ -148,6 +150,7 @@ def build_violin_plot(
     ylabel: str = "Fitness Value",
     figsize: tuple[int, int] = (4, 6),
     color: str = "lightgreen",
+    dpi: int = 300,
 ) -> None:
     save_dir.mkdir(parents=True, exist_ok=True)
     save_path = save_dir / filename
@@ -168,7 +171,7 @@ def build_violin_plot(
     ax.set_title(title, fontsize=16, weight="bold")
 
     sns.despine(trim=True)
-    fig.savefig(save_path, dpi=300, bbox_inches="tight")
+    fig.savefig(save_path, dpi=dpi, bbox_inches="tight")
     plt.close(fig)
 
 
@@ -186,6 +189,7 @@ def build_line_plot(
     linewidth: float = 2.5,
     markers: bool = False,
     log_y: bool = False,
+    dpi: int = 300,
 ) -> None:
     if len(ys) != len(labels):
         raise ValueError("ys and labels must have the same length")
@@ -217,5 +221,5 @@ def build_line_plot(
         ax.set_yscale("log")
 
     sns.despine(trim=True)
-    fig.savefig(save_path, dpi=300, bbox_inches="tight")
+    fig.savefig(save_path, dpi=dpi, bbox_inches="tight")
     plt.close(fig)
\ No newline at end of file
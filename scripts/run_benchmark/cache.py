@@ -0,0 +1,120 @@
+import numpy as np
+
+from pathlib import Path
+from typing import Optional, Union
+import hashlib
+import json
+import os
+import tempfile
+
+
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "numerical-benchmarks"
+DEFAULT_CACHE_SIZE_MB = 1024
+
+
+class ResultCache:
+    """
+    Content-addressed store of experiment results shared by all benchmarks.
+
+    Entries are keyed by a hash of the fully resolved experiment definition
+    (everything in benchmark.json except the experiment name, which depends on
+    the template it came from) and of the benchmark program itself, so a
+    result is reused by any benchmark running the same experiment with the
+    same build. Each entry holds the full-precision convergence curve, the
+    execution time and the reason the optimizer stopped.
+
+    The cache is kept within `max_bytes` by evicting the least recently used
+    entries; reading an entry refreshes its modification time.
+    """
+
+    def __init__(self, directory: Union[str, Path] = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_SIZE_MB << 20):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def build_id(exe: Union[str, Path]) -> str:
+        """Identify a build of the benchmark program by the hash of its contents."""
+        digest = hashlib.sha256()
+
+        with open(exe, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def key(experiment: dict, build_id: str) -> str:
+        """Hash an experiment definition (as written to benchmark.json) and a build id."""
+        definition = {k: v for k, v in experiment.items() if k != "experiment_name"}
+        payload = json.dumps(
+            {"version": CACHE_VERSION, "build": build_id, "experiment": definition},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.npz"
+
+    def get(self, key: str) -> Optional[tuple[np.ndarray, float, str]]:
+        """Return (curve, execution_time, stop_reason) for a cached experiment, or None on a miss."""
+        path = self.path_for(key)
+
+        try:
+            with np.load(path) as entry:
+                curve, runtime, stop_reason = entry["curve"], float(entry["runtime"]), str(entry["stop_reason"])
+        except (OSError, KeyError, ValueError): # Missing, evicted, or unreadable entry
+            return None
+
+        # Mark as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return curve, runtime, stop_reason
+
+    def put(self, key: str, curve: np.ndarray, runtime: float, stop_reason: str) -> None:
+        """Store an experiment result. Call evict() to bring the cache back within its budget."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a uniquely named temporary file so readers never see a partial
+        # entry, even when several threads or processes store the same key
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, curve=np.asarray(curve, dtype=np.float64), runtime=np.float64(runtime), stop_reason=np.str_(stop_reason))
+
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits its budget. Returns entries removed."""
+        entries = []
+        for path in self.directory.glob("*/*.npz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError: # Removed concurrently
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        return removed
@@ -0,0 +1,347 @@
+"""
+Coordinator of a benchmark distributed over many machines.
+
+The coordinator keeps every experiment of a benchmark.json in a durable
+SQLite queue and serves them over HTTP. Workers (see worker.py) on any host
+lease one experiment at a time, run it and push the result back, so fast
+and slow experiments balance themselves across machines. Leases are kept
+alive by heartbeats; an experiment whose worker stops sending them is
+returned to the queue and handed to another worker.
+
+Requests are JSON documents POSTed to /lease, /heartbeat, /result and
+/release; GET /status reports progress and throughput.
+"""
+
+import numpy as np
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator, Optional
+import base64
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from .run_experiments import clear_fitness_files, write_results
+from .sweep import experiment_at, experiment_names, with_experiments
+
+
+QUEUE_FILE = "queue.sqlite"
+DEFAULT_PORT = 8765
+LEASE_TIMEOUT = 60.0        # Seconds without a heartbeat before a job is reassigned
+HEARTBEAT_INTERVAL = 10.0   # Seconds between worker heartbeats
+THROUGHPUT_WINDOW = 60.0    # Seconds of completions averaged into the throughput
+DRAIN_TIME = 5.0            # Seconds idle workers are given to learn that the benchmark is done
+
+
+class JobQueue:
+    """
+    Durable queue of the experiments of one benchmark.
+
+    Each experiment is a job identified by its index in benchmark.json. A job
+    is *pending* until leased, *running* while a worker holds a lease on it,
+    and *done* once its result is stored. A job whose lease expires, or whose
+    worker releases it after a failed run, returns to *pending*, and becomes
+    *failed* after `max_attempts` attempts.
+
+    Jobs and results live in SQLite at `path`, so a restarted coordinator
+    continues where it stopped. The queue is rebuilt if benchmark.json
+    changed. All methods are thread-safe.
+    """
+
+    def __init__(self, path: Path, config: dict, max_attempts: int = 2, lease_timeout: float = LEASE_TIMEOUT):
+        self.config = config
+        self.max_attempts = max_attempts
+        self.lease_timeout = lease_timeout
+        self.started = time.time()
+        self.lock = threading.Lock()
+
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+
+        fingerprint = hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8")).hexdigest()
+
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = self.connection.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+
+            if row is None or row[0] != fingerprint:
+                self._create(fingerprint)
+            else: # A restarted coordinator retries experiments that failed before
+                self.connection.execute("UPDATE jobs SET state = 'pending', attempts = 0 WHERE state = 'failed'")
+
+    def _create(self, fingerprint: str) -> None:
+        for table in ("jobs", "results", "workers"):
+            self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+
+        self.connection.execute(
+            "CREATE TABLE jobs (id INTEGER PRIMARY KEY, name TEXT, state TEXT, worker TEXT,"
+            " deadline REAL, attempts INTEGER DEFAULT 0, finished REAL)"
+        )
+        self.connection.execute("CREATE INDEX jobs_state ON jobs (state, id)")
+        self.connection.execute("CREATE TABLE results (id INTEGER PRIMARY KEY, curve BLOB, runtime REAL, stop_reason TEXT)")
+        self.connection.execute("CREATE TABLE workers (name TEXT PRIMARY KEY, last_seen REAL, completed INTEGER DEFAULT 0)")
+
+        # Experiment names are streamed, so large sweeps are never expanded in memory
+        self.connection.executemany(
+            "INSERT INTO jobs (id, name, state) VALUES (?, ?, 'pending')",
+            enumerate(experiment_names(self.config)),
+        )
+        self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)", (fingerprint,))
+
+    def _seen(self, worker: str, completed: int = 0) -> None:
+        self.connection.execute(
+            "INSERT INTO workers (name, last_seen, completed) VALUES (?, ?, ?)"
+            " ON CONFLICT (name) DO UPDATE SET last_seen = excluded.last_seen, completed = completed + excluded.completed",
+            (worker, time.time(), completed),
+        )
+
+    def _expire(self) -> None:
+        # Jobs of workers that stopped sending heartbeats are handed out again
+        self.connection.execute(
+            "UPDATE jobs SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, worker = NULL"
+            " WHERE state = 'running' AND deadline < ?",
+            (self.max_attempts, time.time()),
+        )
+
+    def lease(self, worker: str) -> Optional[dict]:
+        """Lease the next pending job to `worker`; returns its id and a benchmark.json running only it, or None."""
+        with self.lock, self.connection:
+            self._seen(worker)
+            self._expire()
+
+            row = self.connection.execute("SELECT id FROM jobs WHERE state = 'pending' ORDER BY id LIMIT 1").fetchone()
+            if row is None:
+                return None
+
+            self.connection.execute(
+                "UPDATE jobs SET state = 'running', worker = ?, deadline = ?, attempts = attempts + 1 WHERE id = ?",
+                (worker, time.time() + self.lease_timeout, row[0]),
+            )
+
+        return {"id": row[0], "config": with_experiments(self.config, [experiment_at(self.config, row[0])])}
+
+    def heartbeat(self, worker: str, ids: list[int]) -> None:
+        """Extend the leases `worker` holds on `ids`."""
+        with self.lock, self.connection:
+            self._seen(worker)
+            self.connection.executemany(
+                "UPDATE jobs SET deadline = ? WHERE id = ? AND worker = ? AND state = 'running'",
+                [(time.time() + self.lease_timeout, job, worker) for job in ids],
+            )
+
+    def complete(self, worker: str, job: int, curve: np.ndarray, runtime: float, stop_reason: str) -> None:
+        """Store the result of a job. The first result wins if a reassigned job finishes twice."""
+        with self.lock, self.connection:
+            self._seen(worker, completed=1)
+
+            updated = self.connection.execute(
+                "UPDATE jobs SET state = 'done', worker = ?, finished = ? WHERE id = ? AND state != 'done'",
+                (worker, time.time(), job),
+            ).rowcount
+
+            if updated:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                    (job, np.asarray(curve, dtype=np.float64).tobytes(), runtime, stop_reason),
+                )
+
+    def release(self, worker: str, job: int) -> None:
+        """Return a job whose run failed to the queue (or fail it after max_attempts attempts)."""
+        with self.lock, self.connection:
+            self._seen(worker)
+            self.connection.execute(
+                "UPDATE jobs SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, worker = NULL"
+                " WHERE id = ? AND worker = ? AND state = 'running'",
+                (self.max_attempts, job, worker),
+            )
+
+    def status(self) -> dict:
+        """Job counts per state, live workers, throughput (experiments/s over the last minute) and ETA."""
+        now = time.time()
+
+        with self.lock, self.connection:
+            self._expire()
+
+            counts = dict(self.connection.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall())
+            recent = self.connection.execute(
+                "SELECT COUNT(*) FROM jobs WHERE state = 'done' AND finished >= ?", (now - THROUGHPUT_WINDOW,)
+            ).fetchone()[0]
+            workers = self.connection.execute(
+                "SELECT COUNT(*) FROM workers WHERE last_seen >= ?", (now - self.lease_timeout,)
+            ).fetchone()[0]
+
+        # Average over the window, or since startup when younger
+        throughput = recent / max(min(THROUGHPUT_WINDOW, now - self.started), 1e-9)
+        remaining = counts.get("pending", 0) + counts.get("running", 0)
+
+        return {
+            "total": sum(counts.values()),
+            "pending": counts.get("pending", 0),
+            "running": counts.get("running", 0),
+            "done": counts.get("done", 0),
+            "failed": counts.get("failed", 0),
+            "workers": workers,
+            "throughput": throughput,
+            "eta": remaining / throughput if throughput > 0 else None,
+        }
+
+    def finished(self) -> bool:
+        """True once no job is pending or running."""
+        status = self.status()
+        return status["pending"] + status["running"] == 0
+
+    def results(self) -> Iterator[tuple[str, tuple[np.ndarray, float, str]]]:
+        """Yield (name, (curve, execution_time, stop_reason)) of every finished job, in experiment order."""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT jobs.name, results.curve, results.runtime, results.stop_reason"
+                " FROM jobs JOIN results ON jobs.id = results.id ORDER BY jobs.id"
+            ).fetchall()
+
+        for name, curve, runtime, stop_reason in rows:
+            yield name, (np.frombuffer(curve, dtype=np.float64), runtime, stop_reason)
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def encode_curve(curve: np.ndarray) -> str:
+    """Encode a convergence curve for transfer as JSON (full-precision float64)."""
+    return base64.b64encode(np.asarray(curve, dtype="<f8").tobytes()).decode("ascii")
+
+
+def decode_curve(text: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(text), dtype="<f8").astype(np.float64)
+
+
+def make_handler(queue: JobQueue) -> type[BaseHTTPRequestHandler]:
+    """Create a request handler class serving `queue`."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def reply(self, body: dict, code: int = 200) -> None:
+            payload = json.dumps(body).encode("utf-8")
+
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            if self.path == "/status":
+                self.reply(queue.status())
+            else:
+                self.reply({"error": f"unknown path {self.path}"}, 404)
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            worker = request.get("worker", self.client_address[0])
+
+            if self.path == "/lease":
+                job = queue.lease(worker)
+                self.reply({"job": job, "done": job is None and queue.finished()})
+            elif self.path == "/heartbeat":
+                queue.heartbeat(worker, request.get("jobs", []))
+                self.reply({})
+            elif self.path == "/result":
+                queue.complete(
+                    worker, request["id"], decode_curve(request["curve"]),
+                    request["runtime"], request["stop_reason"],
+                )
+                self.reply({})
+            elif self.path == "/release":
+                queue.release(worker, request["id"])
+                self.reply({})
+            else:
+                self.reply({"error": f"unknown path {self.path}"}, 404)
+
+        def log_message(self, format, *args):
+            pass  # Progress is reported by the coordinator's status line
+
+    return Handler
+
+
+def parse_address(text: str) -> tuple[str, int]:
+    """Parse "[HOST]:PORT" or "PORT" (all interfaces when HOST is empty)."""
+    host, _, port = text.rpartition(":")
+    return host, int(port)
+
+
+def format_status(status: dict) -> str:
+    eta = "-" if status["eta"] is None else time.strftime("%H:%M:%S", time.gmtime(status["eta"]))
+
+    return (
+        f"{status['done']}/{status['total']} done, {status['running']} running, {status['failed']} failed, "
+        f"{status['workers']} worker(s), {status['throughput']:.2f} experiments/s, ETA {eta}"
+    )
+
+
+def run_coordinator(
+    config_path: Path,
+    output_dir: Path,
+    address: tuple[str, int] = ("", DEFAULT_PORT),
+    *,
+    retries: int = 1,
+    lease_timeout: float = LEASE_TIMEOUT,
+    result_format: str = "csv",
+    report_interval: float = HEARTBEAT_INTERVAL,
+) -> bool:
+    """
+    Serve the experiments of a benchmark.json to workers until all of them
+    have finished, then write the results to output_dir as the benchmark
+    program would.
+
+    The queue is kept in output_dir/queue.sqlite, so re-running an
+    interrupted coordinator keeps every finished experiment and retries
+    failed ones. Experiments failing `retries + 1` times are left out of
+    the results.
+
+    Returns
+    -------
+    bool
+        True if every experiment finished.
+    """
+    config = json.loads(config_path.read_text(encoding="utf-8"))
+    queue = JobQueue(output_dir / QUEUE_FILE, config, max_attempts=retries + 1, lease_timeout=lease_timeout)
+
+    server = ThreadingHTTPServer(address, make_handler(queue))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    host, port = server.server_address[:2]
+    print(f"\nCoordinator serving {queue.status()['total']} experiments on http://{host}:{port}")
+
+    try:
+        reported = 0.0
+
+        while not queue.finished():
+            if time.time() - reported >= report_interval:
+                print(format_status(queue.status()), flush=True)
+                reported = time.time()
+
+            time.sleep(1.0)
+
+        # Let idle workers learn that the benchmark is done before shutting down
+        time.sleep(DRAIN_TIME)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    status = queue.status()
+    print(format_status(status))
+
+    # Write finished experiments in the order of the benchmark definition
+    results = dict(queue.results())
+    names = [name for name in experiment_names(config) if name in results]
+    clear_fitness_files(output_dir)
+    write_results(output_dir, names, results, result_format)
+    queue.close()
+
+    if status["failed"]:
+        print(f"\n{status['failed']} experiment(s) failed {retries + 1} time(s) and are missing from the results")
+
+    return status["failed"] == 0
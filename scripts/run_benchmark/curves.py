@@ -0,0 +1,150 @@
+import numpy as np
+
+from typing import NamedTuple, Sequence
+
+
+CHUNK_VALUES = 1 << 22  # Curve values gathered per aggregation step (32 MiB)
+
+
+class CurveSet(NamedTuple):
+    """
+    Convergence curves stored back to back in one flat array (CSR-style).
+
+    Curve i is `values[offsets[i]:offsets[i] + lengths[i]]`. `values` may be a
+    memory map that also holds curves not in the set.
+    """
+    values: np.ndarray   # float64 curve values
+    offsets: np.ndarray  # Start of each curve in values
+    lengths: np.ndarray  # Number of values per curve
+
+    @classmethod
+    def from_arrays(cls, curves: Sequence[np.ndarray]) -> "CurveSet":
+        lengths = np.fromiter((len(c) for c in curves), dtype=np.int64, count=len(curves))
+        values = np.concatenate(curves).astype(np.float64, copy=False) if len(curves) else np.empty(0)
+
+        return cls(values, np.cumsum(lengths) - lengths, lengths)
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+
+class CurveAggregate(NamedTuple):
+    best: np.ndarray     # (runs,) minimum of each curve
+    final: np.ndarray    # (runs,) last value of each curve
+    mean: np.ndarray     # (groups, max length) NaN-ignoring mean curve, NaN past each group's length
+    lengths: np.ndarray  # (groups,) length of the longest curve in each group
+
+
+def aggregate_curves(
+    curves: CurveSet,
+    groups: np.ndarray,
+    num_groups: int,
+    chunk_values: int = CHUNK_VALUES,
+) -> CurveAggregate:
+    """
+    Compute per-curve best and final values, and the mean curve of each group.
+
+    `groups` assigns every curve a group index in [0, num_groups). Curves of
+    different length are averaged as if padded with NaN to the longest curve
+    of their group. Curves must not be empty.
+
+    Curves are processed in chunks of about `chunk_values` values, so working
+    memory does not grow with the number of curves and a memory-mapped
+    `values` array is read a chunk at a time.
+    """
+    groups = np.asarray(groups, dtype=np.int64)
+    num_runs = len(curves)
+
+    best = np.empty(num_runs)
+    final = np.empty(num_runs)
+
+    max_len = int(curves.lengths.max()) if num_runs else 0
+    sums = np.zeros((num_groups, max_len))
+
+    # Values per (group, position), from curve lengths: +1 where a curve starts, -1 past its end
+    edges = np.zeros((num_groups, max_len + 1), dtype=np.int64)
+    np.add.at(edges, (groups, 0), 1)
+    np.add.at(edges, (groups, curves.lengths), -1)
+    counts = np.cumsum(edges, axis=1, out=edges)[:, :max_len]
+
+    ends = np.cumsum(curves.lengths)
+    start = 0
+
+    while start < num_runs:
+        # Take whole curves up to the chunk size (at least one)
+        limit = ends[start] - curves.lengths[start] + chunk_values
+        stop = max(start + 1, int(np.searchsorted(ends, limit, side="right")))
+
+        offsets = curves.offsets[start:stop]
+        lengths = curves.lengths[start:stop]
+        local_starts = np.cumsum(lengths) - lengths
+        width = int(lengths.max())
+
+        # Curves written back to back are sliced, others gathered
+        if np.array_equal(offsets[1:], offsets[:-1] + lengths[:-1]):
+            flat = np.asarray(curves.values[offsets[0]:offsets[-1] + lengths[-1]])
+        else:
+            positions = np.arange(int(lengths.sum())) - np.repeat(local_starts, lengths)
+            flat = curves.values[np.repeat(offsets, lengths) + positions]
+
+        best[start:stop] = np.minimum.reduceat(flat, local_starts)
+        final[start:stop] = flat[local_starts + lengths - 1]
+
+        # One row per curve, zero-padded to the longest curve of the chunk
+        if (lengths == width).all():
+            rows = flat.reshape(-1, width)
+        else:
+            rows = np.zeros((len(lengths), width))
+            rows[np.arange(width) < lengths[:, None]] = flat
+
+        # Sum rows per group in run order
+        chunk_groups = groups[start:stop]
+        order = np.argsort(chunk_groups, kind="stable")
+        if not np.array_equal(order, np.arange(len(order))):
+            chunk_groups, rows = chunk_groups[order], rows[order]
+
+        bounds = np.flatnonzero(np.r_[True, chunk_groups[1:] != chunk_groups[:-1]])
+        present = chunk_groups[bounds]
+
+        # Like np.nanmean, NaN values are left out of sums and counts
+        missing = np.isnan(rows)
+        if missing.any():
+            counts[present, :width] -= np.add.reduceat(missing.astype(np.int64), bounds)
+            rows = np.where(missing, 0.0, rows)
+
+        sums[present, :width] += np.add.reduceat(rows, bounds)
+
+        start = stop
+
+    # Positions past a group's longest curve have no values and become NaN
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.divide(sums, counts, out=sums)
+
+    group_lengths = np.zeros(num_groups, dtype=np.int64)
+    np.maximum.at(group_lengths, groups, curves.lengths)
+
+    return CurveAggregate(best, final, mean, group_lengths)
+
+
+def resample_curves(
+    matrix: np.ndarray,
+    lengths: np.ndarray,
+    target_iters: int = 30,
+) -> np.ndarray:
+    """
+    Linearly resample each row's first `lengths[i]` values to `target_iters + 1`
+    evenly spaced points, returning a (rows, target_iters + 1) array. Rows that
+    already have `target_iters + 1` values are returned unchanged.
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)[:, None]
+
+    # Fractional source position of each target point
+    source = np.arange(target_iters + 1) * (lengths - 1) / target_iters
+    lower = np.floor(source).astype(np.int64)
+    upper = np.minimum(lower + 1, lengths - 1)
+    weight = source - lower
+
+    rows = np.arange(len(matrix))[:, None]
+    left, right = matrix[rows, lower], matrix[rows, upper]
+
+    return np.where(weight == 0, left, left + (right - left) * weight)
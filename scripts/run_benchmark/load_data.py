@@ -3,9 +3,17 @@ import numpy as np
 
 from pathlib import Path
 import json
-from typing import Union
+from typing import Optional, Union
 
 from .problems import ProblemType
+from .binary_results import read_fitness_binary
+from .curves import CurveSet, aggregate_curves, resample_curves
+from .result_files import completed_experiments, read_complete_lines
+from .stats import t_quantile
+from .sweep import iter_experiment_groups
+
+
+CSV_BLOCK_LINES = 4096  # Curves parsed per np.loadtxt call
 
 
 def load_experiment_metadata(json_path: Union[str, Path]) -> pd.DataFrame:
@@ -17,7 +25,7 @@ def load_experiment_metadata(json_path: Union[str, Path]) -> pd.DataFrame:
         data = json.load(f)
 
     rows = []
-    for exp in data["experiments"]:
+    for exp in iter_experiment_groups(data):
         experiment_full = exp["experiment_name"]
         experiment = experiment_full.rsplit("_seed", 1)[0]  # remove seed
         rows.append({
@@ -30,108 +38,180 @@ def load_experiment_metadata(json_path: Union[str, Path]) -> pd.DataFrame:
     return pd.DataFrame(rows).drop_duplicates(subset="experiment")  # one row per experiment
 
 
-def resample_curve(
-    curve: np.ndarray,
-    target_iters: int = 30,
-) -> np.ndarray:
-    if len(curve) == target_iters + 1:
-        return curve
+def load_fitness_curves(
+    fitness_path: Union[str, Path],
+    completed: Optional[set[str]] = None,
+) -> tuple[np.ndarray, CurveSet]:
+    """
+    Load one convergence curve per experiment run from best_fitnesses.csv or
+    best_fitnesses.bin.
+
+    Returns the experiment name (without seed) of each run and the curves as
+    a CurveSet. Binary curves are not copied: the CurveSet indexes into a
+    memory map of the file.
 
-    old_x = np.linspace(0, target_iters, num=len(curve))
-    new_x = np.linspace(0, target_iters, num=target_iters + 1)
+    If `completed` is given, only runs with those (full) experiment names are
+    loaded, which excludes curves of experiments that did not finish. Runs
+    without any values are skipped.
+    """
+    if Path(fitness_path).suffix == ".bin":
+        index, values = read_fitness_binary(fitness_path)
 
-    return np.interp(new_x, old_x, curve)
+        if completed is not None:
+            index = index[index["experiment"].isin(completed)]
 
+        index = index[index["length"] > 0]
 
-def add_normalized_curves(
-    df: pd.DataFrame,
-    target_iters: int = 30,
-) -> pd.DataFrame:
-    df = df.copy()
+        names = index["experiment"]
+        curves = CurveSet(values, index["offset"].to_numpy(), index["length"].to_numpy())
+
+    else:
+        lines = read_complete_lines(fitness_path)
+
+        # Keep lines of selected runs
+        selected, names_list = [], []
+        for line in lines:
+            name = line[:line.index(",")]
+
+            if completed is not None and name not in completed:
+                continue
+
+            selected.append(line)
+            names_list.append(name)
+
+        lengths = np.fromiter(
+            (line.count(",") if line[len(name) + 1:].strip() else 0 for line, name in zip(selected, names_list)),
+            dtype=np.int64,
+            count=len(selected),
+        )
+        offsets = np.cumsum(lengths) - lengths
+        values = np.empty(int(lengths.sum()))
+
+        # Parse blocks of consecutive equal-length curves straight into values
+        breaks = np.flatnonzero(np.diff(lengths)) + 1
+        for first, last in zip(np.r_[0, breaks], np.r_[breaks, len(lengths)]):
+            for block in range(first, last, CSV_BLOCK_LINES):
+                end = min(block + CSV_BLOCK_LINES, last)
+                length = int(lengths[block])
+
+                if length:
+                    values[offsets[block]:offsets[block] + (end - block) * length] = np.loadtxt(
+                        selected[block:end], delimiter=",", usecols=range(1, length + 1), ndmin=2
+                    ).ravel()
+
+        keep = lengths > 0
+
+        names = pd.Series(names_list, dtype=object)[keep]
+        curves = CurveSet(values, offsets[keep], lengths[keep])
+
+    experiments = names.str.replace(r"_seed\d+$", "", regex=True).to_numpy()
+
+    return experiments, curves
+
+
+def load_metrics(metrics_csv: Union[str, Path]) -> pd.DataFrame:
+    """
+    Load instrumentation counters (metrics.csv) and average them across seeds.
+
+    Output columns:
+        experiment, evaluations, evaluation_time, generation_time,
+        allocations, allocated_bytes
+    """
+    columns = ["evaluations", "evaluation_time", "generation_time", "allocations", "allocated_bytes"]
+
+    rows = [line.strip().split(",") for line in read_complete_lines(metrics_csv)[1:]]
+    metrics_df = pd.DataFrame(rows, columns=["experiment_full", *columns])
+    metrics_df[columns] = metrics_df[columns].astype(float)
 
-    df["fitness_curve_norm"] = df["fitness_curve_mean"].apply(
-        lambda c: resample_curve(c, target_iters)
+    metrics_df["experiment"] = (
+        metrics_df["experiment_full"]
+        .str.replace(r"_seed\d+$", "", regex=True)
     )
 
-    return df
+    return (
+        metrics_df
+        .groupby("experiment", as_index=False)[columns]
+        .mean()
+    )
 
 
 def load_benchmark_data(
-    fitness_csv: Union[str, Path],
+    fitness_path: Union[str, Path],
     time_csv: Union[str, Path],
     metadata_json: Union[str, Path],
+    metrics_csv: Optional[Union[str, Path]] = None,
 ) -> pd.DataFrame:
     """
     Load experiment fitness trajectories and execution times, average results
     across seeds, and return a single DataFrame.
 
+    `fitness_path` may point to best_fitnesses.csv or to the binary
+    best_fitnesses.bin (with its .idx offsets index alongside). Results of a
+    benchmark that is still running (or was interrupted) can be loaded: only
+    experiments with a row in `time_csv` are included.
+
+    If `metrics_csv` (written by instrumented builds) is given, its counters
+    are averaged across seeds and merged in as extra columns.
+
+    Curves are aggregated with vectorized reductions over a CurveSet, in
+    chunks, so memory use stays flat for large sweeps; the mean and
+    normalized curves are views into one array each.
+
     Output columns:
         experiment
         fitness_curve_mean : np.ndarray
         best_mean, best_std
+        best_ci : half-width of the 95% confidence interval of best_mean
         final_mean, final_std
-        n_seeds
+        n_seeds : number of seeds (runs) of the experiment
         execution_time
+        stopped_early : fraction of seeds ended by a stopping criterion
+        stop_reason : most common reason the optimizer stopped
     """
 
-    # Load fitness curves (one array per seed)
-    rows: list[dict[str, object]] = []
-
-    with open(fitness_csv, "r") as f:
-        for line in f:
-            parts = line.strip().split(",")
-            experiment_full = parts[0]
-            curve = np.asarray(parts[1:], dtype=float)
-
-            experiment = experiment_full.rsplit("_seed", 1)[0]
-
-            rows.append(
-                {
-                    "experiment": experiment,
-                    "fitness_curve": curve,
-                }
-            )
-
-    fitness_df = pd.DataFrame(rows)
+    # Load fitness curves (one per seed) of finished experiments
+    completed = set(completed_experiments(time_csv))
+    experiments, curves = load_fitness_curves(fitness_path, completed)
 
-    # Calculate per-seed scalar statistics 
-    fitness_df["best"] = fitness_df["fitness_curve"].apply(np.min)
-    fitness_df["final"] = fitness_df["fitness_curve"].apply(lambda x: x[-1])
+    # Group runs by experiment, in sorted order
+    groups, names = pd.factorize(experiments, sort=True)
+    stats = aggregate_curves(curves, groups, len(names))
 
-    # Curve averaging helper 
-    def mean_curve(curves: pd.Series) -> np.ndarray:
-        max_len = max(len(c) for c in curves)
-
-        padded = np.vstack(
-            [
-                np.pad(c, (0, max_len - len(c)), constant_values=np.nan)
-                for c in curves
-            ]
-        )
-
-        return np.nanmean(padded, axis=0)
-
-    # Aggregate per experiment 
+    # Aggregate per-seed scalar statistics per experiment
     fitness_agg = (
-        fitness_df
-        .groupby("experiment")
+        pd.DataFrame({"group": groups, "best": stats.best, "final": stats.final})
+        .groupby("group")
         .agg(
-            fitness_curve_mean=("fitness_curve", mean_curve),
             best_mean=("best", "mean"),
             best_median=("best", "median"),
             best_std=("best", "std"),
-            best_min=("best", "min"), 
+            best_min=("best", "min"),
             best_max=("best", "max"),
             final_mean=("final", "mean"),
             final_std=("final", "std"),
-            n_seeds=("fitness_curve", "count"),
+            n_seeds=("best", "size"),
         )
-        .reset_index()
     )
 
-    # Load execution times
-    time_df = pd.read_csv(time_csv)
-    time_df.columns = ["experiment_full", "execution_time"]
+    # Precision of best_mean, which varies with the seeds of adaptive runs
+    fitness_agg.insert(
+        fitness_agg.columns.get_loc("best_std") + 1,
+        "best_ci",
+        t_quantile(0.975, np.maximum(fitness_agg["n_seeds"] - 1, 1)) * fitness_agg["best_std"] / np.sqrt(fitness_agg["n_seeds"]),
+    )
+
+    # Mean curves are views into one (experiments, iterations) array
+    fitness_agg.insert(0, "experiment", names[fitness_agg.index])
+    fitness_agg.insert(1, "fitness_curve_mean", [
+        stats.mean[group, :length] for group, length in enumerate(stats.lengths)
+    ])
+    fitness_agg = fitness_agg.reset_index(drop=True)
+
+    # Load execution times and stop reasons (files of older builds, which
+    # always ran every iteration, have no stop reason column)
+    time_rows = [line.strip().split(",") + ["iterations"] for line in read_complete_lines(time_csv)[1:]]
+    time_df = pd.DataFrame([row[:3] for row in time_rows], columns=["experiment_full", "execution_time", "stop_reason"])
+    time_df["execution_time"] = time_df["execution_time"].astype(float)
 
     time_df["experiment"] = (
         time_df["experiment_full"]
@@ -140,10 +220,23 @@ def load_benchmark_data(
 
     time_avg = (
         time_df
-        .groupby("experiment", as_index=False)["execution_time"]
+        .assign(stopped_early=time_df["stop_reason"] != "iterations")
+        .groupby("experiment", as_index=False)[["execution_time", "stopped_early"]]
         .mean()
     )
 
+    # Most common stop reason per experiment
+    stop_reasons = (
+        time_df
+        .groupby(["experiment", "stop_reason"])
+        .size()
+        .reset_index(name="count")
+        .sort_values(["experiment", "count"], ascending=[True, False], kind="stable")
+        .drop_duplicates("experiment")
+        [["experiment", "stop_reason"]]
+    )
+    time_avg = pd.merge(time_avg, stop_reasons, on="experiment", how="left")
+
     # Merge dataframes 
     result = pd.merge(
         fitness_agg,
@@ -152,6 +245,10 @@ def load_benchmark_data(
         how="left",
     )
 
+    # Merge instrumentation counters
+    if metrics_csv is not None:
+        result = pd.merge(result, load_metrics(metrics_csv), on="experiment", how="left")
+
     # Merge experiment metadata
     metadata_df = load_experiment_metadata(metadata_json)
     result = pd.merge(result, metadata_df, on="experiment", how="left")
@@ -161,7 +258,7 @@ def load_benchmark_data(
         lambda v: ProblemType(v).label if pd.notna(v) else None
     )
 
-    # Add normalized fitness curve
-    result = add_normalized_curves(result, 30)
+    # Add normalized fitness curve (merges above keep the row order)
+    result["fitness_curve_norm"] = list(resample_curves(stats.mean, stats.lengths, 30))
 
     return result
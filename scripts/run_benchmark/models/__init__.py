@@ -1,5 +1,7 @@
 from .experiment import Experiment
 from .benchmark import Benchmark
+from .adaptive import AdaptiveSeeds
+from .tuning import Tuning
 
 
-__all__ = ["Experiment", "Benchmark"]
+__all__ = ["Experiment", "Benchmark", "AdaptiveSeeds", "Tuning"]
@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field, ConfigDict
+
+from typing import Literal
+
+
+class AdaptiveSeeds(BaseModel):
+    """
+    Settings of adaptive seed allocation (the [adaptive] table of a config).
+
+    Seeds are run in rounds. Every template × dimension × optimizer cell
+    starts with `min_runs` seeds and receives `round_runs` more per round
+    until its best fitness statistics have converged, or until it has used
+    the benchmark's `runs` seeds.
+
+    A cell's best_mean has converged once the half-width of its confidence
+    interval is at most max(`abs_tolerance`, `tolerance` × |best_mean|). With
+    the "ranking" criterion, the optimizers of a template × dimension instead
+    stop together once each pair of neighbours in their ranking by best_mean
+    is resolved: their intervals do not overlap, or both have converged.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    min_runs: int = Field(5, ge=3)
+    round_runs: int = Field(5, gt=0)
+    criterion: Literal["interval", "ranking"] = "interval"
+    confidence: float = Field(0.95, gt=0, lt=1)
+    tolerance: float = Field(0.01, ge=0, allow_inf_nan=False)
+    abs_tolerance: float = Field(0.0, ge=0, allow_inf_nan=False)
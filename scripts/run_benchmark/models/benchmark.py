@@ -1,12 +1,15 @@
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from pathlib import Path
 import tomllib
 from itertools import product
-from typing import List
+from typing import Iterator, Optional
 
-from .experiment import Experiment
+from .adaptive import AdaptiveSeeds
+from .experiment import Experiment, Generator
 from .optimizer import Optimizer
+from .tuning import Tuning
+from .. import sweep
 
 
 class Benchmark(BaseModel):
@@ -16,42 +19,91 @@ class Benchmark(BaseModel):
     seed_type: str
     seed_step: int
     seed_begin: int
+    seed_generator: Generator = "mt19937"
+    adaptive: Optional[AdaptiveSeeds] = None
+    tuning: Optional[Tuning] = None
     optimizers: list[Optimizer] = Field(default_factory=list)
     experiment_templates: list[dict] = Field(default_factory=list)
-    experiments: list[Experiment] = Field(default_factory=list)
+    _templates: list[dict] = PrivateAttr(default_factory=list)
 
 
-    def generate_all_experiments(self):
-        """Automatically generate all experiment combinations as a Benchmark field."""
-        all_experiments = []
+    def seeds(self) -> list[int]:
+        """Seeds of the runs of every template x dimension x optimizer combination."""
+        step = self.seed_step if self.seed_type == "iterate" else 0
+        return [self.seed_begin + i * step for i in range(self.runs)]
 
-        # Compute seeds
-        if self.seed_type == "iterate":
-            seeds = [self.seed_begin + i * self.seed_step for i in range(self.runs)]
-        else:
-            seeds = [self.seed_begin] * self.runs
 
-        # Cartesian product: template × dimension × optimizer × seed
+    @property
+    def num_experiments(self) -> int:
+        return len(self._templates) * len(self.dimensions) * len(self.optimizers) * self.runs
+
+
+    def iter_experiments(self) -> Iterator[Experiment]:
+        """Yield every experiment (template × dimension × optimizer × seed) without storing them."""
         for template, dim, optimizer, seed in product(
-            self.experiment_templates, self.dimensions, self.optimizers, seeds
+            self._templates, self.dimensions, self.optimizers, self.seeds()
         ):
-            exp = Experiment(
-                template_name=template["experiment_name"],
+            yield Experiment(
+                template_name=template["template_name"],
                 optimizer=optimizer,
                 dimensions=dim,
                 seed=seed,
-                upper_bound=template.get("upper_bound", 100.0),
-                lower_bound=template.get("lower_bound", -100.0),
-                problem_type=template.get("problem_type", 1),
+                generator=self.seed_generator,
+                upper_bound=template["upper_bound"],
+                lower_bound=template["lower_bound"],
+                problem_type=template["problem_type"],
             )
-            all_experiments.append(exp)
 
-        self.experiments = all_experiments
+
+    @model_validator(mode="after")
+    def validate_adaptive(self):
+        # Adaptive runs take the first seeds of every cell, which must be distinct
+        if self.adaptive is not None:
+            if self.seed_type != "iterate" or self.seed_step == 0:
+                raise ValueError("adaptive seeds require seed type 'iterate' with a non-zero step")
+            if self.adaptive.min_runs > self.runs:
+                raise ValueError(f"adaptive min_runs ({self.adaptive.min_runs}) exceeds runs ({self.runs})")
+            if self.tuning is not None:
+                raise ValueError("adaptive seeds cannot be combined with [[tune]] blocks")
+
+        return self
 
 
     @model_validator(mode="after")
-    def build_experiments(self):
-        self.generate_all_experiments()
+    def resolve_templates(self):
+        """
+        Validate every template × dimension × optimizer combination once (runs
+        differ only by seed) and store the templates with defaults applied.
+        """
+        seeds = self.seeds()
+        self._templates = []
+
+        for template in self.experiment_templates:
+            exp = None
+
+            # The first and last seed bound all others
+            for dim, optimizer, seed in product(self.dimensions, self.optimizers, {seeds[0], seeds[-1]}):
+                exp = Experiment(
+                    template_name=template["experiment_name"],
+                    optimizer=optimizer,
+                    dimensions=dim,
+                    seed=seed,
+                    generator=self.seed_generator,
+                    upper_bound=template.get("upper_bound", 100.0),
+                    lower_bound=template.get("lower_bound", -100.0),
+                    problem_type=template.get("problem_type", 1),
+                )
+
+            if exp is None: # Template has no experiments
+                continue
+
+            self._templates.append({
+                "template_name": exp.template_name,
+                "upper_bound": exp.upper_bound,
+                "lower_bound": exp.lower_bound,
+                "problem_type": exp.problem_type,
+            })
+
         return self
 
 
@@ -63,6 +115,12 @@ class Benchmark(BaseModel):
         # Parse optimizers
         optimizers = [Optimizer(**opt) for opt in cfg.get("optimizer", [])]
 
+        # Candidates of tuned optimizers are run like any other optimizer
+        tuning = None
+        if cfg.get("tune"):
+            tuning, candidates = Tuning.from_blocks(cfg["tune"], cfg.get("tuning", {}))
+            optimizers += candidates
+
         # Flatten seed info
         seed_info = cfg.get("seed", {})
         runs = cfg.get("benchmark", {}).get("runs", 30)
@@ -74,27 +132,45 @@ class Benchmark(BaseModel):
             seed_type=seed_info.get("type", "iterate"),
             seed_step=seed_info.get("step", 1),
             seed_begin=seed_info.get("begin", 108664),
+            seed_generator=seed_info.get("generator", "mt19937"),
+            adaptive=AdaptiveSeeds(**cfg["adaptive"]) if "adaptive" in cfg else None,
+            tuning=tuning,
             optimizers=optimizers,
             experiment_templates=cfg.get("experiment", []),
         )
     
-    def to_json_dict(self) -> dict:
-        return {
+    def to_json_dict(self, expand: bool = False) -> dict:
+        """
+        Benchmark definition as read by the benchmark program: a compact sweep
+        specification, or with `expand` the full list of experiments.
+        """
+        config = {
             "benchmark_name": self.benchmark_name,
             "runs": self.runs,
-            "experiments": [
-            exp.model_dump(
-                by_alias=True,
-                exclude_none=True,
-                exclude={
-                    "template_name": True,
-                    "optimizer": {"apply"},
-                }
-            )
-            for exp in self.experiments
-        ],
+            "sweep": {
+                "templates": self._templates,
+                "dimensions": self.dimensions,
+                "optimizers": [
+                    optimizer.model_dump(by_alias=True, exclude_none=True, exclude={"apply"})
+                    for optimizer in self.optimizers
+                ],
+                "seeds": {
+                    "begin": self.seed_begin,
+                    "step": self.seed_step if self.seed_type == "iterate" else 0,
+                    "count": self.runs,
+                },
+                "generator": self.seed_generator,
+            },
         }
 
-    def to_json(self, *, indent: int = 2) -> str:
+        # Recorded for reference; runs is then the maximum per cell
+        if self.adaptive is not None:
+            config["adaptive"] = self.adaptive.model_dump()
+        if self.tuning is not None:
+            config["tuning"] = self.tuning.model_dump()
+
+        return sweep.expand(config) if expand else config
+
+    def to_json(self, *, indent: int = 2, expand: bool = False) -> str:
         import json
-        return json.dumps(self.to_json_dict(), indent=indent)
+        return json.dumps(self.to_json_dict(expand=expand), indent=indent)
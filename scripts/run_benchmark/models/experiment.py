@@ -1,6 +1,13 @@
 from pydantic import BaseModel, Field, field_validator, ConfigDict, computed_field
 
+from typing import Literal
+
 from .optimizer import Optimizer
+from .. import sweep
+
+
+# Random number generators of the benchmark program (see include/RandomGenerator.h)
+Generator = Literal["mt19937", "xoshiro256++", "pcg32"]
 
 class Experiment(BaseModel):
     model_config = ConfigDict(
@@ -14,16 +21,23 @@ class Experiment(BaseModel):
     problem_type: int = Field(1, ge=0, le=10)
     dimensions: int = Field(30, gt=0)
     seed: int = Field(108664, ge=0)
+    generator: Generator = "mt19937"
     optimizer: Optimizer
 
     @computed_field
     @property
     def experiment_name(self) -> str:
-        return (
-            f"{self.template_name}_"
-            f"{self.optimizer.name}_"
-            f"dim{self.dimensions}_"
-            f"seed{self.seed}"
+        return sweep.experiment_name(self.template_name, self.optimizer.name, self.dimensions, self.seed)
+
+    def to_json_dict(self) -> dict:
+        """Experiment definition as read by the benchmark program (one benchmark.json entry)."""
+        return self.model_dump(
+            by_alias=True,
+            exclude_none=True,
+            exclude={
+                "template_name": True,
+                "optimizer": {"apply"},
+            }
         )
 
     @field_validator("upper_bound")
@@ -1,15 +1,48 @@
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
 
 from typing import Literal
 import tomllib 
 
 
+# Donor vectors drawn by each DE mutation strategy (see include/Optimizer/Mutation)
+MUTATION_DONORS = {
+    "rand/1": 3,
+    "best/1": 2,
+    "rand/2": 5,
+    "best/2": 4,
+    "rand-to-best/1": 3,
+}
+
+DE_FIELDS = (
+    "population_size", "scale", "crossover_rate", "mutation", "crossover",
+    "islands", "migration_interval", "migrants", "topology",
+)
+MIGRATION_FIELDS = ("migration_interval", "migrants", "topology")
+
+
 class Optimizer(BaseModel):
     name: str
-    type: Literal['blind', 'repeated local']
+    type: Literal['blind', 'repeated local', 'differential evolution']
     iterations: int = Field(..., gt=0)
     neighbor_delta: int | None = Field(default=None, gt=0, alias="delta")
     num_neighbors: int | None = Field(default=None, gt=0)
+    threads: int | None = Field(default=None, gt=0)
+    population_size: int | None = Field(default=None, gt=0)
+    scale: float | None = Field(default=None, gt=0)
+    crossover_rate: float | None = Field(default=None, ge=0, le=1)
+    mutation: Literal['rand/1', 'best/1', 'rand/2', 'best/2', 'rand-to-best/1'] | None = None
+    crossover: Literal['bin', 'exp'] | None = None
+    islands: int | None = Field(default=None, gt=0)
+    migration_interval: int | None = Field(default=None, gt=0)
+    migrants: int | None = Field(default=None, gt=0)
+    topology: Literal['ring', 'complete'] | None = None
+    max_evaluations: int | None = Field(default=None, gt=0)
+    target_fitness: float | None = Field(default=None, allow_inf_nan=False)
+    stagnation_window: int | None = Field(default=None, gt=0)
+    stagnation_tolerance: float | None = Field(default=None, ge=0, allow_inf_nan=False)
+    time_limit: float | None = Field(default=None, gt=0, allow_inf_nan=False)
+    trace: Literal['full', 'none', 'best', 'every', 'log', 'stream'] | None = None
+    trace_interval: int | None = Field(default=None, gt=0)
     apply: str
 
     model_config = ConfigDict(
@@ -17,22 +50,102 @@ class Optimizer(BaseModel):
         populate_by_name=True
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def default_strategies(cls, data):
+        # Written to benchmark.json explicitly, so results record the strategies used
+        if isinstance(data, dict) and data.get("type") == "differential evolution":
+            data = {"mutation": "rand/1", "crossover": "bin", **data}
+
+        return data
+
     @field_validator("neighbor_delta", "num_neighbors", mode="before")
     @classmethod
     def validate_optimizer_fields(cls, v, info):
         opt_type = info.data.get("type")
 
-        if opt_type == "blind":
+        if opt_type in ("blind", "differential evolution"):
             if v is not None:
                 raise ValueError(
-                    f"{info.name} must be omitted for blind optimizer"
+                    f"{info.field_name} must be omitted for {opt_type} optimizer"
                 )
             return None
 
         if opt_type == "repeated local":
             if v is None or v <= 0:
                 raise ValueError(
-                    f"{info.name} must be set and > 0 for repeated local optimizer"
+                    f"{info.field_name} must be set and > 0 for repeated local optimizer"
                 )
 
         return v
+
+    @model_validator(mode="after")
+    def validate_de_fields(self):
+        if self.type != "differential evolution":
+            for field in DE_FIELDS:
+                if getattr(self, field) is not None:
+                    raise ValueError(f"{field} must be omitted for {self.type} optimizer")
+            return self
+
+        for field in ("population_size", "scale", "crossover_rate"):
+            if getattr(self, field) is None:
+                raise ValueError(f"{field} must be set for differential evolution optimizer")
+
+        islands = self.islands or 1
+
+        if islands == 1:
+            for field in MIGRATION_FIELDS:
+                if getattr(self, field) is not None:
+                    raise ValueError(f"{field} requires islands > 1")
+
+        # Donors are distinct members of the target's island other than the target
+        island_size = self.population_size // islands
+
+        if island_size <= MUTATION_DONORS[self.mutation]:
+            raise ValueError(
+                f"population_size must be greater than {MUTATION_DONORS[self.mutation]} "
+                f"per island for {self.mutation} mutation"
+            )
+
+        if self.migrants is not None and self.migrants >= island_size:
+            raise ValueError("migrants must be smaller than the population of an island")
+
+        return self
+
+    @model_validator(mode="after")
+    def validate_threads(self):
+        # Parallel restarts use per-restart random streams, so only repeated local search supports them
+        if self.threads is not None and self.type != "repeated local":
+            raise ValueError(f"threads must be omitted for {self.type} optimizer")
+
+        return self
+
+    @model_validator(mode="after")
+    def validate_trace(self):
+        # Only the decimating policies have checkpoints to space
+        if self.trace == "every" and self.trace_interval is None:
+            raise ValueError("trace_interval must be set for every trace")
+
+        if self.trace_interval is not None and self.trace not in ("every", "log"):
+            raise ValueError("trace_interval requires an every or log trace")
+
+        return self
+
+    @model_validator(mode="after")
+    def validate_stopping_criteria(self):
+        if self.stagnation_tolerance is not None and self.stagnation_window is None:
+            raise ValueError("stagnation_tolerance requires stagnation_window")
+
+        # The budget must cover the first iteration, so every run records a result
+        if self.max_evaluations is not None:
+            if self.type == "differential evolution":
+                minimum = 2 * self.population_size
+            elif self.type == "repeated local":
+                minimum = 1 + (self.num_neighbors or 0)
+            else:
+                minimum = 1
+
+            if self.max_evaluations < minimum:
+                raise ValueError(f"max_evaluations must be at least {minimum} for {self.name}")
+
+        return self
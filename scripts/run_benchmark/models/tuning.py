@@ -0,0 +1,96 @@
+from pydantic import BaseModel, Field, ConfigDict
+
+from itertools import product
+from typing import Any
+
+import numpy as np
+
+from .optimizer import Optimizer
+
+
+Value = int | float | str
+
+
+def range_values(spec: dict) -> list[Value]:
+    """
+    Values of a parameter range {min, max, count, scale}: `count` values from
+    min to max, evenly spaced ("linear", default) or geometrically ("log").
+    Integer bounds give (distinct, rounded) integer values.
+    """
+    low, high, count = spec["min"], spec["max"], spec.get("count", 2)
+    scale = spec.get("scale", "linear")
+
+    if scale == "log":
+        values = np.geomspace(low, high, count)
+    elif scale == "linear":
+        values = np.linspace(low, high, count)
+    else:
+        raise ValueError(f"unknown range scale '{scale}' (expected 'linear' or 'log')")
+
+    if isinstance(low, int) and isinstance(high, int):
+        return list(dict.fromkeys(int(round(v)) for v in values))
+
+    return [float(v) for v in values]
+
+
+def format_value(value: Value) -> str:
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+
+def expand_candidates(block: dict) -> dict[str, dict[str, Value]]:
+    """
+    Expand a [[tune]] block into its candidate optimizer definitions, keyed
+    by candidate name. Fields given as a list or as a range table are tuned;
+    every combination of their values is a candidate named
+    `<name>-<field>=<value>-...`.
+    """
+    tuned = {
+        key: range_values(value) if isinstance(value, dict) else list(value)
+        for key, value in block.items()
+        if isinstance(value, (list, dict))
+    }
+
+    if not tuned:
+        raise ValueError(f"tune block '{block.get('name')}' has no list or range of values to tune")
+
+    candidates = {}
+    for values in product(*tuned.values()):
+        parameters = dict(zip(tuned, values))
+        name = "-".join([block["name"], *(f"{key}={format_value(value)}" for key, value in parameters.items())])
+        candidates[name] = parameters
+
+    return candidates
+
+
+class Tuning(BaseModel):
+    """
+    Settings of a tuning benchmark (the [tuning] table and [[tune]] blocks of a config).
+
+    Each [[tune]] block is an optimizer whose parameters are given as lists or
+    ranges of values. Its candidates (every combination) race by successive
+    halving separately for every template × dimension: all candidates run a
+    short budget of iterations on every seed, the best 1/`eta` by best_mean
+    continue with `eta` times the budget, and so on until the survivors run
+    the full iterations of the block, whose best is the tuned configuration.
+
+    `groups` maps the name of each [[tune]] block to its candidates and their
+    tuned parameter values.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    eta: int = Field(3, ge=2)
+    groups: dict[str, dict[str, dict[str, Value]]] = Field(default_factory=dict)
+
+    @classmethod
+    def from_blocks(cls, blocks: list[dict], settings: dict[str, Any]) -> tuple["Tuning", list[Optimizer]]:
+        """Expand [[tune]] blocks into a Tuning and the (validated) candidate optimizers."""
+        groups, optimizers = {}, []
+
+        for block in blocks:
+            candidates = expand_candidates(block)
+            groups[block["name"]] = candidates
+
+            for name, parameters in candidates.items():
+                optimizers.append(Optimizer(**{**block, **parameters, "name": name}))
+
+        return cls(**settings, groups=groups), optimizers
@@ -0,0 +1,149 @@
+import numpy as np
+from numpy.typing import ArrayLike
+
+import ctypes
+import importlib.resources as res
+import json
+from functools import lru_cache
+from typing import NamedTuple, Union
+
+from .models import Experiment
+from .problems import ProblemType
+
+
+# Must match NOB_ABI_VERSION in include/NativeApi.h
+ABI_VERSION = 2
+LIBRARY_FILE = "libbenchmark.so"
+
+
+class ExperimentResult(NamedTuple):
+    best_fitnesses: np.ndarray  # Best fitness so far per iteration
+    best_solution: np.ndarray   # Empty if the optimizer does not record it
+    runtime: float              # Optimizer execution time in seconds
+    stop_reason: str            # Why the optimizer stopped (see StopReason)
+
+
+class _ResultHandle:
+    """Owns a native result; arrays viewing its memory keep it alive."""
+
+    def __init__(self, lib: ctypes.CDLL, handle: int):
+        self.lib = lib
+        self.handle = handle
+
+    def __del__(self):
+        self.lib.nob_result_free(self.handle)
+
+    def view(self, ptr: int, length: int) -> np.ndarray:
+        """Read-only float64 array over native memory, without copying."""
+        if length == 0:
+            return np.empty(0, dtype=np.float64)
+
+        buffer = (ctypes.c_double * length).from_address(ptr)
+        buffer._owner = self # Freed only once no array uses the memory
+
+        array = np.frombuffer(buffer, dtype=np.float64)
+        array.flags.writeable = False
+        return array
+
+
+@lru_cache(maxsize=None)
+def load_library() -> ctypes.CDLL:
+    """Load the engine shared library bundled with the package (built by `make shared`)."""
+    lib = ctypes.CDLL(str(res.files("run_benchmark") / LIBRARY_FILE))
+
+    double_p = ctypes.POINTER(ctypes.c_double)
+
+    lib.nob_abi_version.restype = ctypes.c_int
+    lib.nob_last_error.restype = ctypes.c_char_p
+
+    lib.nob_problem_bounds.argtypes = [ctypes.c_int, double_p, double_p]
+    lib.nob_problem_bounds.restype = ctypes.c_int
+
+    lib.nob_evaluate.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_size_t, ctypes.c_void_p]
+    lib.nob_evaluate.restype = ctypes.c_int
+
+    lib.nob_run_experiment.argtypes = [ctypes.c_char_p]
+    lib.nob_run_experiment.restype = ctypes.c_void_p
+
+    for name, restype in (
+        ("nob_result_length", ctypes.c_size_t),
+        ("nob_result_fitnesses", ctypes.c_void_p),
+        ("nob_result_solution_length", ctypes.c_size_t),
+        ("nob_result_solution", ctypes.c_void_p),
+        ("nob_result_runtime", ctypes.c_double),
+        ("nob_result_stop_reason", ctypes.c_char_p),
+        ("nob_result_free", None),
+    ):
+        getattr(lib, name).argtypes = [ctypes.c_void_p]
+        getattr(lib, name).restype = restype
+
+    if lib.nob_abi_version() != ABI_VERSION:
+        raise RuntimeError(
+            f"{LIBRARY_FILE} implements ABI version {lib.nob_abi_version()}, expected {ABI_VERSION}; reinstall the package"
+        )
+
+    return lib
+
+
+def _raise_last_error(lib: ctypes.CDLL) -> None:
+    raise ValueError(lib.nob_last_error().decode("utf-8"))
+
+
+def problem_bounds(problem: Union[ProblemType, int]) -> tuple[float, float]:
+    """Return the default (lower, upper) search space bounds of a problem."""
+    lib = load_library()
+    lower, upper = ctypes.c_double(), ctypes.c_double()
+
+    if lib.nob_problem_bounds(int(problem), ctypes.byref(lower), ctypes.byref(upper)) != 0:
+        _raise_last_error(lib)
+
+    return lower.value, upper.value
+
+
+def evaluate(problem: Union[ProblemType, int], x: ArrayLike) -> np.ndarray:
+    """
+    Evaluate candidates with the C++ problem kernels, in process.
+
+    `x` is an (n, d) array of n candidates (or a single (d,) candidate). A
+    C-contiguous float64 array is read in place; anything else is converted
+    once. Returns an (n,) array of fitness values, or a single float for a
+    single candidate.
+    """
+    lib = load_library()
+
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    rows = x.reshape(1, -1) if x.ndim == 1 else x
+
+    if rows.ndim != 2:
+        raise ValueError(f"Expected an (n, d) array, got shape {x.shape}")
+
+    fitness = np.empty(rows.shape[0], dtype=np.float64)
+
+    if lib.nob_evaluate(int(problem), rows.ctypes.data, rows.shape[0], rows.shape[1], fitness.ctypes.data) != 0:
+        _raise_last_error(lib)
+
+    return fitness[0] if x.ndim == 1 else fitness
+
+
+def run_experiment(experiment: Union[Experiment, dict]) -> ExperimentResult:
+    """
+    Run a single experiment in process, with results identical to the
+    benchmark program. Accepts an Experiment model or a benchmark.json
+    experiment entry. Result arrays view the engine's memory directly.
+    """
+    lib = load_library()
+
+    definition = experiment.to_json_dict() if isinstance(experiment, Experiment) else experiment
+    handle = lib.nob_run_experiment(json.dumps(definition).encode("utf-8"))
+
+    if not handle:
+        _raise_last_error(lib)
+
+    owner = _ResultHandle(lib, handle)
+
+    return ExperimentResult(
+        best_fitnesses=owner.view(lib.nob_result_fitnesses(handle), lib.nob_result_length(handle)),
+        best_solution=owner.view(lib.nob_result_solution(handle), lib.nob_result_solution_length(handle)),
+        runtime=lib.nob_result_runtime(handle),
+        stop_reason=lib.nob_result_stop_reason(handle).decode("utf-8"),
+    )
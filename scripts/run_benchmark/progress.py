@@ -0,0 +1,147 @@
+"""
+Live progress of a benchmark run.
+
+The benchmark program writes newline-delimited JSON events to the path given
+with --progress (see include/Progress.h): `begin`, `start`, `progress`,
+`end` and `finish`. A ProgressMonitor reads them from a pipe on a background
+thread and periodically prints how many experiments finished, the evaluation
+and experiment rates, and an estimate of the remaining time. The raw events
+can also be copied to a file, so external tools can follow the run.
+"""
+
+from collections import deque
+from pathlib import Path
+from typing import Optional, TextIO
+import json
+import os
+import threading
+import time
+
+
+REPORT_INTERVAL = 5.0   # Seconds between printed status lines
+RATE_WINDOW = 30.0      # Seconds of events averaged into the evaluation rate
+
+
+class ProgressMonitor:
+    """
+    Aggregates the progress events of one benchmark run.
+
+    Call open() before starting the benchmark program, pass it `argument()`
+    and the `fd` to keep open, and call close() once it exits. A monitor may
+    follow several consecutive runs, whose experiments then add up.
+    """
+
+    def __init__(self, log: Optional[Path] = None, report_interval: float = REPORT_INTERVAL):
+        self.log_path = log
+        self.report_interval = report_interval
+
+        self.total = 0
+        self.done = 0
+        self.started = time.time()
+        self.finished_evaluations = 0
+        self.running: dict[int, tuple[str, int]] = {}   # index -> (name, evaluations so far)
+        self.samples: deque[tuple[float, int]] = deque() # (time, evaluations) within RATE_WINDOW
+        self.lock = threading.Lock()
+
+        self.logged = False
+        self.read_fd: Optional[int] = None
+        self.fd: Optional[int] = None
+        self.reader: Optional[threading.Thread] = None
+
+    def open(self) -> None:
+        """Create the pipe receiving events and start reading it."""
+        self.read_fd, self.fd = os.pipe()
+        self.reader = threading.Thread(target=self.read, daemon=True)
+        self.reader.start()
+
+    def argument(self) -> list[str]:
+        """Arguments making the benchmark program write events to the pipe."""
+        return ["--progress", f"/dev/fd/{self.fd}"]
+
+    def close(self) -> None:
+        """Wait for the remaining events once the benchmark program exited, then print the final status."""
+        os.close(self.fd)
+        self.reader.join()
+        print(self.format_status())
+
+    def read(self) -> None:
+        # Events of later runs are appended to those of the first
+        log: Optional[TextIO] = open(self.log_path, "a" if self.logged else "w") if self.log_path else None
+        self.logged = True
+        reported = time.time()
+
+        try:
+            with os.fdopen(self.read_fd, "r") as events:
+                for line in events:
+                    if log:
+                        log.write(line)
+                        log.flush()
+
+                    try:
+                        self.handle(json.loads(line))
+                    except (json.JSONDecodeError, KeyError):
+                        continue  # Events are advisory; never fail a run over one
+
+                    if time.time() - reported >= self.report_interval:
+                        print(self.format_status(), flush=True)
+                        reported = time.time()
+        finally:
+            if log:
+                log.close()
+
+    def handle(self, event: dict) -> None:
+        """Update the aggregate state with one event."""
+        kind = event["event"]
+
+        with self.lock:
+            if kind == "begin":
+                self.total = self.done + event["experiments"]
+            elif kind == "start":
+                self.running[event["index"]] = (event["experiment"], 0)
+            elif kind == "progress":
+                self.running[event["index"]] = (event["experiment"], event["evaluations"])
+            elif kind == "end":
+                self.running.pop(event["index"], None)
+                self.finished_evaluations += event["evaluations"]
+                self.done += 1
+
+            now = time.time()
+            self.samples.append((now, self.evaluations()))
+
+            while len(self.samples) > 2 and now - self.samples[0][0] > RATE_WINDOW:
+                self.samples.popleft()
+
+    def evaluations(self) -> int:
+        """Evaluations of finished experiments plus the last reported ones of running experiments."""
+        return self.finished_evaluations + sum(evaluations for _, evaluations in self.running.values())
+
+    def status(self) -> dict:
+        """Experiment counts, evaluation rate, experiment rate and ETA in seconds (None if unknown)."""
+        with self.lock:
+            elapsed = max(time.time() - self.started, 1e-9)
+            (first_time, first_evals), (last_time, last_evals) = (
+                (self.samples[0], self.samples[-1]) if self.samples else ((0.0, 0), (0.0, 0))
+            )
+
+            evaluation_rate = (last_evals - first_evals) / (last_time - first_time) if last_time > first_time else 0.0
+            experiment_rate = self.done / elapsed
+            remaining = self.total - self.done
+
+            return {
+                "total": self.total,
+                "done": self.done,
+                "running": len(self.running),
+                "evaluations": self.evaluations(),
+                "evaluation_rate": evaluation_rate,
+                "experiment_rate": experiment_rate,
+                "eta": remaining / experiment_rate if experiment_rate > 0 else None,
+            }
+
+    def format_status(self) -> str:
+        status = self.status()
+        eta = "-" if status["eta"] is None else time.strftime("%H:%M:%S", time.gmtime(status["eta"]))
+
+        return (
+            f"\n{status['done']}/{status['total']} done, {status['running']} running, "
+            f"{status['evaluation_rate']:,.0f} evaluations/s, {status['experiment_rate']:.2f} experiments/s, ETA {eta}"
+        )
@@ -0,0 +1,199 @@
+"""
+Successive-halving race of tuned optimizer candidates (see models/tuning.py).
+
+The candidates of every [[tune]] block race separately for each template ×
+dimension. A race runs in rungs: every surviving candidate runs all seeds
+with the rung's budget of iterations, candidates are ranked by best_mean,
+and the best 1/eta go on to the next rung with eta times the budget. The
+last rung runs the full iterations, and its best candidate is the tuned
+configuration. Races of blocks with fewer candidates join in later rungs, so
+every race ends in the same last rung, together with the untuned optimizers
+of the benchmark.
+
+Each rung is an ordinary benchmark run kept in output_dir/tuning/rung_<k>,
+which --analyze accepts. The results of the last rung (all at full
+iterations) are also written to output_dir itself, and the race is
+summarized in tuning.csv (every candidate of every rung) and tuned.csv (the
+winner of every race).
+"""
+
+import numpy as np
+import pandas as pd
+
+from math import ceil
+from pathlib import Path
+from typing import Optional
+import copy
+import json
+import shutil
+
+from .adaptive import read_bests
+from .cache import ResultCache
+from .models import Tuning
+from .progress import ProgressMonitor
+from .result_files import TIMES_FILE, completed_experiments
+from .run_experiments import compact_results, run_benchmark
+from .sweep import iter_experiments, with_experiments
+
+
+TUNING_DIR = "tuning"
+TUNING_FILE = "tuning.csv"
+TUNED_FILE = "tuned.csv"
+
+
+def halvings(candidates: int, eta: int) -> int:
+    """Rungs before the last one needed to reduce `candidates` to one."""
+    rungs = 0
+    while candidates > 1:
+        candidates = ceil(candidates / eta)
+        rungs += 1
+
+    return rungs
+
+
+def rung_iterations(iterations: int, eta: int, remaining: int) -> int:
+    """Budget of a rung `remaining` rungs before the last (which runs the full iterations)."""
+    return max(1, ceil(iterations / eta**remaining))
+
+
+def run_tuning(
+    config_path: Path,
+    output_dir: Path,
+    tuning: Tuning,
+    jobs: int = 1,
+    result_format: str = "csv",
+    cache: Optional[ResultCache] = None,
+    progress: Optional[ProgressMonitor] = None,
+) -> pd.DataFrame:
+    """
+    Race the candidates of every tuned optimizer by successive halving.
+
+    Returns
+    -------
+    pd.DataFrame
+        The winner of every race (the rows of tuned.csv).
+    """
+    config = json.loads(config_path.read_text(encoding="utf-8"))
+    experiments = list(iter_experiments(config))
+
+    # Tuned optimizer of every candidate
+    group_of = {name: group for group, candidates in tuning.groups.items() for name in candidates}
+    rungs = {group: halvings(len(candidates), tuning.eta) for group, candidates in tuning.groups.items()}
+    last = max(rungs.values(), default=0)
+
+    # Surviving candidates of each race, keyed by (template, dimensions, tuned optimizer)
+    alive: dict[tuple[str, int, str], list[str]] = {}
+    for experiment in experiments:
+        optimizer = experiment["optimizer"]["name"]
+
+        if optimizer in group_of:
+            template = experiment["experiment_name"].rsplit(f"_{optimizer}_dim", 1)[0]
+            candidates = alive.setdefault((template, experiment["dimensions"], group_of[optimizer]), [])
+
+            if optimizer not in candidates:
+                candidates.append(optimizer)
+
+    tuning_dir = output_dir / TUNING_DIR
+    shutil.rmtree(tuning_dir, ignore_errors=True)
+    rows = []
+
+    for rung in range(last + 1):
+        scheduled = []
+
+        for experiment in experiments:
+            optimizer = experiment["optimizer"]["name"]
+
+            # Untuned optimizers only run at full iterations, next to the finalists
+            if optimizer not in group_of:
+                if rung == last:
+                    scheduled.append(experiment)
+                continue
+
+            group = group_of[optimizer]
+            remaining = last - rung
+            template = experiment["experiment_name"].rsplit(f"_{optimizer}_dim", 1)[0]
+
+            if remaining > rungs[group] or optimizer not in alive[(template, experiment["dimensions"], group)]:
+                continue
+
+            experiment = copy.deepcopy(experiment)
+            experiment["optimizer"]["iterations"] = rung_iterations(experiment["optimizer"]["iterations"], tuning.eta, remaining)
+            scheduled.append(experiment)
+
+        directory = tuning_dir / f"rung_{rung:02d}"
+        directory.mkdir(parents=True)
+        rung_config = directory / "benchmark.json"
+        rung_config.write_text(json.dumps(with_experiments(config, scheduled), indent=2), encoding="utf-8")
+
+        run_benchmark(rung_config, directory, jobs=jobs, result_format=result_format, cache=cache, progress=progress)
+
+        # Rank the candidates of every race by best_mean (runs without values rank last)
+        bests = read_bests(directory)
+        iterations = {exp["optimizer"]["name"]: exp["optimizer"]["iterations"] for exp in scheduled}
+
+        for (template, dimensions, group), candidates in alive.items():
+            if last - rung > rungs[group]:
+                continue
+
+            stats = {}
+            for candidate in candidates:
+                values = np.asarray(bests.get(f"{template}_{candidate}_dim{dimensions}", []))
+                stats[candidate] = (
+                    values.mean() if len(values) else np.inf,
+                    values.std(ddof=1) if len(values) > 1 else np.nan,
+                    len(values),
+                )
+
+            ranked = sorted(candidates, key=lambda c: stats[c][0])
+            keep = ranked[:ceil(len(ranked) / tuning.eta)] if rung < last else ranked[:1]
+
+            rows.extend({
+                "rung": rung,
+                "iterations": iterations[candidate],
+                "template": template,
+                "dimensions": dimensions,
+                "tuned_optimizer": group,
+                "optimizer": candidate,
+                "rank": rank + 1,
+                "best_mean": stats[candidate][0],
+                "best_std": stats[candidate][1],
+                "n_seeds": stats[candidate][2],
+                "kept": candidate in keep,
+            } for rank, candidate in enumerate(ranked))
+
+            alive[(template, dimensions, group)] = keep
+
+        print(f"\nTuning: rung {rung + 1} of {last + 1} ran {len(scheduled)} experiments")
+
+    # The last rung runs the full benchmark definition of every finalist
+    finished = set(completed_experiments(directory / TIMES_FILE))
+    compact_results([directory], output_dir, [exp["experiment_name"] for exp in scheduled if exp["experiment_name"] in finished])
+
+    results = pd.DataFrame(rows)
+    results.to_csv(output_dir / TUNING_FILE, index=False)
+
+    # Winner of every race with its tuned parameter values
+    winners = results[(results["rung"] == last) & (results["rank"] == 1)]
+    tuned = pd.DataFrame([{
+        "template": row.template,
+        "dimensions": row.dimensions,
+        "tuned_optimizer": row.tuned_optimizer,
+        "optimizer": row.optimizer,
+        "parameters": json.dumps(tuning.groups[row.tuned_optimizer][row.optimizer]),
+        "best_mean": row.best_mean,
+        "best_std": row.best_std,
+        "n_seeds": row.n_seeds,
+    } for row in winners.itertuples()])
+    tuned.to_csv(output_dir / TUNED_FILE, index=False)
+
+    total = len(experiments)
+    full_cost = sum(exp["optimizer"]["iterations"] for exp in experiments)
+    used_cost = int(results["iterations"].mul(results["n_seeds"]).sum()) + sum(
+        exp["optimizer"]["iterations"] for exp in scheduled if exp["optimizer"]["name"] not in group_of
+    )
+
+    print(f"Tuning: {len(tuned)} races over {total} experiments, using {used_cost / max(full_cost, 1):.0%} of the iterations of a full grid")
+    for row in tuned.itertuples():
+        print(f"  {row.template} dim {row.dimensions}: {row.optimizer} (best_mean {row.best_mean:g})")
+
+    return tuned
@@ -0,0 +1,38 @@
+from pathlib import Path
+from typing import Union
+
+
+# Must match ResultWriter's output file names
+FITNESS_FILE = "best_fitnesses.csv"
+FITNESS_BINARY_FILE = "best_fitnesses.bin"
+FITNESS_INDEX_FILE = "best_fitnesses.idx"
+TIMES_FILE = "times.csv"
+METRICS_FILE = "metrics.csv"  # Only written by instrumented builds
+
+
+def read_complete_lines(path: Union[str, Path]) -> list[str]:
+    """
+    Read the lines of a result file that the benchmark program has finished
+    writing. Results are streamed while the benchmark runs, so a trailing line
+    without a newline (a write cut short by a crash) is dropped.
+    """
+    with open(path, "r") as f:
+        lines = f.readlines()
+
+    if lines and not lines[-1].endswith("\n"):
+        lines.pop()
+
+    return lines
+
+
+def completed_experiments(times_path: Union[str, Path]) -> list[str]:
+    """
+    Return the names of all finished experiments, in the order they were written.
+
+    The benchmark program writes an experiment's times.csv row only after its
+    convergence data, so times.csv is the record of which experiments completed.
+    """
+    if not Path(times_path).exists():
+        return []
+
+    return [line.split(",", 1)[0] for line in read_complete_lines(times_path)[1:]]
@@ -1,12 +1,445 @@
+import numpy as np
+
 import subprocess
 from pathlib import Path
 import importlib.resources as res
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
+import json
+import os
+import shutil
+
+from .binary_results import read_fitness_binary, write_fitness_binary
+from .cache import ResultCache
+from .progress import ProgressMonitor
+from .sweep import experiment_names, iter_experiments, select, with_experiments
+from .result_files import (
+    FITNESS_FILE, FITNESS_BINARY_FILE, FITNESS_INDEX_FILE, TIMES_FILE, METRICS_FILE,
+    completed_experiments, read_complete_lines,
+)
+
+
+SHARD_DONE_FILE = "DONE"
+RESUME_DIR = "resume"
+MERGE_DIR = "merge"
+CACHE_MISS_DIR = "cache_misses"
+
+
+def clear_fitness_files(directory: Path) -> None:
+    """Remove convergence data (and metrics) from a previous run so stale files are never read."""
+    for path in (FITNESS_FILE, FITNESS_BINARY_FILE, FITNESS_INDEX_FILE, METRICS_FILE):
+        (directory / path).unlink(missing_ok=True)
+
+
+def run_program(cmd: list[str], progress: Optional[ProgressMonitor] = None) -> None:
+    """
+    Run the benchmark program, raising CalledProcessError if it fails.
+    With a ProgressMonitor, its progress events are consumed while it runs.
+    """
+    if progress is None:
+        subprocess.run(cmd, check=True)
+        return
+
+    progress.open()
+
+    try:
+        process = subprocess.Popen(cmd + progress.argument(), pass_fds=(progress.fd,))
+        returncode = process.wait()
+    finally:
+        progress.close()
+
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
 
-def run_benchmark(config_path: Path, output_dir: Path) -> bool:
+
+def run_benchmark(
+    config_path: Path,
+    output_dir: Path,
+    jobs: int = 1,
+    result_format: str = "csv",
+    cache: Optional[ResultCache] = None,
+    progress: Optional[ProgressMonitor] = None,
+) -> bool:
     with res.path("run_benchmark", "benchmark") as exe:
         # Ensure output directory exists
         output_dir.parent.mkdir(parents=True, exist_ok=True)
+        clear_fitness_files(output_dir)
 
-        cmd = [str(exe), str(config_path), str(output_dir)]
-        subprocess.run(cmd, check=True)
-    
+        if cache is not None:
+            run_cached_benchmark(
+                exe, config_path, output_dir, cache,
+                jobs=jobs, result_format=result_format, progress=progress,
+            )
+            return
+
+        cmd = [
+            str(exe), str(config_path), str(output_dir),
+            "--jobs", str(jobs),
+            "--format", result_format,
+        ]
+        run_program(cmd, progress)
+
+
+def run_cached_benchmark(
+    exe: Path,
+    config_path: Path,
+    output_dir: Path,
+    cache: ResultCache,
+    jobs: int = 1,
+    result_format: str = "csv",
+    progress: Optional[ProgressMonitor] = None,
+) -> None:
+    """
+    Run a benchmark, taking results of previously run experiments from `cache`.
+
+    Only cache misses are passed to the benchmark program. They are run in
+    binary format so full-precision curves are cached, and every miss that
+    finishes is cached even if the run fails. The results are then written to
+    output_dir in `result_format`, exactly as the benchmark program would.
+    """
+    config = json.loads(config_path.read_text(encoding="utf-8"))
+
+    # Look up every experiment before launching the benchmark program
+    build_id = cache.build_id(exe)
+    keys = {exp["experiment_name"]: cache.key(exp, build_id) for exp in iter_experiments(config)}
+    names = list(keys)
+    results = {name: entry for name, key in keys.items() if (entry := cache.get(key)) is not None}
+    num_misses = len(names) - len(results)
+
+    print(f"\nResult cache: {len(results)} of {len(names)} experiments cached, running {num_misses}")
+
+    if num_misses:
+        miss_dir = output_dir / CACHE_MISS_DIR
+        miss_dir.mkdir(parents=True, exist_ok=True)
+        miss_config = miss_dir / "benchmark.json"
+
+        # A cold cache runs the definition as is, keeping a sweep compact
+        if results:
+            misses = [exp for exp in iter_experiments(config) if exp["experiment_name"] not in results]
+            config = with_experiments(config, misses)
+
+        miss_config.write_text(json.dumps(config, indent=2), encoding="utf-8")
+
+        try:
+            cmd = [
+                str(exe), str(miss_config), str(miss_dir),
+                "--jobs", str(jobs),
+                "--format", "binary",
+            ]
+            run_program(cmd, progress)
+        finally:
+            for name, result in read_results(miss_dir).items():
+                results[name] = result
+                cache.put(keys[name], *result)
+
+            shutil.rmtree(miss_dir, ignore_errors=True)
+
+    write_results(output_dir, names, results, result_format)
+    cache.evict()
+
+
+def read_results(directory: Path) -> dict[str, tuple[np.ndarray, float, str]]:
+    """Load (curve, execution_time, stop_reason) of every finished experiment in a binary-format results directory."""
+    times = {}
+    for line in read_complete_lines(directory / TIMES_FILE)[1:]:
+        name, runtime, stop_reason = line.strip().split(",")
+        times[name] = (float(runtime), stop_reason)
+
+    index, values = read_fitness_binary(directory / FITNESS_BINARY_FILE)
+
+    return {
+        name: (np.array(values[offset:offset + length]), *times[name])
+        for name, offset, length in index.itertuples(index=False)
+        if name in times
+    }
+
+
+def write_results(
+    directory: Path,
+    names: list[str],
+    results: dict[str, tuple[np.ndarray, float, str]],
+    result_format: str = "csv",
+) -> None:
+    """
+    Write (curve, execution_time, stop_reason) results in the layout of the benchmark program.
+    Numbers are formatted like C++ stream output, so CSV files are identical.
+    """
+    if result_format == "binary":
+        write_fitness_binary(directory / FITNESS_BINARY_FILE, names, [results[name][0] for name in names])
+    else:
+        with open(directory / FITNESS_FILE, "w") as f:
+            for name in names:
+                f.write(name + "," + ",".join(f"{v:g}" for v in results[name][0]) + "\n")
+
+    with open(directory / TIMES_FILE, "w") as f:
+        f.write(",Execution Time,Stop Reason\n")
+        f.writelines(f"{name},{results[name][1]:g},{results[name][2]}\n" for name in names)
+
+
+def shard_dir(output_dir: Path, shard: int) -> Path:
+    return output_dir / "shards" / f"shard_{shard:03d}"
+
+
+def write_shards(config_path: Path, output_dir: Path, shards: int) -> list[Path]:
+    """
+    Split the experiments of a benchmark.json into `shards` round-robin subsets
+    and write one benchmark.json per shard.
+
+    A shard whose config is unchanged keeps its results (and DONE marker), so
+    completed shards are not re-run. Round-robin assignment spreads expensive
+    templates/dimensions evenly across shards. Shards of a sweep are written
+    as the same sweep with a selection, so they stay compact.
+    """
+    config = json.loads(config_path.read_text(encoding="utf-8"))
+
+    shard_dirs = []
+    for i in range(shards):
+        directory = shard_dir(output_dir, i)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        shard_config = select(config, i, shards)
+        shard_json = json.dumps(shard_config, indent=2)
+
+        # Invalidate previous results if the shard definition changed
+        shard_path = directory / "benchmark.json"
+        if not shard_path.exists() or shard_path.read_text(encoding="utf-8") != shard_json:
+            shard_path.write_text(shard_json, encoding="utf-8")
+            (directory / SHARD_DONE_FILE).unlink(missing_ok=True)
+
+        shard_dirs.append(directory)
+
+    return shard_dirs
+
+
+def run_shard(
+    directory: Path,
+    jobs: int = 1,
+    retries: int = 0,
+    result_format: str = "csv",
+    cache: Optional[ResultCache] = None,
+) -> None:
+    """Run a single shard, retrying on failure, and mark it complete."""
+    for attempt in range(retries + 1):
+        try:
+            run_benchmark(directory / "benchmark.json", directory, jobs=jobs, result_format=result_format, cache=cache)
+            break
+        except subprocess.CalledProcessError:
+            if attempt == retries:
+                raise
+
+    (directory / SHARD_DONE_FILE).touch()
+
+
+def merge_results(part_dirs: list[Path], output_dir: Path, names: list[str]) -> None:
+    """
+    Merge per-part convergence data (best_fitnesses.csv or best_fitnesses.bin)
+    and times.csv files into output_dir, ordering rows by `names` (the
+    experiment order of the full benchmark.json). metrics.csv is merged when
+    every part has one.
+    """
+    if all((directory / FITNESS_BINARY_FILE).exists() for directory in part_dirs):
+        merge_binary_fitness(part_dirs, output_dir, names)
+    else:
+        merge_rows(part_dirs, output_dir, FITNESS_FILE, names, header=False)
+
+    if all((directory / METRICS_FILE).exists() for directory in part_dirs):
+        merge_rows(part_dirs, output_dir, METRICS_FILE, names, header=True)
+
+    merge_rows(part_dirs, output_dir, TIMES_FILE, names, header=True)
+
+
+def merge_rows(
+    part_dirs: list[Path],
+    output_dir: Path,
+    filename: str,
+    names: list[str],
+    *,
+    header: bool,
+) -> None:
+    """
+    Merge a CSV keyed by experiment name (first column) from several parts.
+    A row appearing in several parts is taken from the last of them.
+    """
+    rows: dict[str, str] = {}
+    header_line = None
+
+    for directory in part_dirs:
+        lines = read_complete_lines(directory / filename)
+
+        if header and lines:
+            header_line, lines = lines[0], lines[1:]
+
+        for line in lines:
+            rows[line.split(",", 1)[0]] = line
+
+    missing = [name for name in names if name not in rows]
+    if missing:
+        raise ValueError(f"{len(missing)} experiment(s) missing from {filename}, e.g. {missing[0]}")
+
+    with open(output_dir / filename, "w") as f:
+        if header_line is not None:
+            f.write(header_line)
+
+        f.writelines(rows[name] for name in names)
+
+
+def merge_binary_fitness(part_dirs: list[Path], output_dir: Path, names: list[str]) -> None:
+    """Merge binary convergence data from several parts, ordered by `names`."""
+    curves: dict[str, np.ndarray] = {}
+
+    for directory in part_dirs:
+        index, values = read_fitness_binary(directory / FITNESS_BINARY_FILE)
+
+        for name, offset, length in index.itertuples(index=False):
+            curves[name] = values[offset:offset + length]
+
+    missing = [name for name in names if name not in curves]
+    if missing:
+        raise ValueError(f"{len(missing)} experiment(s) missing from {FITNESS_BINARY_FILE}, e.g. {missing[0]}")
+
+    write_fitness_binary(output_dir / FITNESS_BINARY_FILE, names, [curves[name] for name in names])
+
+
+def run_sharded_benchmark(
+    config_path: Path,
+    output_dir: Path,
+    shards: int,
+    *,
+    workers: int | None = None,
+    shard_ids: list[int] | None = None,
+    retries: int = 1,
+    jobs: int = 1,
+    result_format: str = "csv",
+    cache: Optional[ResultCache] = None,
+) -> bool:
+    """
+    Run a benchmark as `shards` independent benchmark processes and merge their
+    results into output_dir.
+
+    Shards already marked complete are skipped, so re-running after a failure
+    only retries the failed shards. `shard_ids` restricts this call to a subset
+    of shards, letting several machines sharing output_dir split the work; the
+    results are merged once every shard is complete.
+
+    Returns
+    -------
+    bool
+        True if all shards are complete and the results were merged.
+    """
+    shard_dirs = write_shards(config_path, output_dir, shards)
+    selected = range(shards) if shard_ids is None else shard_ids
+    pending = [i for i in selected if not (shard_dirs[i] / SHARD_DONE_FILE).exists()]
+
+    if workers is None:
+        workers = min(len(pending), os.cpu_count() or 1)
+
+    print(f"\nRunning {len(pending)} of {shards} shards with {max(workers, 1)} worker(s)")
+
+    # Each shard is a separate benchmark process; threads only wait on them
+    failed = []
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        futures = {
+            pool.submit(run_shard, shard_dirs[i], jobs, retries, result_format, cache): i
+            for i in pending
+        }
+
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except subprocess.CalledProcessError as e:
+                failed.append(futures[future])
+                print(f"\nShard {futures[future]} failed: {e}")
+
+    if failed:
+        print(f"\nShard(s) {sorted(failed)} failed; re-run to retry only those shards")
+        return False
+
+    incomplete = [i for i in range(shards) if not (shard_dirs[i] / SHARD_DONE_FILE).exists()]
+    if incomplete:
+        print(f"\nWaiting on shard(s) {incomplete}; results will be merged once all shards complete")
+        return False
+
+    # Merge in the order of the full benchmark definition
+    config = json.loads(config_path.read_text(encoding="utf-8"))
+    names = list(experiment_names(config))
+    clear_fitness_files(output_dir)
+    merge_results(shard_dirs, output_dir, names)
+
+    return True
+
+
+def resume_benchmark(
+    config_path: Path,
+    output_dir: Path,
+    jobs: int = 1,
+    result_format: str = "csv",
+    cache: Optional[ResultCache] = None,
+    progress: Optional[ProgressMonitor] = None,
+) -> None:
+    """
+    Run only the experiments of a benchmark that have no results in output_dir
+    yet, then merge the new results with the existing ones.
+
+    An experiment counts as finished once its times.csv row is present. The
+    remaining experiments are run in output_dir/resume and the merged results
+    are written back in the order of the full benchmark definition. Whatever
+    finished is merged even if the run fails, so repeated resumes always make
+    progress.
+    """
+    config = json.loads(config_path.read_text(encoding="utf-8"))
+    names = list(experiment_names(config))
+
+    finished = set(completed_experiments(output_dir / TIMES_FILE)) & set(names)
+
+    if not finished: # Nothing to resume from
+        run_benchmark(config_path, output_dir, jobs=jobs, result_format=result_format, cache=cache, progress=progress)
+        return
+
+    # New results must use the format of the results they are merged into
+    existing_format = "binary" if (output_dir / FITNESS_BINARY_FILE).exists() else "csv"
+    if existing_format != result_format:
+        print(f"\nResuming with existing {existing_format} results; ignoring --format {result_format}")
+
+    print(f"\nResuming {config_path}: {len(finished)} of {len(names)} experiments already complete")
+
+    part_dirs = [output_dir]
+    resume_dir = output_dir / RESUME_DIR
+
+    try:
+        remaining = [exp for exp in iter_experiments(config) if exp["experiment_name"] not in finished]
+
+        if remaining:
+            resume_dir.mkdir(parents=True, exist_ok=True)
+            resume_config = resume_dir / "benchmark.json"
+            resume_config.write_text(json.dumps(with_experiments(config, remaining), indent=2), encoding="utf-8")
+
+            part_dirs.append(resume_dir)
+            run_benchmark(
+                resume_config, resume_dir,
+                jobs=jobs, result_format=existing_format, cache=cache, progress=progress,
+            )
+    finally:
+        # Keep every finished experiment, dropping records cut short by a crash
+        part_dirs = [d for d in part_dirs if (d / TIMES_FILE).exists()]
+        finished = set().union(*(completed_experiments(d / TIMES_FILE) for d in part_dirs))
+        compact_results(part_dirs, output_dir, [name for name in names if name in finished])
+        shutil.rmtree(resume_dir, ignore_errors=True)
+
+
+def compact_results(part_dirs: list[Path], output_dir: Path, names: list[str]) -> None:
+    """
+    Merge the results of `names` from several parts (which may include
+    output_dir itself) and replace the result files in output_dir.
+    """
+    merge_dir = output_dir / MERGE_DIR
+    shutil.rmtree(merge_dir, ignore_errors=True)
+    merge_dir.mkdir(parents=True)
+
+    # Merge into a scratch directory first; the parts are still being read
+    merge_results(part_dirs, merge_dir, names)
+    clear_fitness_files(output_dir)
+
+    for path in merge_dir.iterdir():
+        os.replace(path, output_dir / path.name)
+
+    merge_dir.rmdir()
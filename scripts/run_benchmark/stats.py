@@ -0,0 +1,79 @@
+"""
+Confidence intervals of the mean best fitness over seeds.
+"""
+
+import numpy as np
+
+from statistics import NormalDist
+import math
+
+
+NEWTON_STEPS = 4  # Refinements of the Cornish-Fisher estimate (converges quadratically)
+
+
+def t_cdf(t: np.ndarray, df: np.ndarray) -> np.ndarray:
+    """
+    CDF of Student's t distribution for integer `df`, from the closed-form
+    series in cos²θ with θ = atan(t / √df). Arguments broadcast.
+    """
+    t, df = np.broadcast_arrays(np.asarray(t, dtype=np.float64), np.asarray(df, dtype=np.int64))
+    theta = np.arctan(t / np.sqrt(df))
+    cos2 = np.cos(theta)**2
+
+    # Odd df: 2/π (θ + sinθ (cosθ + 2/3 cos³θ + ...)), even df: sinθ (1 + 1/2 cos²θ + ...)
+    odd = df % 2 == 1
+    term = np.where(odd, np.cos(theta), 1.0)
+    total = np.where(df > 1, term, 0.0)
+
+    j = np.where(odd, 3, 2)
+    while (active := j <= df - 2).any():
+        term = np.where(active, term * cos2 * (j - 1) / j, term)
+        total += np.where(active, term, 0.0)
+        j += 2
+
+    a = np.where(odd, 2 / np.pi * (theta + np.sin(theta) * total), np.sin(theta) * total)
+
+    return (1 + a) / 2
+
+
+def t_pdf(t: np.ndarray, df: np.ndarray) -> np.ndarray:
+    """Density of Student's t distribution. Arguments broadcast."""
+    df = np.asarray(df, dtype=np.float64)
+    log_norm = np.vectorize(math.lgamma)((df + 1) / 2) - np.vectorize(math.lgamma)(df / 2)
+
+    return np.exp(log_norm) / np.sqrt(df * np.pi) * (1 + np.square(t) / df) ** (-(df + 1) / 2)
+
+
+def t_quantile(p: float, df: np.ndarray | int) -> np.ndarray | float:
+    """
+    Quantile of Student's t distribution for integer `df` >= 1, which may be
+    an array. df = 1 and 2 have closed forms; otherwise the Cornish-Fisher
+    expansion of the normal quantile is refined by Newton steps on the exact
+    CDF.
+    """
+    df = np.asarray(df, dtype=np.int64)
+    z = NormalDist().inv_cdf(p)
+
+    g1 = (z**3 + z) / 4
+    g2 = (5 * z**5 + 16 * z**3 + 3 * z) / 96
+    g3 = (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / 384
+    g4 = (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z) / 92160
+
+    n = np.maximum(df, 3).astype(np.float64)
+    t = z + g1 / n + g2 / n**2 + g3 / n**3 + g4 / n**4
+
+    for _ in range(NEWTON_STEPS):
+        t = t - (t_cdf(t, n) - p) / t_pdf(t, n)
+
+    t = np.where(df == 1, np.tan(np.pi * (p - 0.5)), t)
+    t = np.where(df == 2, (2 * p - 1) * np.sqrt(2 / (4 * p * (1 - p))), t)
+
+    return t if t.ndim else float(t)
+
+
+def confidence_half_width(values: np.ndarray, confidence: float = 0.95) -> float:
+    """Half-width of the t confidence interval of the mean of `values` (inf for fewer than 2 values)."""
+    if len(values) < 2:
+        return np.inf
+
+    return t_quantile(0.5 + confidence / 2, len(values) - 1) * np.std(values, ddof=1) / np.sqrt(len(values))
@@ -0,0 +1,146 @@
+"""
+Lazy expansion of the experiments of a benchmark.json (see include/Sweep.h).
+
+A benchmark.json either lists every experiment under "experiments", or
+describes them compactly under "sweep" as the product of templates,
+dimensions, optimizers and seeds. The functions here accept both forms and
+expand experiments one at a time, in the same order and with the same
+definitions as the benchmark program, so a sweep of any size is iterated
+without being held in memory.
+"""
+
+from itertools import product
+from typing import Iterator
+
+
+def experiment_name(template_name: str, optimizer_name: str, dimensions: int, seed: int) -> str:
+    """Name of an experiment; the seed suffix is stripped to group runs."""
+    return f"{template_name}_{optimizer_name}_dim{dimensions}_seed{seed}"
+
+
+def _selection(config: dict) -> tuple[int, int]:
+    select = config.get("select", {})
+    return select.get("start", 0), select.get("step", 1)
+
+
+def _total(config: dict) -> int:
+    if "sweep" not in config:
+        return len(config["experiments"])
+
+    sweep = config["sweep"]
+    return (
+        len(sweep["templates"]) * len(sweep["dimensions"])
+        * len(sweep["optimizers"]) * sweep["seeds"]["count"]
+    )
+
+
+def num_experiments(config: dict) -> int:
+    """Number of experiments of a benchmark.json, without expanding them."""
+    start, step = _selection(config)
+    return len(range(start, _total(config), step))
+
+
+def _combinations(sweep: dict) -> list[tuple[dict, int, dict]]:
+    # Seeds vary fastest, then optimizers, dimensions and templates
+    return list(product(sweep["templates"], sweep["dimensions"], sweep["optimizers"]))
+
+
+def _expand(combination: tuple[dict, int, dict], seed: int, generator: str) -> dict:
+    template, dimensions, optimizer = combination
+
+    # Same fields and order as Experiment.to_json_dict()
+    return {
+        "upper_bound": template["upper_bound"],
+        "lower_bound": template["lower_bound"],
+        "problem_type": template["problem_type"],
+        "dimensions": dimensions,
+        "seed": seed,
+        "generator": generator,
+        "optimizer": optimizer,
+        "experiment_name": experiment_name(template["template_name"], optimizer["name"], dimensions, seed),
+    }
+
+
+def iter_experiments(config: dict) -> Iterator[dict]:
+    """Yield the experiment definitions of a benchmark.json in run order."""
+    start, step = _selection(config)
+
+    if "sweep" not in config:
+        yield from config["experiments"][start::step]
+        return
+
+    sweep = config["sweep"]
+    seeds = sweep["seeds"]
+    count = seeds["count"]
+    combinations = _combinations(sweep)
+
+    for index in range(start, _total(config), step):
+        combination, seed_index = divmod(index, count)
+        yield _expand(combinations[combination], seeds["begin"] + seed_index * seeds["step"], sweep["generator"])
+
+
+def experiment_at(config: dict, index: int) -> dict:
+    """Return experiment `index` of a benchmark.json (in run order) without expanding the others."""
+    if not 0 <= index < num_experiments(config):
+        raise IndexError(f"experiment index {index} out of range")
+
+    start, step = _selection(config)
+    position = start + index * step
+
+    if "sweep" not in config:
+        return config["experiments"][position]
+
+    sweep = config["sweep"]
+    seeds = sweep["seeds"]
+
+    # Decompose the position, seeds varying fastest
+    position, seed_index = divmod(position, seeds["count"])
+    position, optimizer = divmod(position, len(sweep["optimizers"]))
+    template, dimension = divmod(position, len(sweep["dimensions"]))
+
+    combination = (sweep["templates"][template], sweep["dimensions"][dimension], sweep["optimizers"][optimizer])
+    return _expand(combination, seeds["begin"] + seed_index * seeds["step"], sweep["generator"])
+
+
+def experiment_names(config: dict) -> Iterator[str]:
+    """Yield the experiment names of a benchmark.json in run order."""
+    for experiment in iter_experiments(config):
+        yield experiment["experiment_name"]
+
+
+def iter_experiment_groups(config: dict) -> Iterator[dict]:
+    """
+    Yield at least one experiment definition per group of runs differing only
+    in their seed (exactly one for a sweep, which ignores any selection).
+    """
+    if "sweep" not in config:
+        yield from config["experiments"]
+        return
+
+    sweep = config["sweep"]
+    for combination in _combinations(sweep):
+        yield _expand(combination, sweep["seeds"]["begin"], sweep["generator"])
+
+
+def select(config: dict, start: int, step: int) -> dict:
+    """
+    Return a benchmark.json holding every `step`-th experiment from `start`.
+    A sweep stays compact; an explicit list is sliced.
+    """
+    if "sweep" not in config:
+        return with_experiments(config, list(iter_experiments(config))[start::step])
+
+    # Compose with an existing selection
+    outer_start, outer_step = _selection(config)
+    return dict(config, select={"start": outer_start + outer_step * start, "step": outer_step * step})
+
+
+def with_experiments(config: dict, experiments: list[dict]) -> dict:
+    """Return a benchmark.json explicitly listing `experiments` (e.g. a subset of `config`)."""
+    header = {k: v for k, v in config.items() if k not in ("sweep", "select", "experiments")}
+    return dict(header, experiments=experiments)
+
+
+def expand(config: dict) -> dict:
+    """Return the fully expanded form of a benchmark.json, listing every experiment."""
+    return with_experiments(config, list(iter_experiments(config)))
@@ -0,0 +1,148 @@
+"""
+Worker of a benchmark distributed by a coordinator (see coordinator.py).
+
+A worker runs `slots` experiments at a time, each leased from the
+coordinator and executed by its own benchmark process. Leases are kept
+alive by a heartbeat thread; an experiment whose run fails is released so
+another worker can retry it. The worker exits once the coordinator reports
+that every experiment has finished, or when it cannot be reached.
+"""
+
+from pathlib import Path
+from typing import Optional
+import importlib.resources as res
+import json
+import os
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from .coordinator import HEARTBEAT_INTERVAL, encode_curve
+from .run_experiments import read_results
+
+
+POLL_INTERVAL = 2.0     # Seconds between lease attempts while all jobs are running elsewhere
+CONNECT_RETRIES = 5     # Failed requests in a row before the coordinator is considered gone
+
+
+class Worker:
+    def __init__(self, url: str, slots: int):
+        self.url = url.rstrip("/")
+        self.slots = slots
+        self.name = f"{socket.gethostname()}-{os.getpid()}"
+
+        self.held: set[int] = set()
+        self.lock = threading.Lock()
+        self.stop = threading.Event()
+        self.completed = 0
+
+    def request(self, path: str, body: Optional[dict] = None) -> dict:
+        """POST `body` (GET if None) to the coordinator, retrying on connection errors."""
+        data = None if body is None else json.dumps(dict(body, worker=self.name)).encode("utf-8")
+
+        for attempt in range(CONNECT_RETRIES):
+            try:
+                request = urllib.request.Request(self.url + path, data=data, headers={"Content-Type": "application/json"})
+                with urllib.request.urlopen(request, timeout=30) as response:
+                    return json.loads(response.read())
+            except (urllib.error.URLError, ConnectionError, TimeoutError):
+                if attempt + 1 == CONNECT_RETRIES:
+                    raise
+                time.sleep(POLL_INTERVAL * (attempt + 1))
+
+    def heartbeat(self) -> None:
+        while not self.stop.wait(HEARTBEAT_INTERVAL):
+            with self.lock:
+                jobs = list(self.held)
+
+            try:
+                self.request("/heartbeat", {"jobs": jobs})
+            except OSError:
+                pass  # Leases time out if the coordinator stays unreachable
+
+    def run_job(self, exe: Path, job: dict) -> None:
+        with tempfile.TemporaryDirectory(prefix="benchmark_job_") as tmp:
+            directory = Path(tmp)
+            config_path = directory / "benchmark.json"
+            config_path.write_text(json.dumps(job["config"]), encoding="utf-8")
+
+            try:
+                subprocess.run(
+                    [str(exe), str(config_path), str(directory), "--format", "binary"],
+                    check=True, stdout=subprocess.DEVNULL,
+                )
+                curve, runtime, stop_reason = next(iter(read_results(directory).values()))
+            except (subprocess.CalledProcessError, OSError, StopIteration) as e:
+                print(f"Experiment {job['id']} failed: {e}", flush=True)
+                self.request("/release", {"id": job["id"]})
+                return
+
+        self.request("/result", {
+            "id": job["id"],
+            "curve": encode_curve(curve),
+            "runtime": runtime,
+            "stop_reason": stop_reason,
+        })
+
+        with self.lock:
+            self.completed += 1
+
+    def slot(self, exe: Path) -> None:
+        while not self.stop.is_set():
+            try:
+                reply = self.request("/lease", {})
+            except OSError:
+                print(f"Coordinator at {self.url} unreachable; stopping", flush=True)
+                self.stop.set()
+                return
+
+            job = reply["job"]
+
+            if job is None:
+                if reply["done"]:
+                    self.stop.set()
+                else: # Remaining jobs are running elsewhere but may be reassigned
+                    self.stop.wait(POLL_INTERVAL)
+                continue
+
+            with self.lock:
+                self.held.add(job["id"])
+
+            try:
+                self.run_job(exe, job)
+            except OSError:
+                pass  # The coordinator reassigns the job once its lease expires
+            finally:
+                with self.lock:
+                    self.held.discard(job["id"])
+
+
+def run_worker(url: str, slots: int = 1) -> int:
+    """
+    Run experiments leased from the coordinator at `url` until the benchmark
+    is complete, `slots` at a time (0 = one per CPU core).
+
+    Returns
+    -------
+    int
+        Number of experiments this worker completed.
+    """
+    worker = Worker(url, slots or os.cpu_count() or 1)
+    print(f"\nWorker {worker.name} running {worker.slots} experiment(s) at a time for {worker.url}")
+
+    with res.path("run_benchmark", "benchmark") as exe:
+        threading.Thread(target=worker.heartbeat, daemon=True).start()
+
+        threads = [threading.Thread(target=worker.slot, args=(exe,)) for _ in range(worker.slots)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    worker.stop.set()
+    print(f"Worker {worker.name} finished {worker.completed} experiment(s)")
+    return worker.completed
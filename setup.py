@@ -3,6 +3,7 @@ from setuptools.command.build_py import build_py
 import subprocess
 import pathlib
 import shutil
+import os
 
 class BuildCppBinary(build_py):
     """Custom build step: compile C++ binary with Makefile in release mode."""
@@ -15,11 +16,13 @@ class BuildCppBinary(build_py):
         if not (project_root / "Makefile").exists():
             raise FileNotFoundError(f"No Makefile found in {project_root}")
 
-        # Run make in release mode
-        subprocess.check_call(["make", "MODE=release"], cwd=project_root)
+        # Run make in release mode (INSTRUMENT=1 in the environment builds the instrumented variant)
+        instrument = os.environ.get("INSTRUMENT", "0")
+        subprocess.check_call(["make", "MODE=release", f"INSTRUMENT={instrument}", "all", "shared"], cwd=project_root)
 
         # Copy the resulting binary into the Python package
-        bin_src = project_root / "bin/release/benchmark"  # Must match your Makefile TARGET
+        variant = "release-instrumented" if instrument == "1" else "release"
+        bin_src = project_root / "bin" / variant / "benchmark"  # Must match your Makefile TARGET
         if not bin_src.exists():
             raise FileNotFoundError(f"C++ binary not found: {bin_src}")
 
@@ -28,6 +31,9 @@ class BuildCppBinary(build_py):
         pkg_dir.mkdir(parents=True, exist_ok=True)
         shutil.copy2(bin_src, pkg_dir / "benchmark")
 
+        # Shared library used by the in-process engine (run_benchmark.native)
+        shutil.copy2(bin_src.with_name("libbenchmark.so"), pkg_dir / "libbenchmark.so")
+
         # Continue the normal Python build
         super().run()
 
@@ -0,0 +1,98 @@
+#include "ConfigParser.h"
+
+#include <iostream>
+
+#include "debug.h"
+#include "Optimizer/StoppingCriteria.h"
+#include "RandomGenerator.h"
+
+
+ExperimentConfig parseExperimentConfig(const nlohmann::json& item) {
+    ExperimentConfig cfg;
+
+    // Basic fields
+    cfg.experimentName = item.value("experiment_name", "");
+    cfg.problemType = item.value("problem_type", 0);
+    cfg.dimensions = item.value("dimensions", 0);
+    cfg.lower = item.value("lower_bound", 0.0);
+    cfg.upper = item.value("upper_bound", 0.0);
+    cfg.seed = item.value("seed", 1);
+    cfg.generator = item.value("generator", RandomGenerator::DEFAULT);
+
+    // Optimizer fields (stopping criteria default to disabled)
+    const StoppingCriteria defaults;
+
+    if (item.contains("optimizer") && item["optimizer"].is_object()) {
+        const auto& opt = item["optimizer"];
+        cfg.optimizer = opt.value("type", "");
+        cfg.maxIterations = opt.value("iterations", 1);
+        cfg.neighborDelta = opt.value("delta", 0.0);
+        cfg.numNeighbors = opt.value("num_neighbors", 0);
+        cfg.threads = opt.value("threads", 0);
+        cfg.populationSize = opt.value("population_size", 0);
+        cfg.scale = opt.value("scale", 0.0);
+        cfg.crossoverRate = opt.value("crossover_rate", 0.0);
+        cfg.mutation = opt.value("mutation", "rand/1");
+        cfg.crossover = opt.value("crossover", "bin");
+        cfg.islands = opt.value("islands", 1);
+        cfg.migrationInterval = opt.value("migration_interval", 10);
+        cfg.migrants = opt.value("migrants", 1);
+        cfg.topology = opt.value("topology", "ring");
+        cfg.maxEvaluations = opt.value("max_evaluations", defaults.maxEvaluations);
+        cfg.targetFitness = opt.value("target_fitness", defaults.targetFitness);
+        cfg.stagnationWindow = opt.value("stagnation_window", defaults.stagnationWindow);
+        cfg.stagnationTolerance = opt.value("stagnation_tolerance", defaults.stagnationTolerance);
+        cfg.timeLimit = opt.value("time_limit", defaults.timeLimit);
+        cfg.trace = opt.value("trace", "full");
+        cfg.traceInterval = opt.value("trace_interval", 1);
+    } else { // No optimizer provided
+        cfg.optimizer = "";
+        cfg.maxIterations = 0;
+        cfg.neighborDelta = 0.0;
+        cfg.numNeighbors = 0;
+        cfg.threads = 0;
+        cfg.populationSize = 0;
+        cfg.scale = 0.0;
+        cfg.crossoverRate = 0.0;
+        cfg.mutation = "";
+        cfg.crossover = "";
+        cfg.islands = 1;
+        cfg.migrationInterval = 10;
+        cfg.migrants = 1;
+        cfg.topology = "";
+        cfg.maxEvaluations = defaults.maxEvaluations;
+        cfg.targetFitness = defaults.targetFitness;
+        cfg.stagnationWindow = defaults.stagnationWindow;
+        cfg.stagnationTolerance = defaults.stagnationTolerance;
+        cfg.timeLimit = defaults.timeLimit;
+        cfg.trace = "full";
+        cfg.traceInterval = 1;
+    }
+
+    // Streamed traces need a destination, chosen by the caller
+    cfg.traceFile = "";
+
+    debug::log(
+        "\n\nExperiment Config Created for ",
+        cfg.experimentName, "\t(", cfg.problemType, ")",
+        "\n Range: [", cfg.lower, ", ", cfg.upper, "]",
+        "\nDimensions: ", cfg.dimensions,
+        "\nSeed/Generator: ", cfg.seed, ", ", cfg.generator,
+        "\nOptimizer: ", cfg.optimizer, 
+        "\nIterations: ", cfg.maxIterations,
+        "\nNeighbors/Max Delta/Threads: ", cfg.numNeighbors,
+        ", ", cfg.neighborDelta, ", ", cfg.threads,
+        "\nPopulation/F/CR: ", cfg.populationSize,
+        ", ", cfg.scale, ", ", cfg.crossoverRate,
+        "\nMutation/Crossover: ", cfg.mutation, ", ", cfg.crossover,
+        "\nIslands/Migration Interval/Migrants/Topology: ", cfg.islands,
+        ", ", cfg.migrationInterval, ", ", cfg.migrants, ", ", cfg.topology,
+        "\nMax Evaluations/Target/Time Limit: ", cfg.maxEvaluations,
+        ", ", cfg.targetFitness, ", ", cfg.timeLimit,
+        "\nStagnation Window/Tolerance: ", cfg.stagnationWindow,
+        ", ", cfg.stagnationTolerance,
+        "\nTrace/Interval: ", cfg.trace, ", ", cfg.traceInterval
+    );
+
+    return cfg;
+}
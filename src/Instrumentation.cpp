@@ -0,0 +1,52 @@
+#include "Instrumentation.h"
+
+#include <cstdlib>
+#include <new>
+
+
+namespace instrumentation {
+
+// Constant-initialized, so it is safe to use from operator new
+thread_local Metrics metrics;
+
+Metrics& current() {
+    return metrics;
+}
+
+} // namespace instrumentation
+
+
+#ifdef INSTRUMENT
+
+// Count heap allocations of the current experiment
+void* operator new(std::size_t size) {
+    instrumentation::metrics.allocations++;
+    instrumentation::metrics.allocatedBytes += size;
+
+    if(void* ptr = std::malloc(size ? size : 1))
+        return ptr;
+
+    throw std::bad_alloc();
+}
+
+void* operator new[](std::size_t size) {
+    return ::operator new(size);
+}
+
+void operator delete(void* ptr) noexcept {
+    std::free(ptr);
+}
+
+void operator delete[](void* ptr) noexcept {
+    std::free(ptr);
+}
+
+void operator delete(void* ptr, std::size_t) noexcept {
+    std::free(ptr);
+}
+
+void operator delete[](void* ptr, std::size_t) noexcept {
+    std::free(ptr);
+}
+
+#endif
@@ -0,0 +1,144 @@
+#include "NativeApi.h"
+
+#include <array>
+#include <exception>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include <External/json.hpp>
+
+#include "ConfigParser.h"
+#include "ProblemFactory.h"
+#include "SolutionBuilder.h"
+#include "Optimizer/OptimizerFactory.h"
+
+
+/// Results owned by the caller through an opaque handle
+struct nob_result {
+    std::vector<double> bestFitnesses;
+    std::vector<double> bestSolution;
+    double runtime;
+    StopReason stopReason;
+};
+
+
+namespace {
+
+constexpr int NUM_PROBLEMS = 10; ///< Problem IDs 1..10 (see ProblemFactory)
+
+thread_local std::string lastError;
+
+/// @return Shared instance of a problem; throws std::out_of_range for unknown IDs.
+const Problem& getProblem(int problemType) {
+    // Problems are immutable, so one instance per type serves every thread
+    static const std::array<std::unique_ptr<Problem>, NUM_PROBLEMS> problems = []() {
+        std::array<std::unique_ptr<Problem>, NUM_PROBLEMS> created;
+
+        for(int id = 1; id <= NUM_PROBLEMS; id++)
+            created[id - 1] = ProblemFactory::create(id);
+
+        return created;
+    }();
+
+    if(problemType < 1 || problemType > NUM_PROBLEMS)
+        throw std::out_of_range("Invalid problem ID: " + std::to_string(problemType));
+
+    return *problems[problemType - 1];
+}
+
+/// Runs @p body, converting exceptions into @p failure and a stored error message
+template<typename Body, typename Result>
+Result guarded(Body&& body, Result failure) {
+    try {
+        lastError.clear();
+        return body();
+    } catch(const std::exception& e) {
+        lastError = e.what();
+    } catch(...) {
+        lastError = "Unknown error";
+    }
+
+    return failure;
+}
+
+} // anonymous namespace
+
+
+extern "C" {
+
+int nob_abi_version(void) {
+    return NOB_ABI_VERSION;
+}
+
+const char* nob_last_error(void) {
+    return lastError.c_str();
+}
+
+int nob_problem_bounds(int problemType, double* lower, double* upper) {
+    return guarded([&]() {
+        const Problem& problem = getProblem(problemType);
+        *lower = problem.getLowerBound();
+        *upper = problem.getUpperBound();
+        return 0;
+    }, -1);
+}
+
+int nob_evaluate(int problemType, const double* x, size_t count, size_t dimensions, double* fitness) {
+    return guarded([&]() {
+        getProblem(problemType).evaluateBatch(x, count, dimensions, fitness);
+        return 0;
+    }, -1);
+}
+
+nob_result* nob_run_experiment(const char* experimentJson) {
+    return guarded([&]() -> nob_result* {
+        ExperimentConfig config = parseExperimentConfig(nlohmann::json::parse(experimentJson));
+
+        // Same setup as RunExperiments::runExperiment, so results match the benchmark program
+        std::unique_ptr<Problem> problem = ProblemFactory::create(config.problemType);
+        SolutionBuilder builder(config.dimensions, config.lower, config.upper, config.seed, config.generator);
+        std::unique_ptr<Optimizer> optimizer = OptimizerFactory::initOptimizer(*problem, config, builder);
+
+        if(!optimizer)
+            throw std::invalid_argument("Unsupported optimizer type: " + config.optimizer);
+
+        auto result = std::make_unique<nob_result>();
+        result->runtime = optimizer->optimize();
+        result->bestFitnesses = std::move(optimizer->getBestFitnesses());
+        result->bestSolution = std::move(optimizer->getBestSolution());
+        result->stopReason = optimizer->getStopReason();
+
+        return result.release();
+    }, static_cast<nob_result*>(nullptr));
+}
+
+size_t nob_result_length(const nob_result* result) {
+    return result->bestFitnesses.size();
+}
+
+const double* nob_result_fitnesses(const nob_result* result) {
+    return result->bestFitnesses.data();
+}
+
+size_t nob_result_solution_length(const nob_result* result) {
+    return result->bestSolution.size();
+}
+
+const double* nob_result_solution(const nob_result* result) {
+    return result->bestSolution.data();
+}
+
+double nob_result_runtime(const nob_result* result) {
+    return result->runtime;
+}
+
+const char* nob_result_stop_reason(const nob_result* result) {
+    return stopReasonName(result->stopReason);
+}
+
+void nob_result_free(nob_result* result) {
+    delete result;
+}
+
+} // extern "C"
@@ -1,28 +1,54 @@
 #include "Optimizer/Blind.h"
 
+#include <algorithm>
+#include <chrono>
 #include <limits>
 
+#include "Instrumentation.h"
+
 
 double Blind::optimize() {
     // Start timing
     using clock = std::chrono::high_resolution_clock;
     auto start = clock::now();
+    beginRun(maxIterations);
+
+    // Samples are generated in place and evaluated in contiguous blocks
+    std::vector<double> fitness(BLOCK_SIZE);
+    int sampled = 0;
 
     // Iterate population
-    for(int i = 0; i < maxIterations; i++) {
-        // Get neighbors
-        solutions[i] = solutionBuilder.getRand();
+    while(sampled < maxIterations) {
+        int blockSize = std::min(BLOCK_SIZE, maxIterations - sampled);
 
-        // Set next fitness
-        bestFitnesses[i] = problem.evaluate(solutions[i]);
+        // Never exceed the evaluation budget
+        if(stopping.maxEvaluations > 0)
+            blockSize = static_cast<int>(std::min<long long>(blockSize, stopping.maxEvaluations - evaluations));
 
-        // Update best fitness
-        if(i > 0 && bestFitnesses[i-1] < bestFitnesses[i]) {
-            bestFitnesses[i] = bestFitnesses[i - 1];
-            solutions[i] = solutions[i - 1];
+        // Get random samples
+        {
+            instrumentation::ScopedTimer timer(instrumentation::Phase::Generation);
+
+            for(int k = 0; k < blockSize; k++)
+                solutionBuilder.getRand(samples.row(k));
         }
+
+        // Evaluate block of samples
+        evaluateBatch(samples.data(), blockSize, fitness.data());
+
+        // Update best fitness and solution
+        for(int k = 0; k < blockSize; k++)
+            trace.record(fitness[k], samples.row(k));
+
+        sampled += blockSize;
+
+        // Stopping criteria are checked once per block
+        if(shouldStop())
+            break;
     }
 
+    endRun();
+
     // Return execution time
     return std::chrono::duration<double>(clock::now() - start).count();
 }
@@ -1,68 +1,260 @@
 #include "Optimizer/DifferentialEvolution.h"
 
-#include <limits>
+#include <algorithm>
+#include <barrier>
+#include <chrono>
+#include <numeric>
+#include <thread>
 
-std::vector<std::vector<double>> DifferentialEvolution::initPopulation() {
-    std::vector<std::vector<double>> pop(popSize);
+#include "Instrumentation.h"
 
-    for(int i = 0; i < popSize; i++) {
-        pop[i] = solutionBuilder.getRand();
+
+void DifferentialEvolution::initialize(Island& island, int size, SolutionBuilder& builder) {
+    const std::size_t dimensions = solutionBuilder.getDimensions();
+
+    island.population.resize(size, dimensions);
+    island.trials.resize(size, dimensions);
+    island.fitness.resize(size);
+    island.trialFitness.resize(size);
+    island.mutant.resize(dimensions);
+
+    // Randomly initialize population
+    {
+        instrumentation::ScopedTimer timer(instrumentation::Phase::Generation);
+        builder.getRand(island.population);
     }
 
-    return pop;
+    // Fitness of each individual is only computed once, when it enters the population
+    problem.evaluateBatch(island.population.data(), size, dimensions, island.fitness.data());
 }
 
+std::size_t DifferentialEvolution::best(const Island& island) {
+    return std::min_element(island.fitness.begin(), island.fitness.end()) - island.fitness.begin();
+}
 
+void DifferentialEvolution::evolve(Island& island, SolutionBuilder& builder) {
+    Population& pop = island.population;
+    const int size = static_cast<int>(pop.size());
+    const std::size_t dimensions = pop.getDimensions();
 
-double DifferentialEvolution::optimize() {
-    // Allocate memory to store best fitness per iteration
-    bestFitnesses.resize(maxIterations, std::numeric_limits<double>::max());
-    
-    // Start timing
-    using clock = std::chrono::high_resolution_clock;
-    auto start = clock::now();
+    // Locate best member of the current population
+    const double* bestVector = pop.row(best(island));
 
-    // Randomly initialize population
-    std::vector<std::vector<double>> pop = initPopulation();
-    
-    // Stores initial fitness values
-    std::vector<double> initFitness(popSize);
-    
-    for(int i = 0; i < maxIterations; i++) {
-        // Temporarily stores new population
-        std::vector<std::vector<double>> newPop = pop;
+    // Build trial vectors for the whole population
+    {
+        instrumentation::ScopedTimer timer(instrumentation::Phase::Generation);
 
-        // Calculate fitnesses for initial population
-        for(int j = 0; j < popSize; j++) {
+        for(int j = 0; j < size; j++) {
             // Get mutated vector
-            std::vector<double> mutated =
-                mutStrat->mutate(pop, j, scale, bestVector, solutionBuilder);
-                
+            mutStrat->mutate(pop, j, scale, bestVector, builder, island.mutant.data());
+
             // Create crossover vector
-            crossStrat->crossover(newPop[j], mutated, crossover, solutionBuilder);
+            std::copy(pop.row(j), pop.row(j) + dimensions, island.trials.row(j));
+            crossStrat->crossover(island.trials.row(j), island.mutant.data(), dimensions, crossover, builder);
+        }
+    }
+
+    // Calculate fitness of trial vectors
+    problem.evaluateBatch(island.trials.data(), size, dimensions, island.trialFitness.data());
+
+    // Replace targets by better trial vectors
+    for(int j = 0; j < size; j++) {
+        if(island.trialFitness[j] < island.fitness[j]) {
+            std::copy(island.trials.row(j), island.trials.row(j) + dimensions, pop.row(j));
+            island.fitness[j] = island.trialFitness[j];
+        }
+    }
+}
+
+void DifferentialEvolution::migrate(std::vector<Island>& islands) {
+    const std::size_t count = islands.size();
+    const std::size_t dimensions = solutionBuilder.getDimensions();
 
-            // Calculate fitness of original and trial vectors
-            double oldFitness = problem.evaluate(pop[j]);
-            double newFitness = problem.evaluate(newPop[j]);
+    // Rank every island's individuals from best to worst (ties by position)
+    std::vector<std::vector<std::size_t>> ranks(count);
 
-            // Trial vector less optimal
-            if(oldFitness <= newFitness) {
-                newPop[j] = pop[j];
+    for(std::size_t i = 0; i < count; i++) {
+        const std::vector<double>& fitness = islands[i].fitness;
 
-                // Update iteration fitness
-                if(oldFitness < bestFitnesses[i])
-                    bestFitnesses[i] = oldFitness;
-            } else if(newFitness < bestFitnesses[i]) {
-                bestFitnesses[i] = newFitness;
+        ranks[i].resize(fitness.size());
+        std::iota(ranks[i].begin(), ranks[i].end(), 0);
+        std::stable_sort(ranks[i].begin(), ranks[i].end(), [&](std::size_t a, std::size_t b) {
+            return fitness[a] < fitness[b];
+        });
+    }
+
+    // Copy all emigrants before any island is changed
+    std::vector<Population> emigrants(count);
+    std::vector<std::vector<double>> emigrantFitness(count);
+
+    for(std::size_t i = 0; i < count; i++) {
+        const std::size_t sent = std::min<std::size_t>(islandModel.migrants, ranks[i].size());
+
+        emigrants[i].resize(sent, dimensions);
+        emigrantFitness[i].resize(sent);
+
+        for(std::size_t m = 0; m < sent; m++) {
+            const double* row = islands[i].population.row(ranks[i][m]);
+            std::copy(row, row + dimensions, emigrants[i].row(m));
+            emigrantFitness[i][m] = islands[i].fitness[ranks[i][m]];
+        }
+    }
+
+    for(std::size_t i = 0; i < count; i++) {
+        Island& island = islands[i];
+
+        // Immigrants of this island, best first (ties by source island)
+        std::vector<std::pair<double, const double*>> immigrants;
+
+        for(std::size_t source = 0; source < count; source++) {
+            const bool neighbor = islandModel.topology == MigrationTopology::Complete
+                ? source != i
+                : (source + 1) % count == i;
+
+            if(!neighbor)
+                continue;
+
+            for(std::size_t m = 0; m < emigrants[source].size(); m++)
+                immigrants.emplace_back(emigrantFitness[source][m], emigrants[source].row(m));
+        }
+
+        std::stable_sort(immigrants.begin(), immigrants.end(), [](const auto& a, const auto& b) {
+            return a.first < b.first;
+        });
+
+        // Best immigrants replace the worst residents they improve on; the island's best always stays
+        const std::size_t replaced = std::min(immigrants.size(), ranks[i].size() - 1);
+
+        for(std::size_t m = 0; m < replaced; m++) {
+            const std::size_t resident = ranks[i][ranks[i].size() - 1 - m];
+
+            if(immigrants[m].first < island.fitness[resident]) {
+                std::copy(immigrants[m].second, immigrants[m].second + dimensions, island.population.row(resident));
+                island.fitness[resident] = immigrants[m].first;
             }
+        }
+    }
+}
+
+void DifferentialEvolution::optimizeSingle() {
+    // The initial population is charged against the budget like a generation
+    if(!budgetAllows(popSize))
+        return;
+
+    Island island;
+    initialize(island, popSize, solutionBuilder);
+    evaluations += popSize;
+
+    for(int i = 0; i < maxIterations; i++) {
+        if(!budgetAllows(popSize))
+            break;
+
+        evolve(island, solutionBuilder);
+        evaluations += popSize;
+
+        // Record best member of the generation
+        const std::size_t bestIndex = best(island);
+        trace.record(island.fitness[bestIndex], island.population.row(bestIndex));
+
+        // A collapsed population is caught by the stagnation criterion
+        if(shouldStop())
+            break;
+    }
+}
+
+void DifferentialEvolution::optimizeIslands() {
+    const int count = islandModel.islands;
+
+    // The initial populations are charged against the budget like a generation
+    if(!budgetAllows(popSize))
+        return;
+
+    std::vector<Island> islands(count);
+    std::vector<instrumentation::Metrics> workerMetrics(count);
+    int generation = 0;
+    bool stop = false;
+
+    // Runs on one thread while the others wait, so all shared state is updated here
+    auto completion = [&]() noexcept {
+        evaluations += popSize;
+
+        if(generation > 0) {
+            // Record best member over all islands (ties by island)
+            std::size_t bestIsland = 0;
+            for(int i = 1; i < count; i++) {
+                if(islands[i].fitness[best(islands[i])] < islands[bestIsland].fitness[best(islands[bestIsland])])
+                    bestIsland = i;
+            }
+
+            const std::size_t bestIndex = best(islands[bestIsland]);
+            trace.record(islands[bestIsland].fitness[bestIndex], islands[bestIsland].population.row(bestIndex));
+
+            if(shouldStop()) {
+                stop = true;
+                return;
+            }
+        }
+
+        // Same checks as the single population loop before its next generation
+        if(generation == maxIterations || !budgetAllows(popSize)) {
+            stop = true;
+            return;
+        }
+
+        if(generation > 0 && generation % std::max(islandModel.interval, 1) == 0)
+            migrate(islands);
+
+        generation++;
+    };
 
+    std::barrier sync(count, completion);
+
+    auto run = [&](int i) {
+        SolutionBuilder builder = solutionBuilder.substream(i);
+
+        // Split the population as evenly as possible
+        initialize(islands[i], popSize / count + (i < popSize % count), builder);
+        sync.arrive_and_wait();
+
+        while(!stop) {
+            evolve(islands[i], builder);
+            sync.arrive_and_wait();
         }
+    };
 
-        pop = newPop;
+    // Island 0 runs on the calling thread
+    std::vector<std::thread> pool;
+    pool.reserve(count - 1);
 
+    for(int i = 1; i < count; i++) {
+        pool.emplace_back([&, i]() {
+            instrumentation::reset();
+            run(i);
+            workerMetrics[i] = instrumentation::current();
+        });
     }
 
+    run(0);
 
-    return std::chrono::duration<double>(clock::now() - start).count();
+    for(std::thread& thread : pool)
+        thread.join();
+
+    for(int i = 1; i < count; i++)
+        instrumentation::merge(workerMetrics[i]);
 }
 
+double DifferentialEvolution::optimize() {
+    // Start timing
+    using clock = std::chrono::high_resolution_clock;
+    auto start = clock::now();
+    beginRun(maxIterations);
+
+    if(islandModel.islands > 1)
+        optimizeIslands();
+    else
+        optimizeSingle();
+
+    endRun();
+
+    return std::chrono::duration<double>(clock::now() - start).count();
+}
@@ -1,10 +1,38 @@
+
 #include "Optimizer/LocalSearch.h"
 
+#include <chrono>
 #include <limits>
+#include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <mutex>
+#include <thread>
+
+#include "Instrumentation.h"
+
+void LocalSearch::prepare(Workspace& workspace) {
+    const std::size_t dimensions = solutionBuilder.getDimensions();
+
+    workspace.solution.resize(dimensions);
+    workspace.neighbors.resize(numNeighbors, dimensions);
+    workspace.fitness.resize(numNeighbors);
+}
+
+template<typename Allow, typename Record>
+bool LocalSearch::descend(SolutionBuilder& builder, Workspace& workspace, Allow&& allow, Record&& record) {
+    std::vector<double>& curSolution = workspace.solution;
+    const std::size_t dimensions = curSolution.size();
 
-void LocalSearch::localSearch() {
     // Get initial population pseudo-randomly
-    std::vector<double> curSolution = solutionBuilder.getRand();
+    {
+        instrumentation::ScopedTimer timer(instrumentation::Phase::Generation);
+        builder.getRand(curSolution.data());
+    }
+
+    if(!allow(1))
+        return false;
+
     double curFitness = problem.evaluate(curSolution);
     bool minimaFound = false;
 
@@ -12,53 +40,197 @@ void LocalSearch::localSearch() {
     while(!minimaFound) {
         minimaFound = true;
 
+        if(!allow(numNeighbors))
+            return false;
+
         // Get set of neighbors
-        std::vector<std::vector<double>> neighbors = solutionBuilder.getNeighbors(
-            curSolution,
-            numNeighbors,
-            delta
-        );
+        {
+            instrumentation::ScopedTimer timer(instrumentation::Phase::Generation);
+
+            builder.getNeighbors(
+                curSolution.data(),
+                numNeighbors,
+                delta,
+                workspace.neighbors
+            );
+        }
+
+        // Evaluate all neighbors' fitness in one call
+        problem.evaluateBatch(workspace.neighbors.data(), numNeighbors, dimensions, workspace.fitness.data());
 
         // Track local minima
         int bestNeighborIdx = -1;
         double bestNeighborFitness = std::numeric_limits<double>::max();
 
         // Check all neighbors
-        for(size_t i = 0; i < neighbors.size(); i++) {
-            // Evaluate neighbor's fitness
-            double neighborFitness = problem.evaluate(neighbors[i]);
-
+        for(int i = 0; i < numNeighbors; i++) {
             // Better neighbor found, update stats
-            if(neighborFitness < bestNeighborFitness) {
+            if(workspace.fitness[i] < bestNeighborFitness) {
                 bestNeighborIdx = i;
-                bestNeighborFitness = neighborFitness;
+                bestNeighborFitness = workspace.fitness[i];
             }
-        }   
+        }
 
         // Compare best neighbor to center fitness
         if(bestNeighborFitness < curFitness) {
             minimaFound = false;
-            curSolution = neighbors[bestNeighborIdx];
+            const double* best = workspace.neighbors.row(bestNeighborIdx);
+            std::copy(best, best + dimensions, curSolution.begin());
             curFitness = bestNeighborFitness;
-        } 
+        }
 
-        // Append best found fitness to results
-        if(!bestFitnesses.size() || bestFitnesses.back() > curFitness)
-            bestFitnesses.push_back(curFitness); // New best found
-        else // No new best found
-            bestFitnesses.push_back(bestFitnesses.back());
+        if(!record(curFitness, curSolution.data()))
+            return false;
+    }
+
+    return true;
+}
+
+void LocalSearch::optimizeSequential() {
+    prepare(work);
+
+    // Count evaluations against the budget
+    auto allow = [&](long long count) {
+        if(!budgetAllows(count))
+            return false;
+
+        evaluations += count;
+        return true;
+    };
+
+    // Record best found fitness and solution
+    auto record = [&](double curFitness, const double* curSolution) {
+        trace.record(curFitness, curSolution);
+        return !shouldStop();
+    };
+
+    // Restart until the iteration limit or a stopping criterion is reached
+    for(int i = 0; i < maxIterations; i++) {
+        if(!descend(solutionBuilder, work, allow, record))
+            break;
     }
 }
 
+void LocalSearch::optimizeParallel() {
+    const std::size_t restarts = std::max(maxIterations, 0);
+
+    // Fitness after every step of each restart, filled in by the workers
+    std::vector<std::vector<double>> traces(restarts);
+    std::vector<char> finished(restarts, 0);
+    std::mutex mutex;
+    std::condition_variable ready;
+
+    std::atomic<std::size_t> next(0);
+    std::atomic<bool> stop(false);
+    std::vector<instrumentation::Metrics> workerMetrics(threads);
+
+    auto elapsed = [&]() {
+        return std::chrono::duration<double>(std::chrono::steady_clock::now() - runStart).count();
+    };
+
+    auto worker = [&](int w) {
+        instrumentation::reset();
 
+        Workspace workspace;
+        prepare(workspace);
+
+        for(std::size_t r = next++; r < restarts && !stop; r = next++) {
+            SolutionBuilder builder = solutionBuilder.substream(r);
+            std::vector<double> steps;
+            long long used = 0;
+
+            // A restart alone may not exceed the budget; the merge applies it across restarts
+            auto allow = [&](long long count) {
+                if(stop.load(std::memory_order_relaxed))
+                    return false;
+                if(stopping.maxEvaluations > 0 && used + count > stopping.maxEvaluations)
+                    return false;
+
+                used += count;
+                return true;
+            };
+
+            // Steps past the target or time limit are never merged
+            auto record = [&](double curFitness, const double*) {
+                steps.push_back(curFitness);
+                return curFitness > stopping.targetFitness && (stopping.timeLimit <= 0.0 || elapsed() < stopping.timeLimit);
+            };
+
+            descend(builder, workspace, allow, record);
+
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                traces[r] = std::move(steps);
+                finished[r] = 1;
+            }
+            ready.notify_all();
+        }
+
+        workerMetrics[w] = instrumentation::current();
+    };
+
+    // Merge a restart into the results as a sequential run would have
+    auto merge = [&](const std::vector<double>& steps) {
+        if(!budgetAllows(1))
+            return false;
+        evaluations++;
+
+        for(double curFitness : steps) {
+            if(!budgetAllows(numNeighbors))
+                return false;
+            evaluations += numNeighbors;
+
+            // Solutions of parallel restarts are not kept
+            trace.record(curFitness);
+
+            if(shouldStop())
+                return false;
+        }
+
+        return true;
+    };
+
+    std::vector<std::thread> pool;
+    pool.reserve(threads);
+
+    for(int w = 0; w < threads; w++)
+        pool.emplace_back(worker, w);
+
+    // Merge restarts in order as they finish; later restarts are abandoned once the run stops
+    for(std::size_t r = 0; r < restarts && !stop; r++) {
+        std::vector<double> steps;
+
+        {
+            std::unique_lock<std::mutex> lock(mutex);
+            ready.wait(lock, [&]() { return finished[r] != 0; });
+            steps = std::move(traces[r]);
+        }
+
+        if(!merge(steps))
+            stop = true;
+    }
+
+    stop = true;
+
+    for(std::thread& thread : pool)
+        thread.join();
+
+    for(const instrumentation::Metrics& metrics : workerMetrics)
+        instrumentation::merge(metrics);
+}
 
 double LocalSearch::optimize() {
     // Start timing
     using clock = std::chrono::high_resolution_clock;
     auto start = clock::now();
+    beginRun();
+
+    if(threads > 0)
+        optimizeParallel();
+    else
+        optimizeSequential();
 
-    for(int i = 0; i < maxIterations; i++)
-        localSearch();
+    endRun();
 
     return std::chrono::duration<double>(clock::now() - start).count();
-}
\ No newline at end of file
+}
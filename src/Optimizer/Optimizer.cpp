@@ -0,0 +1,95 @@
+#include "Optimizer/Optimizer.h"
+
+#include <algorithm>
+
+
+void Optimizer::beginRun(std::size_t expected) {
+    // The stagnation criterion looks back stagnationWindow iterations
+    trace.begin(solutionBuilder.getDimensions(), std::max(stopping.stagnationWindow, 0) + 1, expected);
+
+    evaluations = 0;
+    stopReason = StopReason::Iterations;
+    runStart = std::chrono::steady_clock::now();
+
+    nextProgressCheck = 1;
+    progressStride = 1;
+    lastProgress = lastProgressCheck = runStart;
+}
+
+void Optimizer::reportProgress(std::size_t iterations) {
+    const auto now = std::chrono::steady_clock::now();
+    const double sinceCheck = std::chrono::duration<double>(now - lastProgressCheck).count();
+
+    // Read the clock a few times per interval, however long an iteration takes
+    if(sinceCheck < progressInterval / 16)
+        progressStride *= 2;
+    else if(sinceCheck > progressInterval / 4 && progressStride > 1)
+        progressStride /= 2;
+
+    lastProgressCheck = now;
+    nextProgressCheck = iterations + progressStride;
+
+    if(std::chrono::duration<double>(now - lastProgress).count() >= progressInterval) {
+        lastProgress = now;
+        progress(evaluations, iterations, trace.best());
+    }
+}
+
+void Optimizer::evaluateBatch(const double* candidates, std::size_t count, double* fitness) {
+    problem.evaluateBatch(candidates, count, solutionBuilder.getDimensions(), fitness);
+    evaluations += count;
+}
+
+double Optimizer::evaluate(const std::vector<double>& solution) {
+    evaluations++;
+    return problem.evaluate(solution);
+}
+
+bool Optimizer::budgetAllows(long long count) {
+    if(stopping.maxEvaluations > 0 && evaluations + count > stopping.maxEvaluations) {
+        stopReason = StopReason::Evaluations;
+        return false;
+    }
+
+    return true;
+}
+
+bool Optimizer::shouldStop() {
+    const std::size_t iterations = trace.size();
+
+    if(iterations == 0)
+        return false;
+
+    if(progress && iterations >= nextProgressCheck)
+        reportProgress(iterations);
+
+    const double best = trace.best();
+
+    if(best <= stopping.targetFitness) {
+        stopReason = StopReason::Target;
+        return true;
+    }
+
+    // Improvement of the best fitness over the last stagnationWindow iterations
+    const std::size_t window = stopping.stagnationWindow;
+    if(window > 0 && iterations > window && trace.ago(window) - best <= stopping.stagnationTolerance) {
+        stopReason = StopReason::Stagnation;
+        return true;
+    }
+
+    if(stopping.maxEvaluations > 0 && evaluations >= stopping.maxEvaluations) {
+        stopReason = StopReason::Evaluations;
+        return true;
+    }
+
+    if(stopping.timeLimit > 0.0) {
+        std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - runStart;
+
+        if(elapsed.count() >= stopping.timeLimit) {
+            stopReason = StopReason::Time;
+            return true;
+        }
+    }
+
+    return false;
+}
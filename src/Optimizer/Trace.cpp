@@ -0,0 +1,95 @@
+#include "Optimizer/Trace.h"
+
+#include <algorithm>
+#include <cmath>
+#include <stdexcept>
+
+
+void Trace::begin(std::size_t dimensions, std::size_t history, std::size_t expected) {
+    count = 0;
+    lastKept = 0;
+    bestFitness = std::numeric_limits<double>::infinity();
+
+    values.clear();
+    solutions.resize(0, dimensions);
+    bestSolution.clear();
+    recent.assign(std::max<std::size_t>(history, 1), bestFitness);
+
+    // Best and None retain nothing while running (iteration 0 is never reached)
+    if(policy.mode == TraceMode::Best || policy.mode == TraceMode::None)
+        nextCheckpoint = 0;
+    else if(policy.mode == TraceMode::Every)
+        nextCheckpoint = std::max(policy.interval, 1);
+    else
+        nextCheckpoint = 1;
+
+    streaming = policy.mode == TraceMode::Stream && !policy.file.empty();
+
+    if(streaming) {
+        stream.open(policy.file, std::ios::binary | std::ios::trunc);
+
+        if(!stream)
+            throw std::runtime_error("Cannot open trace file: " + policy.file);
+
+        values.reserve(STREAM_BLOCK);
+    } else if(policy.mode == TraceMode::Full) {
+        values.reserve(expected);
+    }
+}
+
+void Trace::keep() {
+    lastKept = count;
+    values.push_back(bestFitness);
+
+    if(streaming) {
+        if(values.size() == STREAM_BLOCK)
+            flush();
+    } else if(policy.solutions && !bestSolution.empty()) {
+        solutions.append(bestSolution.data());
+    }
+
+    // Schedule the next checkpoint
+    const std::size_t interval = std::max(policy.interval, 1);
+
+    switch(policy.mode) {
+        case TraceMode::Every:
+            nextCheckpoint += interval;
+            break;
+        case TraceMode::Log:
+            nextCheckpoint = std::max(
+                nextCheckpoint + 1,
+                static_cast<std::size_t>(std::ceil(nextCheckpoint * std::pow(2.0, 1.0 / interval)))
+            );
+            break;
+        case TraceMode::Full:
+        case TraceMode::Stream:
+            nextCheckpoint++;
+            break;
+        default:
+            nextCheckpoint = 0;
+    }
+}
+
+void Trace::flush() {
+    stream.write(reinterpret_cast<const char*>(values.data()), values.size() * sizeof(double));
+    values.clear();
+}
+
+void Trace::finish() {
+    const bool decimated = policy.mode == TraceMode::Every
+        || policy.mode == TraceMode::Log
+        || policy.mode == TraceMode::Best;
+
+    if(decimated && count > 0 && lastKept != count)
+        keep();
+
+    if(streaming) {
+        flush();
+        stream.close();
+        streaming = false;
+
+        // Only the final best solution of a streamed run is kept
+        if(policy.solutions && !bestSolution.empty())
+            solutions.append(bestSolution.data());
+    }
+}
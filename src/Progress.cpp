@@ -0,0 +1,82 @@
+#include "Progress.h"
+
+#include <cmath>
+
+#include <External/json.hpp>
+
+
+using json = nlohmann::json;
+
+namespace {
+
+// Fitness values that are not finite have no JSON representation
+json fitness(double value) {
+    return std::isfinite(value) ? json(value) : json(nullptr);
+}
+
+} // namespace
+
+
+bool ProgressStream::open(const std::string& path) {
+    out.open(path, std::ios::out | std::ios::trunc);
+    opened = std::chrono::steady_clock::now();
+
+    return out.is_open();
+}
+
+void ProgressStream::emit(const std::string& event, const std::string& fields) {
+    if(!out.is_open())
+        return;
+
+    const double time = std::chrono::duration<double>(std::chrono::steady_clock::now() - opened).count();
+
+    std::lock_guard<std::mutex> lock(mutex);
+    out << "{\"event\":\"" << event << "\",\"time\":" << json(time).dump();
+
+    if(!fields.empty())
+        out << "," << fields;
+
+    out << "}\n" << std::flush;
+}
+
+void ProgressStream::begin(int experiments, int jobs) {
+    emit("begin", "\"experiments\":" + std::to_string(experiments) + ",\"jobs\":" + std::to_string(jobs));
+}
+
+void ProgressStream::start(int index, const std::string& name) {
+    emit("start", "\"index\":" + std::to_string(index) + ",\"experiment\":" + json(name).dump());
+}
+
+void ProgressStream::update(int index, const std::string& name, long long evaluations, std::size_t iterations, double best) {
+    emit("progress",
+        "\"index\":" + std::to_string(index)
+        + ",\"experiment\":" + json(name).dump()
+        + ",\"evaluations\":" + std::to_string(evaluations)
+        + ",\"iterations\":" + std::to_string(iterations)
+        + ",\"best\":" + fitness(best).dump()
+    );
+}
+
+void ProgressStream::end(
+    int index,
+    const std::string& name,
+    long long evaluations,
+    std::size_t iterations,
+    double best,
+    double runtime,
+    StopReason stopReason
+) {
+    emit("end",
+        "\"index\":" + std::to_string(index)
+        + ",\"experiment\":" + json(name).dump()
+        + ",\"evaluations\":" + std::to_string(evaluations)
+        + ",\"iterations\":" + std::to_string(iterations)
+        + ",\"best\":" + fitness(best).dump()
+        + ",\"runtime\":" + json(runtime).dump()
+        + ",\"stop_reason\":\"" + stopReasonName(stopReason) + "\""
+    );
+}
+
+void ProgressStream::finish(int experiments) {
+    emit("finish", "\"experiments\":" + std::to_string(experiments));
+}
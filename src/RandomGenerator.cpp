@@ -0,0 +1,150 @@
+#include "RandomGenerator.h"
+
+#include <algorithm>
+#include <stdexcept>
+
+namespace {
+
+std::uint64_t rotl(std::uint64_t x, int k) {
+    return (x << k) | (x >> (64 - k));
+}
+
+std::uint64_t splitMix64(std::uint64_t& x) {
+    std::uint64_t z = (x += 0x9e3779b97f4a7c15ULL);
+    z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ULL;
+    z = (z ^ (z >> 27)) * 0x94d049bb133111ebULL;
+    return z ^ (z >> 31);
+}
+
+constexpr std::uint64_t PCG_MULTIPLIER = 6364136223846793005ULL;
+constexpr std::uint64_t PCG_STREAM = 54; // Stream of the PCG reference example
+
+} // namespace
+
+
+std::unique_ptr<RandomGenerator> RandomGenerator::create(const std::string& name, std::uint64_t seed) {
+    if(name == "mt19937")
+        return std::make_unique<MersenneGenerator>(seed);
+    if(name == "xoshiro256++")
+        return std::make_unique<Xoshiro256Generator>(seed);
+    if(name == "pcg32")
+        return std::make_unique<Pcg32Generator>(seed);
+
+    throw std::invalid_argument("Unknown random number generator: " + name);
+}
+
+std::uint64_t RandomGenerator::deriveSeed(std::uint64_t seed, std::uint64_t stream) {
+    std::uint64_t state = seed + stream * 0x9e3779b97f4a7c15ULL;
+    return splitMix64(state);
+}
+
+
+MersenneGenerator::MersenneGenerator(std::uint64_t seed) {
+    state[0] = static_cast<std::uint32_t>(seed);
+
+    for(int i = 1; i < N; i++)
+        state[i] = 1812433253U * (state[i - 1] ^ (state[i - 1] >> 30)) + i;
+}
+
+void MersenneGenerator::twist() {
+    auto next = [](std::uint32_t current, std::uint32_t following, std::uint32_t shifted) {
+        std::uint32_t y = (current & 0x80000000U) | (following & 0x7fffffffU);
+        return shifted ^ (y >> 1) ^ ((y & 1U) * 0x9908b0dfU);
+    };
+
+    int k = 0;
+    for(; k < N - M; k++)
+        state[k] = next(state[k], state[k + 1], state[k + M]);
+    for(; k < N - 1; k++)
+        state[k] = next(state[k], state[k + 1], state[k + M - N]);
+
+    state[N - 1] = next(state[N - 1], state[0], state[M - 1]);
+    index = 0;
+}
+
+void MersenneGenerator::fill(std::uint32_t* words, std::size_t count) {
+    while(count > 0) {
+        if(index == N)
+            twist();
+
+        // Temper as many words of the current state as requested at once
+        std::size_t available = std::min<std::size_t>(count, N - index);
+        const std::uint32_t* source = state + index;
+
+        for(std::size_t i = 0; i < available; i++) {
+            std::uint32_t y = source[i];
+            y ^= y >> 11;
+            y ^= (y << 7) & 0x9d2c5680U;
+            y ^= (y << 15) & 0xefc60000U;
+            y ^= y >> 18;
+            words[i] = y;
+        }
+
+        words += available;
+        count -= available;
+        index += available;
+    }
+}
+
+
+Xoshiro256Generator::Xoshiro256Generator(std::uint64_t seed) {
+    for(std::uint64_t& s : state)
+        s = splitMix64(seed);
+}
+
+void Xoshiro256Generator::fill(std::uint32_t* words, std::size_t count) {
+    // Local copy of the state lets the compiler keep it in registers
+    std::uint64_t s0 = state[0], s1 = state[1], s2 = state[2], s3 = state[3];
+
+    auto next = [&]() {
+        const std::uint64_t result = rotl(s0 + s3, 23) + s0;
+        const std::uint64_t t = s1 << 17;
+
+        s2 ^= s0;
+        s3 ^= s1;
+        s1 ^= s2;
+        s0 ^= s3;
+        s2 ^= t;
+        s3 = rotl(s3, 45);
+
+        return result;
+    };
+
+    // High half first; an odd count drops the low half of the last output
+    std::size_t i = 0;
+    for(; i + 1 < count; i += 2) {
+        const std::uint64_t result = next();
+        words[i] = static_cast<std::uint32_t>(result >> 32);
+        words[i + 1] = static_cast<std::uint32_t>(result);
+    }
+
+    if(i < count)
+        words[i] = static_cast<std::uint32_t>(next() >> 32);
+
+    state[0] = s0; state[1] = s1; state[2] = s2; state[3] = s3;
+}
+
+
+Pcg32Generator::Pcg32Generator(std::uint64_t seed)
+    : state(0),
+      increment((PCG_STREAM << 1) | 1)
+{
+    // Seeding procedure of pcg32_srandom_r
+    state = state * PCG_MULTIPLIER + increment;
+    state += seed;
+    state = state * PCG_MULTIPLIER + increment;
+}
+
+void Pcg32Generator::fill(std::uint32_t* words, std::size_t count) {
+    std::uint64_t s = state;
+
+    for(std::size_t i = 0; i < count; i++) {
+        const std::uint32_t xorshifted = static_cast<std::uint32_t>(((s >> 18) ^ s) >> 27);
+        const std::uint32_t rot = static_cast<std::uint32_t>(s >> 59);
+
+        words[i] = (xorshifted >> rot) | (xorshifted << ((32 - rot) & 31));
+        s = s * PCG_MULTIPLIER + increment;
+    }
+
+    state = s;
+}
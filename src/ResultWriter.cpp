@@ -0,0 +1,130 @@
+#include "ResultWriter.h"
+
+#include <algorithm>
+#include <cstdio>
+
+
+ResultWriter::ResultWriter(const std::string& outputDir, ResultFormat format)
+    : format(format)
+{
+    if(format == ResultFormat::Binary) {
+        fitnessOut.open(outputDir + "/" + std::string(bestFitnessesBinaryFile), std::ios::binary);
+        indexOut.open(outputDir + "/" + std::string(bestFitnessesIndexFile));
+
+        // Fixed-size header keeps the value block 8-byte aligned for memory mapping
+        char header[binaryHeaderSize] = {};
+        std::copy(binaryMagic.begin(), binaryMagic.end(), header);
+        fitnessOut.write(header, sizeof(header));
+        fitnessOut.flush();
+
+        indexOut << "experiment,offset,length\n";
+        indexOut.flush();
+    } else {
+        fitnessOut.open(outputDir + "/" + std::string(bestFitnessesFile));
+    }
+
+    if constexpr (instrumentation::enabled) {
+        metricsOut.open(outputDir + "/" + std::string(metricsFile));
+        metricsOut << ",Evaluations,Evaluation Time,Generation Time,Allocations,Allocated Bytes\n";
+        metricsOut.flush();
+    }
+
+    // Write column labels (top-left empty cell for row labels)
+    timesOut.open(outputDir + "/" + std::string(timesFile));
+    timesOut << ",Execution Time,Stop Reason\n";
+    timesOut.flush();
+}
+
+bool ResultWriter::isOpen() const {
+    return fitnessOut.is_open()
+        && timesOut.is_open()
+        && (format != ResultFormat::Binary || indexOut.is_open())
+        && (!instrumentation::enabled || metricsOut.is_open());
+}
+
+void ResultWriter::append(const Record& record) {
+    std::size_t length = 0;
+
+    // Append a block of convergence data to the current curve
+    auto writeValues = [&](const double* data, std::size_t count) {
+        if(format == ResultFormat::Binary) {
+            fitnessOut.write(reinterpret_cast<const char*>(data), count * sizeof(double));
+        } else {
+            for(size_t j = 0; j < count; ++j) {
+                if (length + j > 0) fitnessOut << ",";
+                fitnessOut << data[j];
+            }
+        }
+
+        length += count;
+    };
+
+    // Write convergence data first
+    if(format != ResultFormat::Binary)
+        fitnessOut << record.name << ",";
+
+    if(record.traceFile.empty()) {
+        writeValues(record.bestFitnesses.data(), record.bestFitnesses.size());
+    } else { // Copy a streamed trace without loading it whole
+        std::ifstream trace(record.traceFile, std::ios::binary);
+        std::vector<double> block(TRACE_BLOCK);
+
+        while(trace.read(reinterpret_cast<char*>(block.data()), block.size() * sizeof(double)) || trace.gcount() > 0)
+            writeValues(block.data(), trace.gcount() / sizeof(double));
+
+        trace.close();
+        std::remove(record.traceFile.c_str());
+    }
+
+    if(format == ResultFormat::Binary) {
+        fitnessOut.flush();
+
+        indexOut << record.name << "," << valueOffset << "," << length << "\n";
+        indexOut.flush();
+        valueOffset += length;
+    } else {
+        fitnessOut << "\n";
+        fitnessOut.flush();
+    }
+
+    if constexpr (instrumentation::enabled) {
+        const instrumentation::Metrics& m = record.metrics;
+
+        metricsOut << record.name << "," << m.evaluations << "," << m.evaluationSeconds << ","
+                   << m.generationSeconds << "," << m.allocations << "," << m.allocatedBytes << "\n";
+        metricsOut.flush();
+    }
+
+    // Time row marks the record as complete
+    timesOut << record.name << "," << record.runtime << "," << stopReasonName(record.stopReason) << "\n";
+    timesOut.flush();
+}
+
+void ResultWriter::acquire(std::size_t index, std::size_t window) {
+    std::unique_lock<std::mutex> lock(mutex);
+    advanced.wait(lock, [&]() { return index < nextIndex + window; });
+}
+
+void ResultWriter::write(
+    std::size_t index,
+    const std::string& name,
+    std::vector<double>&& bestFitnesses,
+    double runtime,
+    StopReason stopReason,
+    const instrumentation::Metrics& metrics,
+    const std::string& traceFile
+) {
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        pending.emplace(index, Record{name, std::move(bestFitnesses), traceFile, runtime, stopReason, metrics});
+
+        // Write every record that is now next in order
+        for(auto it = pending.begin(); it != pending.end() && it->first == nextIndex; it = pending.erase(it)) {
+            append(it->second);
+            nextIndex++;
+        }
+    }
+
+    // Workers waiting in acquire() may now be within the window
+    advanced.notify_all();
+}
@@ -3,7 +3,10 @@
 #include <iostream>
 #include <fstream>
 #include <memory> 
-#include <optional>
+#include <sstream>
+#include <thread>
+#include <atomic>
+#include <algorithm>
 
 #include <External/json.hpp>
 
@@ -31,179 +34,117 @@ bool RunExperiments::loadConfig(const std::string& inputFile) {
     json j;
     file >> j;
 
-    // Ensure experiments exist
-    if(!j.contains("experiments") || !j["experiments"].is_array()) {
-        std::cerr << "JSON does not contain 'experiments' array.\n";
+    // Experiments are expanded from the sweep as they are run
+    try {
+        this->sweep = Sweep(j);
+    } catch(const std::invalid_argument& e) {
+        std::cerr << e.what() << "\n";
         return false;
     }
 
-    std::vector<ExperimentConfig> experiments; // Stores experiment configs
-
-    for(const auto& item : j["experiments"]) {
-        ExperimentConfig cfg;
-
-        // Basic fields
-        cfg.experimentName = item.value("experiment_name", "");
-        cfg.problemType = item.value("problem_type", 0);
-        cfg.dimensions = item.value("dimensions", 0);
-        cfg.lower = item.value("lower_bound", 0.0);
-        cfg.upper = item.value("upper_bound", 0.0);
-        cfg.seed = item.value("seed", 1);
-
-        // Optimizer fields
-        if (item.contains("optimizer") && item["optimizer"].is_object()) {
-            const auto& opt = item["optimizer"];
-            cfg.optimizer = opt.value("type", "");
-            cfg.maxIterations = opt.value("iterations", 1);
-            cfg.neighborDelta = opt.value("delta", 0.0);
-            cfg.numNeighbors = opt.value("num_neighbors", 0);
-        } else { // No optimizer provided
-            cfg.optimizer = "";
-            cfg.maxIterations = 0;
-            cfg.neighborDelta = 0.0;
-            cfg.numNeighbors = 0;
-        }
-
-        experiments.push_back(cfg);
-
-        debug::log(
-            "\n\nExperiment Config Created for ",
-            cfg.experimentName, "\t(", cfg.problemType, ")",
-            "\n Range: [", cfg.lower, ", ", cfg.upper, "]",
-            "\nDimensions: ", cfg.dimensions,
-            "\nSeed: ", cfg.seed,
-            "\nOptimizer: ", cfg.optimizer, 
-            "\nIterations: ", cfg.maxIterations,
-            "\nNeighbors/Max Delta: ", cfg.numNeighbors,
-            ", ", cfg.neighborDelta
-        );
-    }
-
-    // Store loaded configs as field
-    this->configs = experiments;
-
     return true;
 }
-/*
-bool RunExperiments::runExperiment(ExperimentConfig& config) {
+
+double RunExperiments::runExperiment(int index, ExperimentConfig& config, std::vector<double>& bestFitnesses, StopReason& stopReason) {
+    debug::log("\nRunning Experiment:\t", config.experimentName);
+    progress.start(index, config.experimentName);
+
     // Perform experiment setup
     std::unique_ptr<Problem> problem = ProblemFactory::create(config.problemType);
-    SolutionBuilder builder(config.dimensions, config.upper, config.lower, config.seed);
+    SolutionBuilder builder(config.dimensions, config.lower, config.upper, config.seed, config.generator);
     std::unique_ptr<Optimizer> optimizer = OptimizerFactory::initOptimizer(*problem, config, builder);
 
-    // Perform experiment
-    double execTime = optimizer->optimize();
-    
-    writeResults(
+    if(progress.isOpen()) {
+        optimizer->setProgress([&](long long evaluations, std::size_t iterations, double best) {
+            progress.update(index, config.experimentName, evaluations, iterations, best);
+        }, PROGRESS_INTERVAL);
+    }
 
-        optimizer->getBestSolution(),
-        optimizer->getBestFitnesses(),
-        optimizer->getSolutions()
+    // Perform experiment
+    double runtime = optimizer->optimize();
+    double bestFitness = optimizer->getBestFitness();
+    bestFitnesses = std::move(optimizer->getBestFitnesses());
+    stopReason = optimizer->getStopReason();
+
+    progress.end(
+        index, config.experimentName,
+        optimizer->getEvaluations(), optimizer->getIterations(),
+        bestFitness, runtime, stopReason
     );
-}
-*/
-
-bool writeCSV(
-    const std::string& filename,
-    const std::vector<std::vector<double>>& data,
-    const std::optional<std::vector<std::string>>& rowLabels = std::nullopt,
-    const std::optional<std::vector<std::string>>& colLabels = std::nullopt
-) {
-    std::ofstream file(filename); // Open file to write
-    
-    if(!file.is_open()) // Error opening file
-        return false;
 
-    // Write column labels
-    if(colLabels) {
-        if(rowLabels) // top-left empty cell if row and col labels
-            file << ","; 
-        
-        // Write all labels
-        for(size_t j = 0; j < colLabels->size(); ++j) {
-            if (j > 0) file << ",";
-            file << (*colLabels)[j];
-        }
-        
-        file << "\n";
-    }
+    // Display best found fitness and runtime for experiment
+    std::ostringstream message;
+    message << "\nFitness of " << bestFitness << " found for experiment " << config.experimentName << " in " << runtime << " seconds.";
 
-    // Write data rows
-    for (size_t i = 0; i < data.size(); ++i) {
-        if(rowLabels)
-            file << (*rowLabels)[i] << ",";
-
-        for(size_t j = 0; j < data[i].size(); ++j) {
-            if (j > 0) file << ",";
-            file << data[i][j];
-        }
+    if(stopReason != StopReason::Iterations)
+        message << " Stopped early (" << stopReasonName(stopReason) << ").";
 
-        file << "\n";
+    {
+        std::lock_guard<std::mutex> lock(outputMutex);
+        std::cout << message.str();
     }
 
-    return true;
+    return runtime;
 }
 
+int RunExperiments::runExperiments(int jobs) {
+    int numExperiments = sweep.size();
 
-std::vector<std::string> RunExperiments::getNames(std::vector<ExperimentConfig> configs) {
-    std::vector<std::string> names(configs.size());
+    // Open result files up front; each experiment is appended as it finishes
+    ResultWriter writer(outputFile, format);
 
-    for(size_t i = 0; i < configs.size(); i++) {
-        names[i] = configs[i].experimentName;
+    if(!writer.isOpen()) {
+        std::cerr << "Cannot open result files in: " << outputFile << "\n";
+        return 0;
     }
 
-    return names;
-}
-
-
-
-int RunExperiments::runExperiments() {
-    int numExperiments = configs.size();
-
-    // Create vectors to store all experiment results
-    std::vector<double> runtimes(numExperiments);
-    std::vector<std::vector<double>> fitnessResults(numExperiments);
-
-    for(int i = 0; i < numExperiments; i++) {
-        debug::log("\nRunning Experiment:\t", configs[i].experimentName);
-        ExperimentConfig& config = configs[i];
-
-        // Perform experiment setup
-        std::unique_ptr<Problem> problem = ProblemFactory::create(config.problemType);
-        SolutionBuilder builder(config.dimensions, config.upper, config.lower, config.seed);
-        std::unique_ptr<Optimizer> optimizer = OptimizerFactory::initOptimizer(*problem, config, builder);
-
-        // Perform experiment
-        runtimes[i] = optimizer->optimize();
-        fitnessResults[i] = optimizer->getBestFitnesses();
+    // Run a single experiment and hand its results to the writer
+    auto run = [&](int i) {
+        ExperimentConfig config = sweep.at(i);
+        instrumentation::reset();
+
+        // Streamed traces are kept beside the results until their record is written
+        if(config.trace == "stream")
+            config.traceFile = outputFile + "/" + config.experimentName + ".trace";
+
+        std::vector<double> bestFitnesses;
+        StopReason stopReason;
+        double runtime = runExperiment(i, config, bestFitnesses, stopReason);
+        instrumentation::Metrics metrics = instrumentation::current();
+
+        writer.write(i, config.experimentName, std::move(bestFitnesses), runtime, stopReason, metrics, config.traceFile);
+    };
+
+    // Resolve worker count (0 = one per hardware thread)
+    if(jobs <= 0)
+        jobs = std::max(1u, std::thread::hardware_concurrency());
+    jobs = std::min(jobs, std::max(numExperiments, 1));
+    progress.begin(numExperiments, jobs);
+
+    if(jobs == 1) { // Serial execution
+        for(int i = 0; i < numExperiments; i++)
+            run(i);
+    } else { // Worker pool pulling experiment indices from a shared counter
+        std::atomic<int> next(0);
+        std::vector<std::thread> workers;
+        workers.reserve(jobs);
+
+        // Workers stay within a window of the oldest unwritten experiment, bounding held-back results
+        const std::size_t window = static_cast<std::size_t>(jobs) * REORDER_WINDOW_PER_JOB;
+
+        for(int w = 0; w < jobs; w++) {
+            workers.emplace_back([&]() {
+                for(int i = next++; i < numExperiments; i = next++) {
+                    writer.acquire(i, window);
+                    run(i);
+                }
+            });
+        }
 
-        // Display best found fitness and runtime for experiment
-        std::cout << "\nFitness of " << optimizer->getBestFitness() << " found for experiment " << config.experimentName << " in " << runtimes[i] << " seconds."; 
+        for(std::thread& worker : workers)
+            worker.join();
     }
 
-    std::vector<std::string> experimentNames = getNames(configs);
-    std::string bestFitnessesPath = outputFile + "/" + std::string(bestFitnessesFile);
-    std::string timesPath = outputFile + "/" + std::string(timesFile);
-    std::vector<std::vector<double>> timeWriteCSV(runtimes.size());
-
-    // Convert runtimes to csv-friendly format
-    for(size_t i = 0; i < runtimes.size(); i++)
-        timeWriteCSV[i] = { runtimes[i] };
-
-    // Write fitness data to csv
-    writeCSV(
-        bestFitnessesPath,
-        fitnessResults,
-        experimentNames
-    );
-
-    // Write time data to csv
-    writeCSV(
-        timesPath,
-        timeWriteCSV,
-        experimentNames,
-        std::vector<std::string>(1, "Execution Time")
-    );
-
+    progress.finish(numExperiments);
     return numExperiments;
-}
\ No newline at end of file
+}
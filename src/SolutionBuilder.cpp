@@ -1,14 +1,37 @@
 #include "SolutionBuilder.h"
 
+#include <algorithm>
 
-std::vector<double> SolutionBuilder::getRand() {
-    std::vector<double> solution(dimensions);
 
-    // Generate random solutions
-    for(int i = 0; i < dimensions; i++) {{
-            solution[i] = lower + (upper - lower) * mt.genrand_real1(); 
-        }
+void SolutionBuilder::uniforms(double* values, std::size_t count) {
+    while(count > 0) {
+        if(position == BUFFER_WORDS)
+            refill();
+
+        // Convert as many buffered words as are available at once
+        std::size_t available = std::min(count, BUFFER_WORDS - position);
+        const std::uint32_t* words = buffer.data() + position;
+
+        for(std::size_t i = 0; i < available; i++)
+            values[i] = words[i] * (1.0 / 4294967295.0);
+
+        values += available;
+        count -= available;
+        position += available;
     }
+}
+
+void SolutionBuilder::getRand(double* solution) {
+    // Generate random solutions
+    uniforms(solution, dimensions);
+
+    for(int i = 0; i < dimensions; i++)
+        solution[i] = lower + (upper - lower) * solution[i]; 
+}
+
+std::vector<double> SolutionBuilder::getRand() {
+    std::vector<double> solution(dimensions);
+    getRand(solution.data());
     
     return solution;
 }
@@ -22,52 +45,64 @@ double SolutionBuilder::checkBounds(double value) {
     return value;
 }
 
-std::vector<std::vector<double>> SolutionBuilder::getNeighbors(
-    const std::vector<double>& center,
+void SolutionBuilder::getNeighbors(
+    const double* center,
     int numNeighbors,
-    double maxDelta
+    double maxDelta,
+    double* neighbors
 ) {
-    std::vector<std::vector<double>> solutions(numNeighbors, std::vector<double>(dimensions));
+    // Draw every coordinate's step in one pass, then offset them from the center
+    uniforms(neighbors, static_cast<std::size_t>(numNeighbors) * dimensions);
 
-    // Randomly generate neighbors within maxDelta for each dimension
     for(int i = 0; i < numNeighbors; i++) {
+        double* neighbor = neighbors + static_cast<std::size_t>(i) * dimensions;
+
         for(int j = 0; j < dimensions; j++) {
             // Increment randomly within maxDelta range
-            double delta = (2.0 * mt.genrand_real1() - 1) * maxDelta;
-            solutions[i][j] = checkBounds(center[j] + delta);
+            double delta = (2.0 * neighbor[j] - 1) * maxDelta;
+            neighbor[j] = checkBounds(center[j] + delta);
         }
     }
+}
 
-    
-    return solutions;
+void SolutionBuilder::getNeighbors(
+    const double* center,
+    int numNeighbors,
+    double maxDelta,
+    Population& neighbors
+) {
+    neighbors.resize(numNeighbors, dimensions);
+    getNeighbors(center, numNeighbors, maxDelta, neighbors.data());
 }
 
-std::vector<std::vector<double>> SolutionBuilder::getSubset(
-    const std::vector<std::vector<double>>& population,
+void SolutionBuilder::getRand(Population& population) {
+    // Rows are contiguous, so the whole population is drawn in one pass
+    double* values = population.data();
+    std::size_t count = population.size() * population.getDimensions();
+
+    uniforms(values, count);
+
+    for(std::size_t i = 0; i < count; i++)
+        values[i] = lower + (upper - lower) * values[i];
+}
+
+void SolutionBuilder::getSubset(
+    int populationSize,
     int subsetSize,
-    int source
+    int source,
+    int* subset
 ) {
-    std::vector<std::vector<double>> subset(subsetSize);
-
-    // Create index array 
-    std::vector<int> indices(population.size() - 1);
-    int idx = 0;
-    for (int i = 0; i < population.size(); ++i) {
-        if (i != source) {
-            indices[idx] = i;
-            ++idx;
-        }
+    // Candidate indices, excluding the source (reuses the buffer's storage)
+    indices.resize(populationSize - 1);
+    for(int i = 0, idx = 0; i < populationSize; i++) {
+        if(i != source)
+            indices[idx++] = i;
     }
-        
 
     // Partial Fisher-Yates shuffle
-    for (int i = 0; i < subsetSize; ++i) {
-        int j = i + (mt.genrand_int32() % (indices.size() - i));
+    for(int i = 0; i < subsetSize; i++) {
+        int j = i + nextWord() % (indices.size() - i);
         std::swap(indices[i], indices[j]);
+        subset[i] = indices[i];
     }
-
-    for(int i = 0; i < subsetSize; ++i)
-        subset[i] = population[indices[i]];
-
-    return subset;
 }
@@ -0,0 +1,76 @@
+#include "Sweep.h"
+
+#include <stdexcept>
+
+#include "ConfigParser.h"
+#include "RandomGenerator.h"
+
+
+Sweep::Sweep(const nlohmann::json& config) {
+    if(config.contains("sweep") && config["sweep"].is_object()) {
+        const auto& sweep = config["sweep"];
+
+        templates = sweep.value("templates", nlohmann::json::array());
+        optimizers = sweep.value("optimizers", nlohmann::json::array());
+        dimensions = sweep.value("dimensions", std::vector<int>());
+        generator = sweep.value("generator", RandomGenerator::DEFAULT);
+
+        const auto& seeds = sweep.value("seeds", nlohmann::json::object());
+        seedBegin = seeds.value("begin", 1LL);
+        seedStep = seeds.value("step", 0LL);
+        seedCount = seeds.value("count", std::size_t(1));
+
+        total = templates.size() * dimensions.size() * optimizers.size() * seedCount;
+        isSweep = true;
+    } else if(config.contains("experiments") && config["experiments"].is_array()) {
+        experiments = config["experiments"];
+        total = experiments.size();
+    } else {
+        throw std::invalid_argument("JSON contains neither an 'experiments' array nor a 'sweep' object");
+    }
+
+    if(config.contains("select")) {
+        start = config["select"].value("start", std::size_t(0));
+        step = config["select"].value("step", std::size_t(1));
+
+        if(step == 0)
+            throw std::invalid_argument("Selection step must be positive");
+    }
+}
+
+std::size_t Sweep::size() const {
+    return start < total ? (total - start + step - 1) / step : 0;
+}
+
+nlohmann::json Sweep::expand(std::size_t index) const {
+    // Decompose the index, seeds varying fastest
+    std::size_t seed = index % seedCount;
+    index /= seedCount;
+    std::size_t optimizer = index % optimizers.size();
+    index /= optimizers.size();
+    std::size_t dimension = index % dimensions.size();
+    const auto& experimentTemplate = templates[index / dimensions.size()];
+
+    nlohmann::json item = experimentTemplate;
+    item["dimensions"] = dimensions[dimension];
+    item["seed"] = seedBegin + static_cast<long long>(seed) * seedStep;
+    item["generator"] = generator;
+    item["optimizer"] = optimizers[optimizer];
+
+    // Same naming as the Python Experiment model
+    item["experiment_name"] = experimentTemplate.value("template_name", "")
+        + "_" + optimizers[optimizer].value("name", "")
+        + "_dim" + std::to_string(dimensions[dimension])
+        + "_seed" + std::to_string(item["seed"].get<long long>());
+
+    return item;
+}
+
+ExperimentConfig Sweep::at(std::size_t index) const {
+    std::size_t position = start + index * step;
+
+    if(isSweep)
+        return parseExperimentConfig(expand(position));
+
+    return parseExperimentConfig(experiments[position]);
+}
@@ -7,15 +7,19 @@
  * environment, and hands off execution to the RunExperiments controller.
  * * @section usage_sec Usage
  * @code
- * ./optimization_benchmarks <config_path> <output_path>
+ * ./optimization_benchmarks <config_path> <output_path> [--jobs N] [--format csv|binary] [--progress PATH]
  * @endcode
  * * @param argc Argument count.
- * @param argv Argument vector. Expects [1] config path and [2] output path.
+ * @param argv Argument vector. Expects [1] config path and [2] output path,
+ *             optionally followed by `--jobs N` (worker threads, 0 = all cores)
+ *             `--format csv|binary` (convergence data storage format) and
+ *             `--progress PATH` (file or pipe receiving JSON progress events).
  * @return int Status code (0 for success, 1 for error).
  */
 
 
 #include <iostream>
+#include <string>
 #include <string.h>
 
 #include "RunExperiments.h"
@@ -30,8 +34,39 @@ int main(int argc, char* argv[]) {
         return 1;
     }
 
-    RunExperiments runner(argv[1], argv[2]);
-    runner.runExperiments();
+    int jobs = 1; // Serial execution by default
+    ResultFormat format = ResultFormat::CSV;
+    std::string progressPath;
+
+    // Parse optional flags
+    for(int i = 3; i < argc; i++) {
+        if(strcmp(argv[i], "--jobs") == 0 && i + 1 < argc) {
+            jobs = std::stoi(argv[++i]);
+        } else if(strcmp(argv[i], "--format") == 0 && i + 1 < argc) {
+            std::string name = argv[++i];
+
+            if(name == "binary")
+                format = ResultFormat::Binary;
+            else if(name != "csv") {
+                std::cerr << "Error, unknown result format: " << name << "\n";
+                return 1;
+            }
+        } else if(strcmp(argv[i], "--progress") == 0 && i + 1 < argc) {
+            progressPath = argv[++i];
+        } else {
+            std::cerr << "Error, unrecognized argument: " << argv[i] << "\n";
+            return 1;
+        }
+    }
+
+    RunExperiments runner(argv[1], argv[2], format);
+
+    if(!progressPath.empty() && !runner.openProgress(progressPath)) {
+        std::cerr << "Error, cannot open progress stream: " << progressPath << "\n";
+        return 1;
+    }
+
+    runner.runExperiments(jobs);
 
     return 0;
 }
\ No newline at end of file